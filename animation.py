@@ -0,0 +1,168 @@
+"""위젯 배경색 애니메이션: 하나의 프레임 시계로 색을 보간
+
+- 위젯마다 after 클로저를 걸지 않고, 애니메이션 중인 위젯만 모아 프레임마다 한 번씩 갱신한다.
+- 같은 위젯에 효과가 겹치면(hover 중 클릭 등) 새 효과가 지금 보이는 색에서 이어받으므로
+  한 프레임에 config(bg=...)는 위젯당 최대 한 번, 색이 바뀌지 않은 프레임은 건너뛴다.
+- 움직이는 위젯이 없으면 프레임 타임라인을 멈춰서 깨어나지 않는다.
+"""
+from collections import deque
+
+FRAME_MS = 16
+HOVER_IN = 0.08    # 초
+HOVER_OUT = 0.15
+FLASH_HOLD = 0.06
+FLASH_OUT = 0.12
+FLASH_COLOR = "#cccccc"  # active 색을 따로 주지 않은 위젯의 클릭 색
+
+
+class _Track:
+    __slots__ = ("widget", "rest", "hover", "active", "inside", "color", "applied", "segments", "origin", "since")
+
+    def __init__(self, widget, rest):
+        self.widget = widget
+        self.rest = rest      # 평소 색 (테마가 바뀌면 set_rest로 갱신)
+        self.hover = None     # None이면 평소 색 그대로
+        self.active = None    # None이면 FLASH_COLOR
+        self.inside = False
+        self.color = None     # 지금 보이는 색 (r, g, b)
+        self.applied = None   # 마지막으로 config 한 색 문자열
+        self.segments = deque()  # (목표 색, 걸리는 시간) - 현재 구간이 맨 앞
+        self.origin = None    # 현재 구간의 시작 색
+        self.since = 0.0      # 현재 구간의 시작 시각 (스케줄러 시계)
+
+    def resting_color(self):
+        return self.hover if self.inside and self.hover else self.rest
+
+
+class Animator:
+    def __init__(self, ticks, frame_ms=FRAME_MS):
+        self.ticks = ticks
+        self.frame = ticks.add("animation", frame_ms / 1000, self._frame, start=False)
+        self.tracks = {}   # 위젯 -> _Track
+        self.moving = {}   # 애니메이션 중인 위젯 -> _Track (삽입 순서 유지)
+        self._rgb = {}     # 색 문자열 -> (r, g, b)
+        self.frames = 0
+        self.configs = 0
+
+    # --- 등록 ---
+    def register(self, widget, hover=None, active=None):
+        """hover / 클릭 효과 연결 (같은 위젯을 다시 등록하면 색 설정만 합침)"""
+        track = self.tracks.get(widget)
+        if track is None:
+            track = self.tracks[widget] = _Track(widget, widget.cget("bg"))
+            widget.bind("<Enter>", lambda e: self.on_enter(track), add="+")
+            widget.bind("<Leave>", lambda e: self.on_leave(track), add="+")
+            widget.bind("<Button-1>", lambda e: self.on_click(track), add="+")
+        if hover is not None:
+            track.hover = hover
+        if active is not None:
+            track.active = active
+        return track
+
+    def set_rest(self, widget, color):
+        """평소 색 변경 (테마 변경) - 진행 중인 효과는 끊고 바로 반영"""
+        track = self.tracks.get(widget)
+        if track is None:
+            widget.config(bg=color)
+            return
+        track.rest = color
+        track.segments.clear()
+        self.moving.pop(widget, None)
+        self._apply(track, track.resting_color())
+
+    def forget(self, toplevel):
+        """창을 닫기 전에 그 창에 속한 위젯들 등록 해제"""
+        prefix = str(toplevel)
+        for widget in [w for w in self.tracks if str(w) == prefix or str(w).startswith(prefix + ".")]:
+            del self.tracks[widget]
+            self.moving.pop(widget, None)
+        if not self.moving and self.frame.running:
+            self.frame.stop()
+
+    # --- 효과 ---
+    def on_enter(self, track):
+        track.inside = True
+        if track.hover:
+            self.tween(track, [(track.hover, HOVER_IN)])
+
+    def on_leave(self, track):
+        track.inside = False
+        if track.hover or track.widget in self.moving:
+            self.tween(track, [(track.rest, HOVER_OUT)])
+
+    def on_click(self, track):
+        flash = track.active or FLASH_COLOR
+        self.tween(track, [(flash, 0.0), (flash, FLASH_HOLD), (track.resting_color(), FLASH_OUT)])
+
+    def tween(self, track, segments):
+        """지금 보이는 색에서 시작해 (색, 시간) 구간들을 차례로 진행 - 이전 효과는 대체"""
+        if track.color is None:
+            track.color = self.rgb(track.widget, track.applied or track.widget.cget("bg"))
+        track.segments = deque(segments)
+        track.origin = track.color
+        track.since = self.ticks.clock()
+        self.moving[track.widget] = track
+        # 첫 프레임(즉시 바뀌는 색)은 바로 적용해서 클릭 반응이 한 프레임 늦지 않게
+        self._advance(track, track.since)
+        if self.moving and not self.frame.running:
+            self.frame.start()
+
+    # --- 프레임 시계 ---
+    def _frame(self, late):
+        self.frames += 1
+        now = self.ticks.clock()
+        for track in list(self.moving.values()):
+            self._advance(track, now)
+        if not self.moving:
+            self.frame.stop()  # 움직이는 위젯이 없으면 잠듦
+
+    def _advance(self, track, now):
+        segments = track.segments
+        # 끝난 구간은 넘기고 (프레임이 늦었으면 다음 구간으로 이월)
+        while segments and now - track.since >= segments[0][1]:
+            target, duration = segments.popleft()
+            track.since += duration
+            track.origin = self.rgb(track.widget, target)
+        if not segments:
+            self.moving.pop(track.widget, None)
+            self._set(track, track.origin)
+            return
+        target, duration = segments[0]
+        end = self.rgb(track.widget, target)
+        t = (now - track.since) / duration
+        # ease-out: 처음에 빨리 바뀌고 끝에서 부드럽게 멈춤
+        t = 1 - (1 - t) * (1 - t)
+        start = track.origin
+        self._set(track, tuple(int(a + (b - a) * t + 0.5) for a, b in zip(start, end)))
+
+    def _set(self, track, rgb):
+        track.color = rgb
+        self._apply(track, "#%02x%02x%02x" % rgb)
+
+    def _apply(self, track, color):
+        if color == track.applied:
+            return  # 같은 색이면 Tk 호출 생략
+        try:
+            track.widget.config(bg=color)
+        except Exception:
+            # 파괴된 위젯
+            self.tracks.pop(track.widget, None)
+            self.moving.pop(track.widget, None)
+            return
+        track.applied = color
+        if color.startswith("#") and len(color) == 7:
+            track.color = self.rgb(track.widget, color)
+        else:
+            track.color = None
+        self.configs += 1
+
+    def rgb(self, widget, color):
+        cached = self._rgb.get(color)
+        if cached is None:
+            if color.startswith("#") and len(color) == 7:
+                cached = (int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16))
+            else:
+                # 색 이름 등은 Tk에게 물어봄 (16비트 값)
+                cached = tuple(v >> 8 for v in widget.winfo_rgb(color))
+            self._rgb[color] = cached
+        return cached
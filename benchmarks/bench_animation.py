@@ -0,0 +1,75 @@
+"""빠른 클릭/hover 중 애니메이션 프레임 시계의 Tk 호출 수와 유휴 시 깨어남
+
+사용법: python benchmarks/bench_animation.py [초당 클릭 수] [위젯 수]   (기본: 20 5)
+
+디스플레이 없이 tests/simloop.py 의 가상 루프 위에서 config 호출만 세는 가짜 위젯으로 돌린다.
+10초 동안 위젯들을 번갈아 hover + 클릭한 뒤 5초 쉬면서, 쉬는 동안 after 가 깨어나지 않는지 본다.
+(예전 방식은 클릭마다 위젯별 after 2번 + config 4번)
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))  # 가상 루프 (tests/simloop.py)
+
+import animation  # noqa: E402
+import ticksched  # noqa: E402
+from simloop import SimRoot  # noqa: E402
+
+
+class FakeWidget:
+    def __init__(self, bg):
+        self.bg = bg
+        self.handlers = {}
+        self.configs = 0
+
+    def cget(self, key):
+        return self.bg
+
+    def config(self, bg):
+        self.bg = bg
+        self.configs += 1
+
+    def bind(self, sequence, handler, add=None):
+        self.handlers.setdefault(sequence, []).append(handler)
+
+    def fire(self, sequence):
+        for handler in self.handlers.get(sequence, []):
+            handler(None)
+
+
+def main(rate, count):
+    root = SimRoot()
+    ticks = ticksched.TickScheduler(root, root.clock)
+    animator = animation.Animator(ticks)
+    widgets = [FakeWidget("#e3d8a3") for _ in range(count)]
+    for w in widgets:
+        # 예전 add_button_feedback + add_click_animation 을 같은 위젯에 둘 다 건 경우
+        animator.register(w, hover="#d6c89a", active="#c9bc8f")
+        animator.register(w)
+
+    clicks = 0
+    t = 0.0
+    while t < 10.0:
+        w = widgets[clicks % count]
+        root.run_until(t)
+        w.fire("<Enter>")
+        w.fire("<Button-1>")
+        clicks += 1
+        root.run_until(t + 0.5 / rate)
+        w.fire("<Leave>")
+        t += 1.0 / rate
+    root.run_until(10.5)
+    busy_wakeups = root.wakeups
+    root.run_until(15.5)
+    configs = sum(w.configs for w in widgets)
+    print(f"{clicks} clicks: {configs} config calls ({configs / clicks:.1f}/click), "
+          f"{animator.frames} frames, {busy_wakeups} after() wakeups")
+    print(f"idle 5 s: {root.wakeups - busy_wakeups} wakeups, frame clock running: {animator.frame.running}")
+    print(f"final colors: {sorted(set(w.bg for w in widgets))}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*(args + [20, 5][len(args):]))
@@ -0,0 +1,69 @@
+"""JSON으로 불러온 덱의 메모리 표현 비교 (tracemalloc): dict 목록 / __slots__ 레코드 / 열 형식(TermColumns)
+
+사용법: python benchmarks/bench_columns.py [용어 수]   (기본: 1000000)
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import termpack  # noqa: E402
+
+
+class SlotEntry:
+    __slots__ = ("term", "desc")
+
+    def __init__(self, term, desc):
+        self.term = sys.intern(term)
+        self.desc = desc
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+
+def entries(count):
+    # 용어 8~20자 + 설명 40~120자 (한글 섞임)
+    rng = random.Random(1)
+    for i in range(count):
+        yield f"용어{i}-" + "x" * rng.randint(2, 14), f"설명 {i} " + "가나다라 abc " * rng.randint(4, 12)
+
+
+BUILDERS = {
+    "dict list": lambda count: [{"term": term, "desc": desc} for term, desc in entries(count)],
+    "slots records": lambda count: [SlotEntry(term, desc) for term, desc in entries(count)],
+    "columns": lambda count: termpack.TermColumns.from_entries(entries(count)),
+}
+
+
+def measure(name, count):
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    terms = BUILDERS[name](count)
+    build = time.perf_counter() - t0
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rng = random.Random(2)
+    picks = [rng.randrange(count) for _ in range(100000)]
+    t0 = time.perf_counter()
+    for idx in picks:
+        terms[idx]['term']
+        terms[idx]['desc']
+    access = (time.perf_counter() - t0) / len(picks)
+    return current - base, peak - base, build, access
+
+
+def main(count):
+    print(f"{count:,} entries")
+    for name in BUILDERS:
+        used, peak, build, access = measure(name, count)
+        print(f"{name:<14} {used / 2**20:8.1f} MB ({used / count:6.1f} B/entry)  peak {peak / 2**20:8.1f} MB"
+              f"  build {build:6.2f} s  access {access * 1e6:5.2f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,46 @@
+"""설정 저장 스트레스: 설정 변경을 수천 번 연달아 호출했을 때 디스크 쓰기 횟수와 UI 스레드 소요 시간
+
+사용법: python benchmarks/bench_configstore.py [변경 횟수]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import configstore  # noqa: E402
+
+
+def main(n):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "config.json")
+        store = configstore.ConfigStore(path)
+        config = store.load({"theme_name": "Yellow", "interval_seconds": 10, "width": 600, "height": 300})
+
+        themes = ["Yellow", "Pink", "Green", "Blue"]
+        worst = 0.0
+        t0 = time.perf_counter()
+        for i in range(n):
+            # change_theme / change_interval / adjust_window_to_content 가 하는 일
+            s = time.perf_counter()
+            config["theme_name"] = themes[i % len(themes)]
+            config["interval_seconds"] = 5 + i % 12 * 5
+            config["width"] = 400 + i % 400
+            store.mark_dirty()
+            worst = max(worst, time.perf_counter() - s)
+        elapsed = time.perf_counter() - t0
+        writes_during = store.writes
+        store.close()
+
+        with open(path, encoding="utf-8") as f:
+            saved = json.load(f)
+        assert saved == config, "마지막 설정이 저장되지 않음"
+        print(f"setter calls      : {n}")
+        print(f"UI thread total   : {elapsed * 1000:.1f} ms ({elapsed / n * 1e6:.2f} us/call, worst {worst * 1e6:.1f} us)")
+        print(f"disk writes       : {writes_during} while hammering, {store.writes} after close")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,98 @@
+"""덱 검사(decklint): 100만 항목 덱 처리 시간 (작업자 1개 vs 프로세스 풀) + 심어 둔 문제를 찾는지
+
+사용법: python benchmarks/bench_decklint.py [항목 수]   (기본: 1000000)
+덱에는 거의 같은 항목("Cache" -> "Cache (캐시)" + 설명의 문장부호나 한 단어 차이, 약 2%), 깨진 항목,
+빈 설명, 너무 긴 설명을 섞는다. 거의 같은 쌍을 몇 개 찾았는지(재현율)와 잘못 묶은 수를 본다.
+"""
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import decklint  # noqa: E402
+
+SYLLABLES = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호구누두루무부수우주추"
+
+
+def make_deck(count):
+    """(항목 목록, 심어 둔 거의 같은 쌍, 깨진 수, 빈 설명 수, 긴 설명 수)"""
+    rng = random.Random(1)
+    words = ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(20000)]
+    latin = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9))) for _ in range(20000)]
+    mixed = words + latin
+    deck, pairs = [], []
+    broken = empty = long = 0
+    while len(deck) < count:
+        r = rng.random()
+        i = len(deck)
+        if r < 0.02 and i:
+            # 앞 항목의 변형: 용어에 번역 붙이기 / 설명 한 단어 바꾸기
+            j = rng.randrange(max(0, i - 50000), i)
+            src = deck[j]
+            if not isinstance(src, dict) or not isinstance(src.get("desc"), str) or len(src["desc"]) < 40:
+                continue
+            desc = src["desc"].split()
+            if rng.random() < 0.5:
+                desc[-1] += "."  # 문장부호만 다름
+            else:
+                desc[rng.randrange(len(desc))] = rng.choice(words)  # 한 단어 다름
+            deck.append({"term": src["term"] + f" ({rng.choice(words)})", "desc": " ".join(desc)})
+            pairs.append((j, i))
+            continue
+        term = rng.choice(latin).capitalize() + " " + rng.choice(latin)
+        if r < 0.021:
+            deck.append({"term": term} if rng.random() < 0.5 else {"desc": "용어 없음"})
+            broken += 1
+        elif r < 0.022:
+            deck.append({"term": term, "desc": ""})
+            empty += 1
+        elif r < 0.023:
+            deck.append({"term": term, "desc": " ".join(rng.choice(words) for _ in range(400))})
+            long += 1
+        else:
+            deck.append({"term": term, "desc": " ".join(rng.choice(mixed) for _ in range(rng.randint(6, 16)))})
+    return deck, pairs, broken, empty, long
+
+
+def main(count):
+    t0 = time.perf_counter()
+    deck, pairs, broken, empty, long = make_deck(count)
+    base = tempfile.mkdtemp()
+    try:
+        path = os.path.join(base, "deck.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(deck, f, ensure_ascii=False)
+        print(f"{count:,} entries ({os.path.getsize(path) / 2**20:.0f} MB), {len(pairs):,} planted near-duplicates, "
+              f"{broken:,} broken, {empty:,} empty, {long:,} long  (generated in {time.perf_counter() - t0:.0f} s)")
+
+        t0 = time.perf_counter()
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        print(f"json.load {time.perf_counter() - t0:6.2f} s")
+        for workers in (1, max(2, os.cpu_count() or 1)):
+            result = decklint.lint_deck(path, workers=workers, data=data)
+            counts = decklint.summary_counts(result)
+            print(f"workers {workers:<3} {result.seconds:6.2f} s  ({count / result.seconds:,.0f} entries/s)  "
+                  + ", ".join(f"{k} {v:,}" for k, v in counts.items()))
+
+        grouped = {}
+        for keep, others in result.groups:
+            for i in [keep] + [i for i, _ in others]:
+                grouped[i] = keep
+        found = sum(1 for a, b in pairs if a in grouped and grouped.get(a) == grouped.get(b))
+        planted = {i for pair in pairs for i in pair}
+        extra = sum(1 for i in grouped if i not in planted)
+        print(f"near-duplicate recall {found / max(1, len(pairs)):.1%} ({found:,}/{len(pairs):,}), "
+              f"grouped entries outside planted pairs {extra:,}")
+        assert counts["broken"] == broken and counts["empty_desc"] == empty and counts["long_desc"] >= long
+    finally:
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,62 @@
+"""덱 전환 비용: 처음 불러올 때(팩 컴파일 포함 / 팩 재사용)와 이미 불러온 덱으로 돌아갈 때
+
+사용법: python benchmarks/bench_decks.py [덱 수] [덱당 용어 수]   (기본: 5 20000)
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import decks  # noqa: E402
+import shuffle  # noqa: E402
+
+
+def write_decks(base, count, size):
+    os.makedirs(os.path.join(base, 'decks'))
+    for d in range(count):
+        path = os.path.join(base, 'terms.json') if d == 0 else os.path.join(base, 'decks', f'deck{d}.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump([{"term": f"용어{d}-{i}", "desc": f"설명 {i}"} for i in range(size)], f, ensure_ascii=False)
+
+
+def switch_all(lib, orders):
+    times = []
+    for name in lib.names():
+        t0 = time.perf_counter()
+        lib.pin([name])
+        terms = lib.get(name)
+        order = orders.get(name)
+        if order is None:
+            order = orders[name] = shuffle.LazyShuffle(len(terms))
+        terms[order.next()]
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def main(count, size):
+    base = tempfile.mkdtemp()
+    try:
+        write_decks(base, count, size)
+        for label in ("first load (compile)", "first load (pack)"):
+            lib = decks.DeckLibrary(base)
+            times = switch_all(lib, {})
+            print(f"{label:<22} max {max(times) * 1000:8.2f} ms")
+        orders = {}
+        switch_all(lib, orders)
+        times = []
+        for _ in range(200):
+            times += switch_all(lib, orders)
+        times.sort()
+        print(f"{'resident switch':<22} median {times[len(times) // 2] * 1e6:8.1f} us  max {times[-1] * 1e6:8.1f} us")
+        print(f"resident {len(lib.resident)} decks, ~{lib.memory_usage() / 2**20:.1f} MB")
+    finally:
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*(args + [5, 20000][len(args):]))
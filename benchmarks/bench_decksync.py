@@ -0,0 +1,198 @@
+"""덱 동기화(decksync): 동기화 한 번에 받는 바이트 - 파일 통째로 복사 vs gzip 전체 vs 304 vs 변경분
+
+사용법: python benchmarks/bench_decksync.py [항목 수]   (기본: 20000)
+
+http.server로 띄운 로컬 대역(DeckServer)이 버전별 용어 목록을 들고 ETag / gzip /
+since 변경분을 돌려준다. 매 단계 뒤 terms.json이 서버의 현재 버전과 같은지 확인한다.
+확인: 바뀐 것이 없으면 304, 1% 바뀌면 변경분만, 로컬에서 고친 파일은 전체를 다시 받음,
+서버 오류가 이어지면 지수 백오프 후 복구, 백그라운드 스레드로 돌 때 임시 파일이 남지 않음.
+"""
+import gzip
+import http.server
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import decksync  # noqa: E402
+
+SYLLABLES = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호구누두루무부수우주추"
+
+
+class DeckServer:
+    """로컬 대역 서버 - publish()로 새 버전을 올림"""
+
+    def __init__(self, entries):
+        self.versions = [entries]  # 버전 n의 목록 = versions[n - 1]
+        self.gzip = True
+        self.delta = True
+        self.fail = 0  # 남은 503 응답 수
+        self.httpd = None
+
+    @property
+    def version(self):
+        return len(self.versions)
+
+    @property
+    def current(self):
+        return self.versions[-1]
+
+    def publish(self, entries):
+        self.versions.append(entries)
+
+    def etag(self):
+        return f'"v{self.version}"'
+
+    def body_for(self, since):
+        if self.delta and since is not None and 1 <= since < self.version:
+            return decksync.make_delta(self.versions[since - 1], self.current, since, self.version)
+        return {"version": self.version, "terms": self.current}
+
+    def start(self):
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if server.fail:
+                    server.fail -= 1
+                    self.send_error(503)
+                    return
+                if self.headers.get("If-None-Match") == server.etag():
+                    self.send_response(304)
+                    self.send_header("ETag", server.etag())
+                    self.end_headers()
+                    return
+                query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+                since = int(query["since"][0]) if "since" in query else None
+                body = json.dumps(server.body_for(since), ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("ETag", server.etag())
+                if server.gzip and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}/terms"
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def make_entries(count, rng):
+    def text(n):
+        return " ".join("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(n))
+    return [{"term": f"Term {i} ({text(1)})", "desc": text(rng.randint(6, 16))} for i in range(count)]
+
+
+def edit(entries, rng, fraction):
+    """fraction 만큼 설명 바꾸기 + 그 1/5씩 추가/삭제"""
+    out = [dict(item) for item in entries]
+    n = max(1, int(len(out) * fraction))
+    for i in rng.sample(range(len(out)), n):
+        out[i]["desc"] += " (개정)"
+    for i in sorted(rng.sample(range(len(out)), n // 5), reverse=True):
+        del out[i]
+    out.extend({"term": f"New {rng.getrandbits(48):x}", "desc": "새로 추가된 용어"} for _ in range(n // 5))
+    return out
+
+
+def local_matches(path, server):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f) == server.current
+
+
+def step(label, sync, server, full_size):
+    result = sync.sync_once()
+    assert result.status != "error", label
+    assert local_matches(sync.deck_path, server), f"{label}: terms.json differs from server"
+    print(f"{label:<26} {result.status:<13} {result.received:>10,} bytes  ({result.received / full_size:7.2%} of a copy)"
+          f"  +{result.added} -{result.removed} ~{result.changed}  {result.seconds * 1000:6.0f} ms")
+    return result
+
+
+def main(count):
+    rng = random.Random(1)
+    server = DeckServer(make_entries(count, rng))
+    url = server.start()
+    base = tempfile.mkdtemp()
+    try:
+        path = os.path.join(base, "terms.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(decksync.deck_text(make_entries(10, rng)))  # 예전 파일
+        full_size = len(decksync.deck_text(server.current).encode("utf-8"))
+        print(f"{count:,} entries, terms.json copy {full_size:,} bytes")
+
+        sync = decksync.DeckSync(url, path, min_backoff=1, max_backoff=8, rng=random.Random(2))
+        step("first sync", sync, server, full_size)
+        assert step("unchanged", sync, server, full_size).status == "not-modified"
+
+        server.publish(edit(server.current, rng, 0.01))
+        assert step("1% changed", sync, server, full_size).status == "delta"
+        server.publish(edit(server.current, rng, 0.01))
+        server.publish(edit(server.current, rng, 0.01))
+        assert step("two versions behind", sync, server, full_size).status == "delta"
+
+        # 비교: 변경분 없이 / gzip 없이
+        server.delta = False
+        server.publish(edit(server.current, rng, 0.01))
+        step("1% changed, no delta", sync, server, full_size)
+        server.gzip = False
+        server.publish(edit(server.current, rng, 0.01))
+        step("1% changed, no gzip/delta", sync, server, full_size)
+        server.gzip = server.delta = True
+
+        # 로컬에서 고친 파일은 버전을 믿지 않고 전체를 받음
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(" ")
+        assert step("edited locally", sync, server, full_size).status == "full"
+
+        # 서버 오류 -> 지수 백오프 -> 복구
+        server.fail = 4
+        delays = []
+        for _ in range(4):
+            assert sync.sync_once().status == "error"
+            delays.append(sync.next_delay())
+        for k, delay in enumerate(delays):
+            assert min(8, 2 ** k) * 0.5 <= delay <= min(8, 2 ** k), delays
+        server.publish(edit(server.current, rng, 0.01))
+        step("after 4 errors", sync, server, full_size)
+        assert sync.failures == 0 and sync.next_delay() == sync.interval
+        print("backoff after errors: " + ", ".join(f"{d:.1f}" for d in delays) + " s")
+
+        # 백그라운드 스레드: 시작은 바로 반환, 새 버전이 올라오면 파일이 원자적으로 바뀜
+        background = decksync.DeckSync(url, path, interval=0.05)
+        server.publish(edit(server.current, rng, 0.01))
+        t0 = time.perf_counter()
+        background.start()
+        started = time.perf_counter() - t0
+        deadline = time.monotonic() + 30
+        while not local_matches(path, server):
+            assert time.monotonic() < deadline, "background sync did not finish"
+            time.sleep(0.05)
+        background.close()
+        assert not os.path.exists(path + ".tmp")
+        print(f"background: start() returned in {started * 1000:.2f} ms, "
+              f"{background.syncs} syncs, {background.total_received:,} bytes")
+    finally:
+        server.stop()
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
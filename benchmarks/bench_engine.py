@@ -0,0 +1,101 @@
+"""디스플레이 없이 엔진만 구동: 틱 / 리사이즈 / 테마 변경 처리량
+
+사용법: python benchmarks/bench_engine.py [용어 수] [반복 수]   (기본: 100000 20000)
+
+Tk 없이 engine.MarqueeEngine 을 임시 폴더에서 만들고,
+- 틱: 다음 용어 선택 + 미리 준비할 5개 조회 (셔플 / 복습 모드, 복습은 가상 시계로 하루 1분씩)
+- 리사이즈: 헤더/본문 글자 크기 계산 + 용어 레이아웃에서 창 크기 계산
+- 테마 변경: 설정 변경 + 지연 저장 표시
+를 반복해서 초당 처리 수와 p99 지연을 출력한다.
+CI의 회귀 추적은 같은 동작을 pytest-benchmark로 재는 tests/test_engine_perf.py.
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import engine  # noqa: E402
+import textmetrics  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def report(label, times):
+    times.sort()
+    total = sum(times)
+    print(f"{label:<14} {len(times) / total:>12,.0f} /s  "
+          f"median {times[len(times) // 2] * 1e6:7.1f} us  p99 {times[int(len(times) * 0.99)] * 1e6:7.1f} us")
+
+
+def bench_ticks(eng, clock, count):
+    times = []
+    for _ in range(count):
+        t0 = time.perf_counter()
+        eng.last_index = eng.next_term_index()
+        eng.upcoming_indices(5)
+        times.append(time.perf_counter() - t0)
+        clock.now += 60
+    return times
+
+
+def bench_resizes(eng, count):
+    layout = eng.layout
+    times = []
+    for i in range(count):
+        width = 300 + (i * 7) % 900
+        height = 150 + (i * 5) % 600
+        text = textmetrics.TextLayout(width - 150, 1 + i % 4, 30 + 20 * (i % 4))
+        t0 = time.perf_counter()
+        layout.header_for(height)
+        layout.font_size_for(width, 1.0 + (i % 5) * 0.1)
+        layout.window_for(text)
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def bench_themes(eng, count):
+    names = list(engine.THEMES)
+    times = []
+    for i in range(count):
+        t0 = time.perf_counter()
+        eng.set_theme(names[i % len(names)])
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def main(size, count):
+    base = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(base, 'terms.json'), 'w', encoding='utf-8') as f:
+            json.dump([{"term": f"용어{i}", "desc": f"설명 {i}"} for i in range(size)], f, ensure_ascii=False)
+        clock = FakeClock()
+        t0 = time.perf_counter()
+        eng = engine.MarqueeEngine(base, clock)
+        eng.load()
+        print(f"entries {size}: load {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+        report("tick", bench_ticks(eng, clock, count))
+        eng.set_srs(True)
+        report("tick (srs)", bench_ticks(eng, clock, count))
+        eng.set_srs(False)
+        report("resize", bench_resizes(eng, count))
+        report("theme", bench_themes(eng, count))
+        eng.close()
+        print(f"config writes: {eng.config_store.writes}")
+    finally:
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*(args + [100000, 20000][len(args):]))
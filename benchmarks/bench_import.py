@@ -0,0 +1,63 @@
+"""덱 가져오기(deckimport) 처리량: 행/초, 작업자 1개 vs 프로세스 풀
+
+사용법: python benchmarks/bench_import.py [행 수]   (기본: 1000000)
+입력 CSV에는 따옴표 안 쉼표/줄바꿈, 중복 용어(약 5%), 빈 용어(약 1%)가 섞여 있다.
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import deckimport  # noqa: E402
+
+
+def write_csv(path, rows):
+    rng = random.Random(1)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write("term,desc\n")
+        for i in range(rows):
+            r = rng.random()
+            if r < 0.05 and i:
+                term = f"용어{rng.randrange(i)}"  # 앞에 나온 용어와 중복
+            elif r < 0.06:
+                term = ""
+            else:
+                term = f"용어{i}"
+            if r > 0.9:
+                desc = f'"설명 {i}, 쉼표와\n줄바꿈이 있는 ""인용"" 설명"'
+            else:
+                desc = f"설명 {i} " + "가나다 abc " * rng.randint(2, 8)
+            f.write(f"{term},{desc}\n")
+
+
+def max_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage / 1024 if sys.platform != "darwin" else usage / 2**20
+
+
+def main(rows):
+    base = tempfile.mkdtemp()
+    try:
+        src = os.path.join(base, "glossary.csv")
+        write_csv(src, rows)
+        print(f"{rows:,} rows, {os.path.getsize(src) / 2**20:.1f} MB")
+        for workers in (1, max(2, os.cpu_count() or 1)):
+            result = deckimport.import_deck(src, os.path.join(base, f"deck{workers}.json"), workers=workers)
+            print(f"workers {workers:<3} {result.rows / result.seconds:>10,.0f} rows/s  {result.seconds:6.2f} s"
+                  f"  -> {result.written:,} terms ({result.duplicates:,} dup, {result.invalid:,} invalid)")
+        rss = max_rss_mb()
+        if rss is not None:
+            print(f"max RSS (main process) {rss:.0f} MB")
+    finally:
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,91 @@
+"""절전(powersave): 보일 때 / 모든 창이 가려졌을 때 / 자리 비움일 때 타이머로 깨어난 횟수
+
+사용법: python benchmarks/bench_powersave.py [단계별 시간(분)]   (기본: 60)
+
+tests/simloop.py의 가상 루프 위에 앱과 같은 타임라인(전환 10s, 덱 감시 2s, 중간 저장 60s,
+흐르는 설명 60fps, hover 애니메이션)을 올리고 창 두 개의 보임 상태와 마지막 입력 시각을 바꿔 가며 잰다.
+확인: 모든 창이 가려진 동안 after 0회, 다시 보이면 용어 전환이 멈출 때 남은 시간 뒤에 울림,
+자리 비움 동안에는 복귀 확인만 돌고 입력이 생기면 RESUME_CHECK_SECONDS 안에 재개.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))  # 가상 루프 / 사용자 (tests/simloop.py)
+
+import powersave  # noqa: E402
+import ticksched  # noqa: E402
+from simloop import SimRoot, TIMER_LATE, User  # noqa: E402
+
+INTERVAL = 10.0
+IDLE_SECONDS = 300
+
+
+def phase(root, ticks, label, minutes):
+    before, fired_before = root.wakeups, ticks.wakeups
+    root.run_until(root.now + minutes * 60)
+    wakeups = root.wakeups - before
+    print(f"{label:<24} {minutes:5.0f} min  after() wakeups {wakeups:8,}  ({wakeups / minutes:8.1f} /min)")
+    assert ticks.wakeups - fired_before == wakeups
+    return wakeups
+
+
+def main(minutes):
+    root = SimRoot(seed=3)
+    ticks = ticksched.TickScheduler(root, root.clock)
+    user = User(root)
+    fired = []
+    term = ticks.add("term", INTERVAL, lambda late: fired.append(root.now))
+    ticks.add("deck-poll", 2.0, lambda late: root.work())
+    ticks.add("persist", 60.0, lambda late: root.work())
+    ticks.add("marquee", 1 / 60, lambda late: None)
+    hover = ticks.add("animation", 0.016, lambda late: None, start=False)
+    power = powersave.PowerSaver(ticks, IDLE_SECONDS, user.inactive_ms)
+    power.set_hidden("window 1", False)
+    power.set_hidden("window 2", False)
+
+    phase(root, ticks, "visible", minutes)
+
+    power.set_hidden("window 1", True)
+    phase(root, ticks, "one window hidden", minutes)
+
+    # 모든 창이 가려짐: 전환까지 남은 시간을 기억하고 완전히 멈춤
+    root.run_until(root.now + INTERVAL * 0.4)
+    power.set_hidden("window 2", True)
+    remaining = term.remaining
+    fired_count = len(fired)
+    hover.start()  # 가려진 동안 시작된 애니메이션도 걸리지 않아야 함
+    hidden = phase(root, ticks, "all windows hidden", minutes)
+    assert hidden == 0, f"{hidden} wakeups while hidden"
+    assert len(fired) == fired_count and power.suspended
+
+    shown_at = root.now
+    power.set_hidden("window 1", False)
+    root.run_until(root.now + INTERVAL * 1.5)
+    hover.stop()
+    wait = fired[fired_count] - shown_at
+    print(f"shown again: {remaining:.3f} s were left, next term after {wait:.3f} s")
+    assert abs(wait - remaining) <= TIMER_LATE + 0.002
+
+    # 자리 비움: IDLE_SECONDS 뒤(+ 확인 주기 안에) 멈추고 복귀 확인만 남음
+    user.present = False
+    root.run_until(root.now + IDLE_SECONDS + powersave.IDLE_CHECK_SECONDS)
+    assert power.idle and power.suspended
+    away = phase(root, ticks, "user away", minutes)
+    assert away <= minutes * 60 / powersave.RESUME_CHECK_SECONDS + 1
+    user.present = True
+    back_at = root.now
+    root.run_until(root.now + powersave.RESUME_CHECK_SECONDS + TIMER_LATE)
+    assert not power.suspended, "did not resume after input"
+    print(f"user back: resumed within {powersave.RESUME_CHECK_SECONDS} s "
+          f"(suspended {power.suspends} times, {back_at:,.0f} s simulated)")
+
+    # 가려진 채로 자리 비움이면 복귀 확인도 멈춤
+    power.set_hidden("window 1", True)
+    user.present = False
+    assert phase(root, ticks, "hidden + away", minutes) == 0
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 60.0)
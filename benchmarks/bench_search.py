@@ -0,0 +1,54 @@
+"""검색 색인 빌드 시간과 질의 지연 (영문 접두어 / 한글 접두어 / 초성 / 여러 단어)
+
+사용법: python benchmarks/bench_search.py [용어 수]   (기본: 1000000)
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import search  # noqa: E402
+
+EN = ["async", "cache", "buffer", "thread", "socket", "index", "query", "token", "stream", "kernel",
+      "router", "schema", "lambda", "vector", "packet", "module", "binary", "cursor", "daemon", "signal"]
+KO = ["비동기", "캐시", "버퍼", "스레드", "소켓", "색인", "질의", "토큰", "스트림", "커널",
+      "라우터", "스키마", "람다", "벡터", "패킷", "모듈", "이진", "커서", "데몬", "신호", "데이터", "구조"]
+QUERIES = ["async", "cach", "비동", "비동ㄱ", "ㅂㄷㄱ", "ㄷㅇㅌ", "데이터 구조", "thread 소켓", "cache 스레드 커널", "zzz", "s"]
+
+
+def make_deck(n, seed=1):
+    rng = random.Random(seed)
+    deck = []
+    for i in range(n):
+        en = rng.choice(EN)
+        ko = rng.choice(KO)
+        term = f"{en.title()}{i} ({ko}{i % 97})"
+        desc = " ".join(rng.choice(KO) for _ in range(4)) + f" {rng.choice(EN)}"
+        deck.append({"term": term, "desc": desc})
+    return deck
+
+
+def main(n):
+    deck = make_deck(n)
+    t0 = time.perf_counter()
+    index = search.SearchIndex(deck)
+    build = time.perf_counter() - t0
+    print(f"entries {n}: build {build:.2f} s, "
+          f"{len(index.term_index.words) + len(index.desc_index.words)} words, "
+          f"{len(index.term_index.postings) + len(index.desc_index.postings)} postings")
+    for q in QUERIES:
+        index.search(q)  # 워밍업
+        times = []
+        for _ in range(50):
+            t0 = time.perf_counter()
+            results = index.search(q)
+            times.append(time.perf_counter() - t0)
+        times.sort()
+        print(f"  {q!r:<16} {len(results):>3} hits  median {times[len(times) // 2] * 1e6:>8.1f} us  "
+              f"max {times[-1] * 1e6:>8.1f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,58 @@
+"""재생 순서: 기존 list(range(n)) + random.shuffle vs LazyShuffle 메모리 / 다음 인덱스까지 시간
+
+사용법: python benchmarks/bench_shuffle.py [덱 크기 ...]   (기본: 1000 100000 1000000)
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shuffle import LazyShuffle  # noqa: E402
+
+
+def list_based(n):
+    indices = list(range(n))
+    random.shuffle(indices)
+    return indices
+
+
+def measure(fn):
+    t0 = time.perf_counter()
+    obj = fn()
+    elapsed = time.perf_counter() - t0
+    # 메모리는 따로 측정 (tracemalloc이 실행 시간을 크게 늘리므로)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return obj, elapsed, peak
+
+
+def main(sizes, draws=10000):
+    print(f"{'entries':>10} {'list setup ms':>14} {'list KB':>10} {'lazy setup ms':>14} {'lazy KB':>9} "
+          f"{'list next us':>13} {'lazy next us':>13}")
+    for n in sizes:
+        indices, list_t, list_mem = measure(lambda: list_based(n))
+        lazy, lazy_t, lazy_mem = measure(lambda: LazyShuffle(n))
+
+        k = min(draws, n)
+        t0 = time.perf_counter()
+        for pos in range(k):
+            indices[pos]
+        list_next = (time.perf_counter() - t0) / k
+        t0 = time.perf_counter()
+        for _ in range(k):
+            lazy.next()
+        lazy_next = (time.perf_counter() - t0) / k
+
+        # 사이클 시작 시 목록을 다시 만드는 비용까지 틱 수로 나눈 값
+        list_amortized = list_next + list_t / n
+        print(f"{n:>10} {list_t * 1000:>14.2f} {list_mem / 1024:>10.1f} {lazy_t * 1000:>14.3f} "
+              f"{lazy_mem / 1024:>9.1f} {list_amortized * 1e6:>13.3f} {lazy_next * 1e6:>13.3f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1000, 100000, 1000000])
@@ -0,0 +1,73 @@
+"""복습 모드 1년 시뮬레이션 (화면 없이): 50만 용어, 하루 8시간 동안 interval 초마다 틱
+
+사용법: python benchmarks/bench_srs.py [용어 수] [일 수] [interval 초]   (기본: 500000 365 10)
+
+가상 사용자는 처음 보는 용어를 30% 확률로 클릭(검색)하고,
+복습 횟수가 늘수록 클릭 확률이 절반씩 줄어든다.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import srs  # noqa: E402
+from shuffle import LazyShuffle  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def main(size, days, interval):
+    rng = random.Random(1)
+    clock = FakeClock()
+    order = LazyShuffle(size, seed=1)
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "srs.log")
+        sched = srs.SrsScheduler(log_path, lambda i: f"Term {i}", size, clock)
+
+        ticks_per_day = 8 * 3600 // interval
+        reviews = lapses = 0
+        worst = 0.0
+        t0 = time.perf_counter()
+        for _ in range(days):
+            for _ in range(ticks_per_day):
+                s = time.perf_counter()
+                idx = sched.next(order.next)
+                worst = max(worst, time.perf_counter() - s)
+                if sched.current.get(None) is not None:
+                    reviews += 1
+                    card = sched.cards.get(idx)
+                    reps = card.reps if card else 0
+                    if rng.random() < 0.3 / (2 ** reps):
+                        sched.lapse(idx)
+                        lapses += 1
+                clock.now += interval
+            clock.now += 16 * 3600  # 밤사이
+        elapsed = time.perf_counter() - t0
+        total = days * ticks_per_day
+        log_size = os.path.getsize(log_path)
+        sched.close()
+
+        t0 = time.perf_counter()
+        reloaded = srs.SrsScheduler(log_path, lambda i: f"Term {i}", size, clock)
+        reload_s = time.perf_counter() - t0
+        reloaded.close()
+
+    print(f"ticks              : {total} ({days} days, {interval}s interval, 8h/day)")
+    print(f"graded reviews     : {reviews} (lapses {lapses})")
+    print(f"cards / heap size  : {len(sched.cards)} / {len(sched.heap)}")
+    print(f"time per tick      : {elapsed / total * 1e6:.2f} us avg, {worst * 1e3:.3f} ms worst")
+    print(f"log                : {log_size / 2**20:.1f} MB, reload {reload_s:.2f} s")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*(args + [500000, 365, 10][len(args):]))
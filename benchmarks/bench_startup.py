@@ -0,0 +1,84 @@
+"""실행부터 첫 용어가 그려질 때까지의 시간 (소스 실행 / onefile / onedir 빌드)
+
+사용법: python benchmarks/bench_startup.py [실행 횟수] [레이아웃 ...]   (기본: 5, 있는 것 모두)
+  source  : python main.py
+  onefile : dist/TermMarquee(.exe)            (pyinstaller TermMarquee.spec)
+  onedir  : dist/TermMarquee/TermMarquee(.exe) (TERMMARQUEE_LAYOUT=onedir pyinstaller TermMarquee.spec)
+
+각 레이아웃은 임시 폴더에 복사해서 실행하므로 실제 config.json / terms.pack 은 건드리지 않는다.
+앱은 TERMMARQUEE_STARTUP_PROBE 파일에 첫 화면 시각을 쓰고 바로 종료한다.
+첫 실행은 terms.pack 컴파일이 포함되므로 따로 표시한다. 화면(디스플레이)이 필요하다.
+"""
+import glob
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXE = "TermMarquee.exe" if os.name == "nt" else "TermMarquee"
+TIMEOUT = 60
+
+
+def prepare(layout, workdir):
+    """레이아웃별로 작업 폴더를 만들고 실행 명령 반환 (빌드가 없으면 None)"""
+    if layout == "source":
+        app_dir = workdir
+        os.makedirs(app_dir)
+        for path in glob.glob(os.path.join(ROOT, "*.py")):
+            shutil.copy(path, app_dir)
+        command = [sys.executable, os.path.join(app_dir, "main.py")]
+    elif layout == "onefile":
+        exe = os.path.join(ROOT, "dist", EXE)
+        if not os.path.isfile(exe):
+            return None
+        app_dir = workdir
+        os.makedirs(app_dir)
+        command = [shutil.copy(exe, app_dir)]
+    elif layout == "onedir":
+        folder = os.path.join(ROOT, "dist", "TermMarquee")
+        if not os.path.isfile(os.path.join(folder, EXE)):
+            return None
+        app_dir = shutil.copytree(folder, workdir)
+        command = [os.path.join(app_dir, EXE)]
+    else:
+        raise ValueError(f"unknown layout: {layout}")
+    shutil.copy(os.path.join(ROOT, "terms.json"), app_dir)
+    return command
+
+
+def first_paint(command, probe_path):
+    """한 번 실행해서 첫 화면까지 걸린 시간 (초)"""
+    if os.path.exists(probe_path):
+        os.remove(probe_path)
+    env = dict(os.environ, TERMMARQUEE_STARTUP_PROBE=probe_path)
+    start = time.time()
+    subprocess.run(command, env=env, timeout=TIMEOUT, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    with open(probe_path, encoding="utf-8") as f:
+        return float(f.read()) - start
+
+
+def main(runs, layouts):
+    base = tempfile.mkdtemp()
+    try:
+        for layout in layouts:
+            command = prepare(layout, os.path.join(base, layout))
+            if command is None:
+                print(f"{layout:<8} (build not found, skipped)")
+                continue
+            probe_path = os.path.join(base, layout + ".probe")
+            first = first_paint(command, probe_path)
+            times = sorted(first_paint(command, probe_path) for _ in range(runs))
+            print(f"{layout:<8} first run {first * 1000:7.0f} ms  "
+                  f"median {times[len(times) // 2] * 1000:7.0f} ms  max {times[-1] * 1000:7.0f} ms")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    runs = int(args.pop(0)) if args and args[0].isdigit() else 5
+    main(runs, args or ["source", "onefile", "onedir"])
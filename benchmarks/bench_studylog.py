@@ -0,0 +1,93 @@
+"""학습 기록(studylog): UI 스레드 기록 비용, 일괄 쓰기 처리량, 대량 이벤트에서 용어별 통계 조회 시간
+
+사용법: python benchmarks/bench_studylog.py [이벤트 수] [용어 수]   (기본: 10000000 50000)
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import studylog  # noqa: E402
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return samples[len(samples) // 2], samples[int(len(samples) * 0.99)]
+
+
+def bench_record(path, count=200000):
+    """UI 스레드에서 show() 한 번에 드는 시간 + 기록 스레드가 다 쓰기까지"""
+    log = studylog.StudyLog(path)
+    times = []
+    clock = time.perf_counter
+    for i in range(count):
+        t0 = clock()
+        log.show("window", "기본", f"용어{i % 5000}")
+        times.append(clock() - t0)
+    t0 = clock()
+    log.close()
+    drain = clock() - t0
+    p50, p99 = percentiles(times)
+    print(f"show()                 median {p50 * 1e6:6.2f} us  p99 {p99 * 1e6:6.2f} us  "
+          f"({log.written:,} events in {log.flushes} flushes, {drain:.2f} s to drain on close)")
+
+
+def fill(db, events, terms):
+    """이벤트를 바로 넣음 (지난 30일에 고르게, 용어 인기는 치우치게)"""
+    rng = random.Random(1)
+    with db:
+        db.executemany("INSERT INTO terms (deck, term) VALUES (?, ?)", (("기본", f"용어{i}") for i in range(terms)))
+    now = time.time()
+    kinds = [studylog.SHOWN] * 90 + [studylog.CLICK] * 6 + [studylog.PAUSE] * 2 + [studylog.RESUME] * 2
+    chunk = 200000
+    t0 = time.perf_counter()
+    for start in range(0, events, chunk):
+        rows = []
+        for _ in range(min(chunk, events - start)):
+            kind = rng.choice(kinds)
+            rows.append((now - rng.random() * 30 * studylog.DAY, int(rng.paretovariate(1.2)) % terms + 1, kind,
+                         rng.random() * 10 if kind == studylog.SHOWN else 0.0))
+        with db:
+            studylog.append_events(db, rows)
+    elapsed = time.perf_counter() - t0
+    print(f"insert {events:,} events: {elapsed:.1f} s ({events / elapsed:,.0f} /s)")
+
+
+def bench_stats(db, terms, label, queries=2000):
+    rng = random.Random(2)
+    times = []
+    for _ in range(queries):
+        term = f"용어{int(rng.paretovariate(1.2)) % terms}"
+        t0 = time.perf_counter()
+        studylog.term_stats(db, "기본", term)
+        times.append(time.perf_counter() - t0)
+    p50, p99 = percentiles(times)
+    print(f"{label:<22} median {p50 * 1000:6.3f} ms  p99 {p99 * 1000:6.3f} ms")
+
+
+def main(events, terms):
+    base = tempfile.mkdtemp()
+    try:
+        bench_record(os.path.join(base, "record.db"))
+
+        path = os.path.join(base, "study.db")
+        db = studylog.connect(path)
+        fill(db, events, terms)
+        bench_stats(db, terms, "term_stats")
+
+        t0 = time.perf_counter()
+        merged = studylog.compact(db, time.time() - studylog.ROLLUP_AFTER_DAYS * studylog.DAY)
+        print(f"compact                {merged:,} events -> rollups in {time.perf_counter() - t0:.1f} s")
+        bench_stats(db, terms, "term_stats (rolled up)")
+        db.close()
+    finally:
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 50000)
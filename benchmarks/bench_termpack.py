@@ -0,0 +1,99 @@
+"""terms.json 직접 로드 vs 컴파일된 terms.pack 의 콜드 스타트 시간 / 최대 메모리 비교
+
+사용법: python benchmarks/bench_termpack.py [항목수 ...]   (기본: 1000 100000 1000000)
+
+각 측정은 새 파이썬 프로세스에서 실행해서 import/파싱 비용까지 포함한다.
+최대 메모리는 Linux에서는 VmHWM, 그 외에는 ru_maxrss(macOS) 또는 tracemalloc 최대치(Windows).
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import termpack  # noqa: E402
+
+CHILD = r"""
+import sys, time
+sys.path.insert(0, {root!r})
+try:
+    import resource
+except ImportError:
+    resource = None
+    import tracemalloc
+    tracemalloc.start()
+t0 = time.perf_counter()
+mode, path = sys.argv[1], sys.argv[2]
+if mode == "json":
+    import json
+    with open(path, "r", encoding="utf-8") as f:
+        terms = json.load(f)
+elif mode == "pack":
+    import termpack
+    terms = termpack.TermPack(path)
+else:
+    terms = [{{"term": "", "desc": ""}}]
+data = terms[len(terms) // 2]  # update_term 한 번 분량
+elapsed = time.perf_counter() - t0
+
+
+def peak_memory():
+    try:
+        # Linux: ru_maxrss는 fork한 부모 값을 물려받을 수 있으므로 VmHWM 사용
+        with open("/proc/self/status") as f:
+            return next(int(l.split()[1]) * 1024 for l in f if l.startswith("VmHWM:"))
+    except (OSError, StopIteration):
+        pass
+    if resource is not None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # macOS: bytes
+    return tracemalloc.get_traced_memory()[1]
+
+
+peak = peak_memory()
+print(elapsed, peak)
+"""
+
+
+def make_deck(path, n):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            [{"term": f"Term {i} (용어 {i})", "desc": f"{i}번째 용어에 대한 설명 문장입니다"} for i in range(n)],
+            f, ensure_ascii=False,
+        )
+
+
+def run_child(mode, path, repeat=3):
+    code = CHILD.format(root=ROOT)
+    best_t, best_mem = None, None
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code, mode, path], capture_output=True, text=True, check=True)
+        t, mem = out.stdout.split()
+        t, mem = float(t), int(mem)
+        best_t = t if best_t is None else min(best_t, t)
+        best_mem = mem if best_mem is None else min(best_mem, mem)
+    return best_t, best_mem
+
+
+def main(sizes):
+    _, base_mem = run_child("empty", "")
+    print(f"{'entries':>10} {'json ms':>10} {'pack ms':>10} {'json MB':>10} {'pack MB':>10} {'build s':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            json_path = os.path.join(tmp, f"terms_{n}.json")
+            make_deck(json_path, n)
+            t0 = time.perf_counter()
+            pack_path = termpack.ensure_pack(json_path)
+            build_s = time.perf_counter() - t0
+
+            json_t, json_mem = run_child("json", json_path)
+            pack_t, pack_mem = run_child("pack", pack_path)
+            print(f"{n:>10} {json_t * 1000:>10.2f} {pack_t * 1000:>10.2f} "
+                  f"{(json_mem - base_mem) / 2**20:>10.1f} {(pack_mem - base_mem) / 2**20:>10.1f} {build_s:>9.2f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1000, 100000, 1000000])
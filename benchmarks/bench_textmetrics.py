@@ -0,0 +1,60 @@
+"""adjust_window_to_content의 텍스트 측정 비용: 임시 Label 방식 vs TextMeasurer 캐시
+
+사용법: python benchmarks/bench_textmetrics.py [반복 횟수]   (디스플레이 필요)
+"""
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import termpack  # noqa: E402
+import textmetrics  # noqa: E402
+
+TERM_FONT = ("Malgun Gothic", 14, "bold")
+DESC_FONT = ("Malgun Gothic", 12)
+
+
+def measure_with_labels(root, term, desc):
+    """기존 방식: 줄마다 임시 Label 생성 -> update_idletasks -> winfo_reqwidth -> destroy"""
+    temp_label = tk.Label(root, text=term, font=TERM_FONT)
+    temp_label.update_idletasks()
+    width = temp_label.winfo_reqwidth()
+    temp_label.destroy()
+    for line in desc.split("\n"):
+        if line.strip():
+            temp_label = tk.Label(root, text=line, font=DESC_FONT)
+            temp_label.update_idletasks()
+            width = max(width, temp_label.winfo_reqwidth())
+            temp_label.destroy()
+    return width
+
+
+def bench(label, fn, samples, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for term, desc in samples:
+            fn(term, desc)
+    per_call = (time.perf_counter() - t0) / (repeat * len(samples))
+    print(f"{label:<28} {per_call * 1e6:>10.1f} us/call")
+
+
+def main(repeat):
+    root = tk.Tk()
+    root.withdraw()
+    terms_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "terms.json")
+    deck = termpack.open_pack(terms_path)
+    samples = [(e["term"], e["desc"]) for e in deck]
+
+    bench("temp Label (before)", lambda t, d: measure_with_labels(root, t, d), samples, repeat)
+
+    measurer = textmetrics.TextMeasurer(root)
+    bench("TextMeasurer (cold)", lambda t, d: measurer.layout(t, d, TERM_FONT, DESC_FONT, 700), samples, 1)
+    bench("TextMeasurer (steady)", lambda t, d: measurer.layout(t, d, TERM_FONT, DESC_FONT, 700), samples, repeat)
+    print(f"cache hits={measurer.hits} misses={measurer.misses}")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
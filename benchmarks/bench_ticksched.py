@@ -0,0 +1,85 @@
+"""24시간 가상 실행으로 틱 오차 비교: 매번 after(주기)로 다시 거는 방식 vs ticksched 기한 방식
+
+사용법: python benchmarks/bench_ticksched.py [시간(h)] [전환 간격(s)]   (기본: 24 10)
+
+디스플레이 없이 가상 시계(tests/simloop.py) 위에서 after 를 흉내 낸다. after 는 0~15ms 늦게 울리고
+콜백마다 0~5ms 작업 시간이 든다고 가정한다. 같은 예약 하나로 전환(10s), 애니메이션(100ms),
+저장(60s) 타임라인을 함께 돌리고, 일시정지/재개 후 남은 시간이 유지되는지도 확인한다.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))  # 가상 루프 (tests/simloop.py)
+
+import ticksched  # noqa: E402
+from simloop import SimRoot, TIMER_LATE  # noqa: E402
+
+
+def naive(hours, interval):
+    root = SimRoot()
+    ticks = []
+
+    def tick():
+        ticks.append(root.now)
+        root.work()
+        root.after(int(interval * 1000), tick)
+
+    root.after(int(interval * 1000), tick)
+    root.run_until(hours * 3600)
+    return ticks, root.wakeups
+
+
+def deadline(hours, interval):
+    root = SimRoot()
+    sched = ticksched.TickScheduler(root, root.clock)
+    ticks = []
+
+    def on_term(late):
+        ticks.append(root.now)
+        root.work()
+
+    sched.add("term", interval, on_term)
+    sched.add("animation", 0.1, lambda late: root.work())
+    sched.add("persist", 60.0, lambda late: root.work())
+    root.run_until(hours * 3600)
+    return ticks, root.wakeups
+
+
+def drift(ticks, interval):
+    """k번째 틱과 이상적인 시각(k * interval)의 차이: (최대, 마지막)"""
+    errors = [t - (k + 1) * interval for k, t in enumerate(ticks)]
+    return max(abs(e) for e in errors), errors[-1]
+
+
+def check_pause(interval):
+    root = SimRoot(seed=2)
+    sched = ticksched.TickScheduler(root, root.clock)
+    fired = []
+    term = sched.add("term", interval, lambda late: fired.append(root.now))
+    root.run_until(interval * 0.3)
+    term.pause()
+    remaining = term.remaining
+    root.run_until(interval * 5)  # 멈춘 동안에는 울리지 않아야 함
+    assert not fired, fired
+    term.resume()
+    root.run_until(interval * 7)
+    wait = fired[0] - interval * 5
+    print(f"pause/resume: remaining {remaining:.3f} s, fired after {wait:.3f} s")
+    assert abs(wait - remaining) <= TIMER_LATE + 0.002
+
+
+def main(hours, interval):
+    expected = int(hours * 3600 / interval)
+    for label, run in (("re-arm after work", naive), ("deadline timelines", deadline)):
+        ticks, wakeups = run(hours, interval)
+        worst, last = drift(ticks, interval)
+        print(f"{label:<20} ticks {len(ticks)}/{expected}  drift max {worst * 1000:10.1f} ms  "
+              f"end {last * 1000:10.1f} ms  after() wakeups {wakeups}")
+    check_pause(interval)
+
+
+if __name__ == "__main__":
+    args = [float(a) for a in sys.argv[1:3]]
+    main(*(args + [24.0, 10.0][len(args):]))
@@ -0,0 +1,123 @@
+"""터미널 모드(ttymarquee) vs Tk 앱: 실행부터 첫 용어까지의 시간과 최대 RSS
+
+사용법: python benchmarks/bench_tty.py [실행 횟수]   (기본: 5)
+  python : 빈 인터프리터 (바닥값)
+  line   : python main.py --tty --line
+  line*  : python ttymarquee.py --line  (main.py를 컴파일하지 않는 직접 실행)
+  curses : python main.py --tty        (가상 터미널 80x24 안에서, POSIX만)
+  tk     : python main.py              (디스플레이가 없으면 건너뜀)
+
+bench_startup.py와 같은 방식으로 임시 폴더에 복사해서 실행하고 TERMMARQUEE_STARTUP_PROBE 로
+첫 화면 시각을 받는다. 최대 RSS는 자식 프로세스의 rusage (Windows에서는 표시하지 않음).
+PYTHONDONTWRITEBYTECODE는 빼고 실행한다 (실제 사용처럼 __pycache__를 쓰도록).
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import bench_startup  # 같은 benchmarks 폴더
+
+EMPTY = "import os, time; open(os.environ['TERMMARQUEE_STARTUP_PROBE'], 'w').write(f'{time.time():.6f}')"
+
+
+def open_pty(rows=24, cols=80):
+    """(master, slave) 가상 터미널 - curses가 쓸 화면 크기를 정해 둠"""
+    import fcntl
+    import pty
+    import struct
+    import termios
+    master, slave = pty.openpty()
+    fcntl.ioctl(slave, termios.TIOCSWINSZ, struct.pack("HHHH", rows, cols, 0, 0))
+    return master, slave
+
+
+def drain(fd):
+    # 화면 출력이 pty 버퍼를 채워 자식이 멈추지 않도록 계속 읽어 버림
+    try:
+        while os.read(fd, 65536):
+            pass
+    except OSError:
+        pass
+
+
+def run_once(command, probe_path, use_pty=False):
+    """한 번 실행 -> (첫 화면까지 초, 최대 RSS MB 또는 None)"""
+    if os.path.exists(probe_path):
+        os.remove(probe_path)
+    env = dict(os.environ, TERMMARQUEE_STARTUP_PROBE=probe_path)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    streams = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+    master = reader = None
+    if use_pty:
+        master, slave = open_pty()
+        env.setdefault("TERM", "xterm-256color")
+        streams = {"stdin": slave, "stdout": slave, "stderr": slave}
+        reader = threading.Thread(target=drain, args=(master,), daemon=True)
+        reader.start()
+    start = time.time()
+    proc = subprocess.Popen(command, env=env, **streams)
+    if use_pty:
+        os.close(slave)
+    rss = None
+    try:
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            rss = usage.ru_maxrss / (1024 if sys.platform != "darwin" else 2**20)
+        else:
+            proc.wait(timeout=bench_startup.TIMEOUT)
+    finally:
+        if master is not None:
+            os.close(master)
+            reader.join(timeout=1)
+    if proc.returncode != 0 or not os.path.exists(probe_path):
+        raise RuntimeError(f"exit code {proc.returncode}")
+    with open(probe_path, encoding="utf-8") as f:
+        return float(f.read()) - start, rss
+
+
+def main(runs):
+    base = tempfile.mkdtemp()
+    try:
+        app = bench_startup.prepare("source", os.path.join(base, "app"))
+        variants = [
+            ("python", [sys.executable, "-c", EMPTY], False),
+            ("line", app + ["--tty", "--line"], False),
+            ("line*", [sys.executable, os.path.join(os.path.dirname(app[-1]), "ttymarquee.py"), "--line"], False),
+            ("curses", app + ["--tty"], True),
+            ("tk", app, False),
+        ]
+        results = {}
+        for name, command, use_pty in variants:
+            if use_pty and os.name != "posix":
+                print(f"{name:<7} (POSIX only, skipped)")
+                continue
+            probe_path = os.path.join(base, name + ".probe")
+            try:
+                run_once(command, probe_path, use_pty)  # 첫 실행은 terms.pack 컴파일 포함
+                samples = [run_once(command, probe_path, use_pty) for _ in range(runs)]
+            except Exception as e:
+                print(f"{name:<7} (failed: {e}, skipped)")
+                continue
+            times = sorted(s[0] for s in samples)
+            rss = max(s[1] for s in samples) if samples[0][1] is not None else None
+            results[name] = (times[len(times) // 2], rss)
+            rss_text = f"  max RSS {rss:6.1f} MB" if rss is not None else ""
+            print(f"{name:<7} median {times[len(times) // 2] * 1000:6.0f} ms  max {times[-1] * 1000:6.0f} ms{rss_text}")
+        if "tk" in results:
+            tk_time, tk_rss = results["tk"]
+            for name in ("line", "line*", "curses"):
+                if name in results:
+                    t, rss = results[name]
+                    ratio = f", RSS {rss / tk_rss:.0%}" if rss is not None else ""
+                    print(f"{name} / tk: time {t / tk_time:.0%}{ratio}")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,105 @@
+"""config.json 지연 쓰기(write-behind) 저장소
+
+설정이 바뀌면 UI 스레드에서는 dirty 표시(스냅샷 복사)만 하고,
+백그라운드 스레드가 잠깐 모아서(debounce) 임시 파일 작성 -> fsync -> os.replace 로
+원자적으로 교체한다. 쓰는 도중 종료되어도 config.json이 잘린 채로 남지 않는다.
+"""
+import json
+import os
+import threading
+import time
+
+
+class ConfigStore:
+    def __init__(self, path, debounce=0.5, max_delay=2.0):
+        self.path = path
+        self.debounce = debounce    # 마지막 변경 후 이만큼 조용하면 저장
+        self.max_delay = max_delay  # 계속 바뀌더라도 이 시간 안에는 한 번 저장
+        self.data = {}
+        self.writes = 0
+        self._lock = threading.Condition()
+        self._snapshot = None  # (순번, 설정 사본)
+        self._seq = 0
+        self._written_seq = 0
+        self._write_lock = threading.Lock()
+        self._first_dirty = 0.0
+        self._last_dirty = 0.0
+        self._closed = False
+        self._thread = None
+
+    def load(self, defaults):
+        """config.json 읽기 (없거나 깨졌으면 defaults 사용)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.data = json.load(f)
+        except FileNotFoundError:
+            self.data = dict(defaults)
+        except Exception as e:
+            print(f"Config load error: {e}")
+            self.data = dict(defaults)
+        return self.data
+
+    def mark_dirty(self):
+        """현재 설정을 저장 대상으로 표시 (UI 스레드에서 호출, 디스크 접근 없음)"""
+        now = time.monotonic()
+        with self._lock:
+            if self._snapshot is None:
+                self._first_dirty = now
+            self._seq += 1
+            self._snapshot = (self._seq, dict(self.data))
+            self._last_dirty = now
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name="config-writer", daemon=True)
+                self._thread.start()
+            self._lock.notify()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while self._snapshot is None and not self._closed:
+                    self._lock.wait()
+                if self._snapshot is None:
+                    return
+                # 변경이 잦아들 때까지(또는 max_delay까지) 기다려서 한 번에 저장
+                while not self._closed:
+                    now = time.monotonic()
+                    due = min(self._last_dirty + self.debounce, self._first_dirty + self.max_delay)
+                    if now >= due:
+                        break
+                    self._lock.wait(due - now)
+                snapshot, self._snapshot = self._snapshot, None
+            self._write(snapshot)
+
+    def _write(self, snapshot):
+        seq, data = snapshot
+        tmp_path = self.path + ".tmp"
+        with self._write_lock:
+            # flush()와 백그라운드 쓰기가 겹쳐도 오래된 스냅샷이 최신 내용을 덮지 않도록
+            if seq <= self._written_seq:
+                return
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+                self._written_seq = seq
+                self.writes += 1
+            except Exception as e:
+                print(f"Config save error: {e}")
+
+    def flush(self):
+        """대기 중인 변경을 즉시 저장 (호출한 스레드에서 씀)"""
+        with self._lock:
+            snapshot, self._snapshot = self._snapshot, None
+        if snapshot is not None:
+            self._write(snapshot)
+
+    def close(self):
+        """종료 시 호출: 백그라운드 스레드를 멈추고 남은 변경을 저장"""
+        with self._lock:
+            self._closed = True
+            self._lock.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.flush()
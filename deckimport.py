@@ -0,0 +1,187 @@
+"""CSV / TSV / Anki 텍스트 내보내기 파일을 덱으로 가져오기
+
+    python deckimport.py glossary.csv [--name 덱이름] [--format csv|tsv|anki] [--workers N]
+
+- 입력은 줄 단위로 읽어 CHUNK_ROWS 줄씩 묶고, 파싱 + 정리 + 검사는 프로세스 풀에서 한다.
+  동시에 처리 중인 묶음은 작업자 수의 2배까지만 두므로 파일 크기와 무관하게 메모리가 일정하다.
+  (CSV는 따옴표 안의 줄바꿈이 묶음 경계에 걸리지 않도록 따옴표 짝을 세어 자른다)
+- 정리: 유니코드 NFC, 공백 정리, Anki는 HTML 태그/엔티티 제거. 용어가 비었거나 너무 긴 행은 버린다.
+- 같은 용어가 여러 번 나오면 첫 번째만 쓴다 (용어 문자열 대신 8바이트 해시만 기억).
+- decks/<이름>.json 과 컴파일된 팩(decks/<이름>.pack)을 함께 쓰고, 팩 헤더에 JSON의
+  mtime/크기/SHA-1을 넣어 두므로 앱이 덱을 처음 열 때 다시 컴파일하지 않는다.
+"""
+import argparse
+import csv
+import hashlib
+import html
+import io
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import termpack
+
+FORMATS = ("csv", "tsv", "anki")
+CHUNK_ROWS = 20000
+MAX_TERM = 200  # 글자 수
+POOL_MIN_BYTES = 4 * 2**20  # 이보다 작은 파일은 프로세스를 띄우지 않고 바로 처리
+HEADER_ROWS = {("term", "desc"), ("term", "description"), ("용어", "설명")}
+
+ImportResult = namedtuple("ImportResult", "path rows written duplicates invalid seconds")
+
+_quote = json.encoder.encode_basestring  # ensure_ascii=False 인 JSON 문자열 (C 구현)
+_TAG = re.compile(r"<[^>]*>")
+_BREAK = re.compile(r"<br\s*/?>|</div>|</p>", re.IGNORECASE)
+
+
+def detect_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".tsv", ".tab"):
+        return "tsv"
+    if ext == ".txt":
+        return "anki"  # Anki "Notes in Plain Text" 내보내기
+    return "csv"
+
+
+def _reader(text, fmt):
+    if fmt == "csv":
+        return csv.reader(io.StringIO(text, newline=""))
+    if fmt == "tsv":
+        return csv.reader(io.StringIO(text, newline=""), delimiter="\t", quoting=csv.QUOTE_NONE)
+    return csv.reader(io.StringIO(text, newline=""), delimiter="\t")
+
+
+def _clean(text, fmt):
+    if fmt == "anki":
+        text = _TAG.sub("", _BREAK.sub(" ", text))
+        text = html.unescape(text)
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
+    return " ".join(text.split())  # 공백/줄바꿈 정리 (정규식보다 빠름)
+
+
+def _key(term_raw):
+    return int.from_bytes(hashlib.blake2b(term_raw, digest_size=8).digest(), "little")
+
+
+def parse_chunk(text, fmt):
+    """(작업자 프로세스) 묶음 하나 파싱 + 정리 + 검사 + 인코딩
+
+    -> ((중복 확인 키, JSON 한 줄, term UTF-8, desc UTF-8) 목록, 행 수, 버린 행 수)
+    메인 프로세스는 중복 확인과 파일 쓰기만 하도록 인코딩까지 여기서 끝낸다.
+    """
+    entries = []
+    rows = invalid = 0
+    for row in _reader(text, fmt):
+        if not row or (fmt == "anki" and row[0].startswith("#")):
+            continue  # 빈 줄, Anki 헤더 (#separator:tab 등)
+        rows += 1
+        term = _clean(row[0], fmt)
+        desc = _clean(row[1], fmt) if len(row) > 1 else ""
+        if not term or len(term) > MAX_TERM or (term.lower(), desc.lower()) in HEADER_ROWS:
+            invalid += 1
+            continue
+        term_raw = term.encode("utf-8")
+        line = '{"term": ' + _quote(term) + ', "desc": ' + _quote(desc) + '}'
+        entries.append((_key(term_raw), line, term_raw, desc.encode("utf-8")))
+    return entries, rows, invalid
+
+
+def read_chunks(path, fmt, chunk_rows=CHUNK_ROWS):
+    """줄 단위로 읽어 chunk_rows 줄씩 묶음 (CSV 따옴표 안에서는 자르지 않음)"""
+    quoting = fmt != "tsv"
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        lines = []
+        in_quotes = False
+        for line in f:
+            lines.append(line)
+            if quoting and line.count('"') % 2:
+                in_quotes = not in_quotes
+            # 필드 중간의 따옴표(5" 등)로 짝이 어긋나도 묶음이 끝없이 커지지 않도록 상한
+            if len(lines) >= chunk_rows and (not in_quotes or len(lines) >= chunk_rows * 4):
+                yield "".join(lines)
+                lines = []
+        if lines:
+            yield "".join(lines)
+
+
+def _parsed(path, fmt, workers):
+    """묶음별 파싱 결과를 입력 순서대로 (동시에 처리 중인 묶음 수는 제한)"""
+    if workers <= 1:
+        for chunk in read_chunks(path, fmt):
+            yield parse_chunk(chunk, fmt)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in read_chunks(path, fmt):
+            pending.append(pool.submit(parse_chunk, chunk, fmt))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def import_deck(src_path, json_path, fmt=None, workers=None):
+    """src_path를 읽어 json_path(+ 팩)로 저장 - 두 파일 모두 임시 파일에 쓴 뒤 교체"""
+    start = time.perf_counter()
+    fmt = fmt or detect_format(src_path)
+    if workers is None:
+        workers = (os.cpu_count() or 1) if os.path.getsize(src_path) >= POOL_MIN_BYTES else 1
+
+    tmp_path = json_path + ".tmp"
+    pack = termpack.PackWriter(termpack.pack_path_for(json_path))
+    seen = set()
+    rows = duplicates = invalid = 0
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            out.write("[")
+            for entries, chunk_rows, chunk_invalid in _parsed(src_path, fmt, workers):
+                rows += chunk_rows
+                invalid += chunk_invalid
+                for key, line, term_raw, desc_raw in entries:
+                    if key in seen:
+                        duplicates += 1
+                        continue
+                    out.write(",\n" if seen else "\n")
+                    seen.add(key)
+                    out.write(line)
+                    pack.add_encoded(term_raw, desc_raw)
+            out.write("\n]\n")
+        if not pack.count:
+            raise ValueError(f"no valid rows in {src_path}")
+        os.replace(tmp_path, json_path)
+    except BaseException:
+        pack.abort()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    st = os.stat(json_path)
+    pack.finish(st.st_mtime_ns, st.st_size, termpack.file_sha1(json_path))
+    return ImportResult(json_path, rows, pack.count, duplicates, invalid, time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CSV / TSV / Anki 내보내기 -> decks/<이름>.json + .pack")
+    parser.add_argument("source")
+    parser.add_argument("--name", help="덱 이름 (기본: 입력 파일 이름)")
+    parser.add_argument("--format", choices=FORMATS, help="기본: 확장자로 판단 (.csv / .tsv / .txt=Anki)")
+    parser.add_argument("--workers", type=int, help="파싱 프로세스 수 (기본: 큰 파일이면 CPU 수)")
+    parser.add_argument("--base", default=os.path.dirname(os.path.abspath(sys.argv[0])),
+                        help="TermMarquee 폴더 (decks 폴더가 여기에 생김)")
+    args = parser.parse_args(argv)
+
+    name = args.name or os.path.splitext(os.path.basename(args.source))[0]
+    deck_dir = os.path.join(args.base, "decks")
+    os.makedirs(deck_dir, exist_ok=True)
+    result = import_deck(args.source, os.path.join(deck_dir, name + ".json"), args.format, args.workers)
+    print(f"{result.rows} rows -> {result.written} terms ({result.duplicates} duplicates, {result.invalid} invalid)"
+          f" in {result.seconds:.1f}s: {result.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""덱 검사: 거의 같은 항목(MinHash/LSH), 빈 설명 / 창에 안 들어가는 설명, 깨진 항목
+
+    python decklint.py decks/합본.json [--threshold 0.7] [--report lint.json] [--merge]
+
+- 깨진 항목(term/desc가 없거나 문자열이 아님)은 덱 전체를 못 읽게 만든다 (deckwatch.read_deck).
+- 빈 설명, 창 크기 계산(adjust_window_to_content -> LayoutCalculator.window_for)에서 최대 창을
+  넘는 설명 / 최대 너비를 넘는 용어는 Tk 없이 글자 폭으로 추정해서 찾는다 (Malgun Gothic 기준).
+- 거의 같은 항목: 용어+설명을 정규화(NFC, 소문자, 문장부호 제거)한 글자 4-gram에
+  one-permutation MinHash(SIG_BINS 칸, 빈 칸은 옆 칸으로 채움)를 만들고 BANDS 개 띠로 나눠
+  같은 띠 값을 가진 항목만 후보로 삼는다. 후보 쌍은 4-gram 집합의 실제 Jaccard로 확인한다.
+  정규화와 해시는 프로세스 풀에서 묶음(CHUNK_ENTRIES) 단위로 한다 (deckimport와 같은 방식).
+- 보고서는 JSON (--report 파일 또는 표준 출력), 요약은 표준 오류. 문제가 있으면 종료 코드 1.
+- --merge: 깨진 항목과 중복 묶음에서 남길 하나(용어+설명이 가장 긴 것)를 뺀 나머지를 지우고
+  덱을 다시 쓴다 (원본은 .bak, 임시 파일에 쓴 뒤 교체). 팩은 앱이 다음에 열 때 다시 만든다.
+"""
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import time
+import unicodedata
+from array import array
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import engine
+
+SIG_BINS = 32
+BANDS = 8
+ROWS = SIG_BINS // BANDS
+SHINGLE = 4  # 글자
+CHUNK_ENTRIES = 20000
+POOL_MIN_ENTRIES = 50000  # 이보다 작은 덱은 프로세스를 띄우지 않고 바로 처리
+THRESHOLD = 0.7  # 설명이 짧아서 용어에 번역만 붙어도 0.75 안팎
+
+# 창 크기 추정 (textmetrics 측정값 대신): 설명 12pt / 용어 14pt bold Malgun Gothic
+DESC_CELL_PX = 8      # 반각 한 칸 폭 (한글 등 전각은 2칸)
+TERM_CELL_PX = 10
+DESC_LINE_PX = 21     # linespace
+TERM_LINE_PX = 25
+WRAP_PX = 700         # measure_term의 줄바꿈 폭
+_calc = engine.LayoutCalculator
+MAX_LAYOUT_HEIGHT = _calc.MAX_HEIGHT - 36 - 20 - 40 * 2  # window_for의 헤더/간격/패딩을 뺀 높이
+MAX_DESC_LINES = (MAX_LAYOUT_HEIGHT - TERM_LINE_PX) // DESC_LINE_PX
+MAX_TERM_PX = _calc.MAX_WIDTH - 100
+
+KINDS = ("broken", "empty_desc", "long_desc", "long_term", "duplicate_term", "near_duplicate")
+
+Issue = namedtuple("Issue", "index kind term detail")
+LintResult = namedtuple("LintResult", "path entries issues groups seconds")
+
+_MAX_HASH = (1 << 63) - 1
+_PUNCT = re.compile(r"[\W_]+")
+_WIDE = re.compile("[\u1100-\u115f\u2e80-\ua4cf\uac00-\ud7a3\uf900-\ufaff\ufe30-\ufe4f\uff00-\uff60\uffe0-\uffe6]")
+
+
+def normalize(text):
+    """NFC + 소문자 + 문장부호/공백 묶음을 공백 하나로 ("Cache (캐시)" -> "cache 캐시")"""
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
+    return _PUNCT.sub(" ", text.lower()).strip()
+
+
+def grams(text):
+    """정규화된 text의 글자 4-gram -> array('Q') (UTF-16 8바이트 창을 정수로, 중복 포함)
+
+    오프셋 0/2/4/6에서 8바이트씩 끊으면 모든 글자 위치에서 시작하는 창이 한 번씩 나온다.
+    """
+    raw = text.encode("utf-16-le", "surrogatepass")
+    width = SHINGLE * 2
+    if len(raw) <= width:
+        return array("Q", [int.from_bytes(raw, "little")])
+    out = array("Q")
+    for offset in range(0, width, 2):
+        out.frombytes(raw[offset:offset + (len(raw) - offset) // width * width])
+    return out
+
+
+def signature(values):
+    """one-permutation MinHash: 해시 아래 비트로 칸을 정하고 칸마다 최솟값 (빈 칸은 왼쪽 값으로 채움)
+
+    해시는 hash((정수,)) - 정수와 튜플 해시는 PYTHONHASHSEED와 무관해서 작업자 프로세스끼리 같다.
+    """
+    mins = [_MAX_HASH] * SIG_BINS
+    mask = SIG_BINS - 1
+    for h in map(hash, zip(values)):
+        b = h & mask
+        if h < mins[b]:
+            mins[b] = h
+    if _MAX_HASH in mins:
+        carry = next(h for h in reversed(mins) if h != _MAX_HASH)
+        for b in range(SIG_BINS):
+            if mins[b] == _MAX_HASH:
+                mins[b] = carry + b
+            else:
+                carry = mins[b]
+    return mins
+
+
+def band_keys(sig):
+    return [hash(tuple(sig[band * ROWS:(band + 1) * ROWS])) for band in range(BANDS)]
+
+
+def _cells(text):
+    return 2 * len(text) - len(_WIDE.sub("", text))
+
+
+def desc_lines(desc):
+    """textmetrics.layout 과 같은 규칙(줄마다 WRAP_PX로 접음)으로 추정한 설명 줄 수"""
+    lines = 0
+    for line in desc.split("\n"):
+        if not line.strip():
+            continue
+        lines += max(1, math.ceil(_cells(line) * DESC_CELL_PX / WRAP_PX))
+    return lines
+
+
+def check_entry(item):
+    """(term, desc, 문제 목록) - 깨진 항목이면 term/desc는 None"""
+    if not isinstance(item, dict):
+        return None, None, [("broken", f"not an object: {type(item).__name__}")]
+    term, desc = item.get("term"), item.get("desc")
+    if not isinstance(term, str) or not term.strip():
+        return None, None, [("broken", "missing term")]
+    if not isinstance(desc, str):
+        return None, None, [("broken", "missing desc" if desc is None else "desc is not a string")]
+    problems = []
+    if not desc.strip():
+        problems.append(("empty_desc", ""))
+    elif len(desc) * 2 * DESC_CELL_PX > WRAP_PX * MAX_DESC_LINES or "\n" in desc:
+        lines = desc_lines(desc)
+        if lines > MAX_DESC_LINES:
+            problems.append(("long_desc", f"{lines} lines > {MAX_DESC_LINES}"))
+    if len(term) * 2 * TERM_CELL_PX > MAX_TERM_PX:
+        px = _cells(term) * TERM_CELL_PX
+        if px > MAX_TERM_PX:
+            problems.append(("long_term", f"~{px}px > {MAX_TERM_PX}px"))
+    return term, desc, problems
+
+
+def lint_chunk(start, items):
+    """(작업자 프로세스) 묶음 하나 검사 + 띠 값 계산
+
+    -> (start, 띠 값 array('q') - 항목마다 BANDS 개 (깨진 항목은 0), [(인덱스, 종류, 내용)])
+    """
+    keys = array("q")
+    problems = []
+    zero = [0] * BANDS
+    for i, item in enumerate(items, start):
+        term, desc, found = check_entry(item)
+        for kind, detail in found:
+            problems.append((i, kind, detail))
+        if term is None:
+            keys.extend(zero)
+            continue
+        keys.extend(band_keys(signature(grams(normalize(term + " " + desc)))))
+    return start, keys, problems
+
+
+def _linted(data, workers):
+    """묶음별 lint_chunk 결과 (입력 순서대로, 동시에 처리 중인 묶음 수는 제한)"""
+    chunks = ((start, data[start:start + CHUNK_ENTRIES]) for start in range(0, len(data), CHUNK_ENTRIES))
+    if workers <= 1:
+        for start, items in chunks:
+            yield lint_chunk(start, items)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for start, items in chunks:
+            pending.append(pool.submit(lint_chunk, start, items))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+class _Groups:
+    """합집합 찾기 (거의 같은 항목 묶음)"""
+
+    def __init__(self):
+        self.parent = {}
+
+    def find(self, i):
+        parent = self.parent
+        root = i
+        while parent.get(root, root) != root:
+            root = parent[root]
+        while parent.get(i, i) != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+    def groups(self):
+        out = {}
+        for i in list(self.parent):
+            out.setdefault(self.find(i), []).append(i)
+        for root, members in out.items():
+            if root not in members:
+                members.append(root)
+        return [sorted(members) for members in out.values()]
+
+
+def lint_deck(path, threshold=THRESHOLD, workers=None, data=None):
+    """덱 검사 -> LintResult (groups: [(남길 인덱스, [(인덱스, 남길 항목과의 유사도)])])"""
+    start_time = time.perf_counter()
+    if data is None:
+        with open(path, "r", encoding="utf-8-sig") as f:
+            data = json.load(f)
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: deck must be a JSON list")
+    n = len(data)
+    if workers is None:
+        workers = (os.cpu_count() or 1) if n >= POOL_MIN_ENTRIES else 1
+
+    keys = array("q", bytes(n * BANDS * 8))
+    issues = []
+    broken = set()
+    for start, chunk_keys, problems in _linted(data, workers):
+        keys[start * BANDS:start * BANDS + len(chunk_keys)] = chunk_keys
+        for i, kind, detail in problems:
+            if kind == "broken":
+                broken.add(i)
+            issues.append(Issue(i, kind, _term_of(data[i]), detail))
+
+    # 같은 용어 (대소문자 / 공백만 다름) - 설명이 다르면 묶음과 별개로 보고
+    first_term = {}
+    for i, item in enumerate(data):
+        if i in broken:
+            continue
+        first = first_term.setdefault(" ".join(item["term"].casefold().split()), i)
+        if first != i:
+            issues.append(Issue(i, "duplicate_term", item["term"], f"same term as #{first}"))
+
+    # LSH: 띠마다 같은 값을 가진 항목을 그 값의 첫 항목과 후보 쌍으로 (묶음이 커도 쌍은 항목 수만큼)
+    candidates = set()
+    for band in range(BANDS):
+        first = {}
+        for i, key in enumerate(keys[band::BANDS]):
+            if i in broken:
+                continue
+            j = first.setdefault(key, i)
+            if j != i:
+                candidates.add((j, i))
+
+    shingle_sets = {}
+
+    def grams_of(i):
+        g = shingle_sets.get(i)
+        if g is None:
+            g = shingle_sets[i] = set(grams(normalize(data[i]["term"] + " " + data[i]["desc"])))
+        return g
+
+    found = _Groups()
+    for a, b in sorted(candidates):
+        if found.find(a) != found.find(b) and jaccard(grams_of(a), grams_of(b)) >= threshold:
+            found.union(a, b)
+
+    groups = []
+    for members in found.groups():
+        keep = max(members, key=lambda i: (len(data[i]["term"]) + len(data[i]["desc"]), -i))
+        others = [(i, jaccard(grams_of(keep), grams_of(i))) for i in members if i != keep]
+        groups.append((keep, others))
+        for i, similarity in others:
+            issues.append(Issue(i, "near_duplicate", data[i]["term"], f"{similarity:.2f} similar to #{keep}"))
+    groups.sort()
+    issues.sort(key=lambda issue: (issue.index, KINDS.index(issue.kind)))
+    return LintResult(path, n, issues, groups, time.perf_counter() - start_time)
+
+
+def _term_of(item):
+    term = item.get("term") if isinstance(item, dict) else None
+    return term if isinstance(term, str) else None
+
+
+def summary_counts(result):
+    counts = dict.fromkeys(KINDS, 0)
+    for issue in result.issues:
+        counts[issue.kind] += 1
+    return counts
+
+
+def report(result, data):
+    """기계가 읽을 보고서 (dict)"""
+    counts = summary_counts(result)
+    return {
+        "deck": result.path,
+        "entries": result.entries,
+        "seconds": round(result.seconds, 3),
+        "counts": counts,
+        "issues": [issue._asdict() for issue in result.issues],
+        "near_duplicates": [
+            {"keep": {"index": keep, "term": data[keep]["term"]},
+             "drop": [{"index": i, "term": data[i]["term"], "similarity": round(s, 3)} for i, s in others]}
+            for keep, others in result.groups
+        ],
+    }
+
+
+def merge_deck(result, data, out_path):
+    """깨진 항목과 묶음의 나머지를 뺀 덱을 out_path에 쓰기 (덮어쓰면 원본은 .bak) -> 지운 항목 수"""
+    drop = {issue.index for issue in result.issues if issue.kind == "broken"}
+    for _, others in result.groups:
+        drop.update(i for i, _ in others)
+    tmp_path = out_path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            out.write("[")
+            first = True
+            for i, item in enumerate(data):
+                if i in drop:
+                    continue
+                out.write("\n" if first else ",\n")
+                out.write(json.dumps(item, ensure_ascii=False))
+                first = False
+            out.write("\n]\n")
+        if os.path.exists(out_path):
+            os.replace(out_path, out_path + ".bak")
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return len(drop)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="덱 검사: 거의 같은 항목 / 빈 설명 / 창에 안 맞는 설명 / 깨진 항목")
+    parser.add_argument("deck", nargs="?", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "terms.json"))
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="거의 같은 항목으로 볼 Jaccard 유사도")
+    parser.add_argument("--workers", type=int, help="해시 프로세스 수 (기본: 큰 덱이면 CPU 수)")
+    parser.add_argument("--report", default="-", help="JSON 보고서 경로 (기본: 표준 출력)")
+    parser.add_argument("--merge", action="store_true", help="깨진 항목 / 중복을 지운 덱으로 교체 (원본은 .bak)")
+    parser.add_argument("--output", help="--merge 결과를 쓸 경로 (기본: 덱 파일)")
+    args = parser.parse_args(argv)
+
+    with open(args.deck, "r", encoding="utf-8-sig") as f:
+        data = json.load(f)
+    result = lint_deck(args.deck, args.threshold, args.workers, data)
+    body = json.dumps(report(result, data), ensure_ascii=False, indent=1)
+    if args.report == "-":
+        print(body)
+    else:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(body + "\n")
+
+    counts = summary_counts(result)
+    summary = ", ".join(f"{count} {kind}" for kind, count in counts.items() if count) or "no issues"
+    print(f"{result.entries} entries in {result.seconds:.1f}s: {summary}", file=sys.stderr)
+    if args.merge:
+        dropped = merge_deck(result, data, args.output or args.deck)
+        print(f"merged: dropped {dropped} entries -> {args.output or args.deck}", file=sys.stderr)
+    return 1 if result.issues and not args.merge else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""여러 덱(용어 모음) 관리: 필요할 때 불러오고, 메모리 한도 안에서 최근 사용한 덱만 유지
+
+- 기본 덱은 실행 파일 옆 terms.json, 추가 덱은 decks/ 폴더의 *.json
+- 불러온 덱은 LRU 순서로 보관하고, 추정 메모리 합이 한도를 넘으면 오래된 것부터 닫음
+  (현재 표시 중인 덱은 고정되어 내보내지 않음)
+- 혼합 모드는 여러 덱을 하나로 합치지 않고, 가중치에 따라 덱을 고른 뒤
+  그 덱의 셔플 순서에서 다음 용어를 꺼낸다
+"""
+import bisect
+import os
+import random
+from collections import OrderedDict, deque
+
+import deckwatch
+import termpack
+
+DEFAULT_DECK = "기본"
+MIXED_DECK = "혼합"
+
+ENTRY_OVERHEAD = 200  # JSON 목록으로 불러온 덱의 항목당 dict/str 추정 비용 (바이트)
+
+
+def load_deck_file(path):
+    """덱 파일을 팩으로 열기 (실패하면 JSON 목록 -> 마지막 팩 순으로 대체)"""
+    try:
+        return termpack.open_pack(path)
+    except Exception as e:
+        print(f"Term pack error: {e}")
+    # 팩을 만들 수 없는 경우(읽기 전용 폴더 등) JSON을 읽어 메모리 안의 열 형식으로 대체
+    try:
+        entries, _ = deckwatch.read_deck(path)
+        return termpack.TermColumns.from_entries(entries)
+    except Exception as e:
+        print(f"Terms load error: {e}")
+    # 파일이 깨졌어도 마지막으로 컴파일된 팩이 있으면 그대로 사용
+    try:
+        return termpack.TermPack(termpack.pack_path_for(path))
+    except Exception:
+        return None
+
+
+def estimate_memory(terms):
+    """덱이 차지하는 메모리 추정치 (팩은 매핑된 파일 크기)"""
+    if isinstance(terms, termpack.TermPack):
+        try:
+            return os.path.getsize(terms.path)
+        except OSError:
+            return 0
+    if isinstance(terms, termpack.TermColumns):
+        return terms.nbytes()
+    if isinstance(terms, MixedDeck):
+        return 0  # 구성 덱들이 따로 계산됨
+    return sum(len(t['term']) + len(t['desc']) for t in terms) * 2 + len(terms) * ENTRY_OVERHEAD
+
+
+def close_deck(terms):
+    if isinstance(terms, termpack.TermPack):
+        terms.close()
+
+
+class DeckLibrary:
+    def __init__(self, base_path, budget_bytes=200 * 2**20):
+        self.base_path = base_path
+        self.deck_dir = os.path.join(base_path, 'decks')
+        self.budget_bytes = budget_bytes
+        self.resident = OrderedDict()  # 이름 -> 불러온 덱 (오래된 것이 앞)
+        self.extras = {}               # 이름 -> 덱과 함께 보관할 부가 데이터 (검색 색인 등)
+        self.signatures = {}           # 이름 -> 불러온 파일의 (mtime_ns, 크기) - 다시 열 때 감시 기준
+        self.pinned = set()
+
+    def names(self):
+        names = [DEFAULT_DECK]
+        try:
+            names += sorted(os.path.splitext(f)[0] for f in os.listdir(self.deck_dir)
+                            if f.endswith('.json') and os.path.splitext(f)[0] not in (DEFAULT_DECK, MIXED_DECK))
+        except OSError:
+            pass
+        return names
+
+    def path_for(self, name):
+        if name == DEFAULT_DECK:
+            return os.path.join(self.base_path, 'terms.json')
+        return os.path.join(self.deck_dir, name + '.json')
+
+    def get(self, name):
+        """덱 가져오기 - 처음 쓰는 덱이면 이때 불러옴 (없으면 None)"""
+        terms = self.resident.get(name)
+        if terms is not None:
+            self.resident.move_to_end(name)
+            return terms
+        path = self.path_for(name)
+        signature = deckwatch.file_signature(path)  # 읽기 전에 - 읽는 사이 바뀌면 다음 감시에서 잡힘
+        terms = load_deck_file(path)
+        if terms is None:
+            return None
+        self.resident[name] = terms
+        self.signatures[name] = signature
+        self.evict()
+        return terms
+
+    def replace(self, name, terms, signature=None):
+        """다시 불러온(hot reload) 덱으로 교체 - signature: 다시 읽은 파일의 (mtime_ns, 크기)"""
+        self.resident[name] = terms
+        self.extras.pop(name, None)
+        if signature is not None:
+            self.signatures[name] = signature
+
+    def pin(self, names):
+        self.pinned = set(names)
+        self.evict()
+
+    def memory_usage(self):
+        total = 0
+        for name, terms in self.resident.items():
+            total += estimate_memory(terms)
+            extra = self.extras.get(name)
+            if extra is not None and hasattr(extra, 'memory_estimate'):
+                total += extra.memory_estimate()
+        return total
+
+    def evict(self):
+        """메모리 한도를 넘으면 고정되지 않은 덱을 오래된 순서로 닫음"""
+        while self.memory_usage() > self.budget_bytes:
+            victim = next((n for n in self.resident if n not in self.pinned), None)
+            if victim is None:
+                break
+            close_deck(self.resident.pop(victim))
+            self.extras.pop(victim, None)
+            self.signatures.pop(victim, None)
+
+
+MAX_MIX_WEIGHT = 1e6  # 이보다 큰 가중치는 거절 (합이 inf가 되면 random.choices가 깨짐)
+
+
+def mix_weight(weight):
+    """config의 혼합 가중치 -> 0 이상의 유한한 float (숫자가 아니거나 범위 밖이면 0)"""
+    try:
+        weight = float(weight)
+    except (TypeError, ValueError, OverflowError):
+        return 0.0
+    return weight if 0 < weight <= MAX_MIX_WEIGHT else 0.0  # 음수 / NaN / inf
+
+
+class MixedDeck:
+    """여러 덱을 복사 없이 이어 붙인 가상 덱 (인덱스 = 덱 시작 오프셋 + 덱 안의 인덱스)
+
+    가중치가 0인 구성 덱은 뽑힐 수 없으므로 빼고, 남은 구성 덱이 없으면 ValueError.
+    """
+
+    def __init__(self, parts):
+        parts = [(name, terms, mix_weight(weight)) for name, terms, weight in parts]
+        parts = [part for part in parts if part[2] > 0 and len(part[1])]
+        if not parts:
+            raise ValueError("mixed deck has no part with a positive weight")
+        self.parts = [terms for _, terms, _ in parts]
+        self.names = [name for name, _, _ in parts]
+        self.weights = [weight for _, _, weight in parts]
+        self.offsets = []
+        total = 0
+        for terms in self.parts:
+            self.offsets.append(total)
+            total += len(terms)
+        self.total = total
+
+    def __len__(self):
+        return self.total
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += self.total
+        if not 0 <= idx < self.total:
+            raise IndexError("term index out of range")
+        p = bisect.bisect_right(self.offsets, idx) - 1
+        return self.parts[p][idx - self.offsets[p]]
+
+    def __iter__(self):
+        for terms in self.parts:
+            yield from terms
+
+
+class MixedOrder:
+    """혼합 덱의 재생 순서 - LazyShuffle과 같은 next/peek/resize 인터페이스
+
+    덱마다 자기 셔플(단일 덱으로 볼 때와 같은 객체)을 쓰므로 재생 위치가 공유된다.
+    """
+
+    def __init__(self, deck, shuffles, rng=None):
+        self.deck = deck
+        self.shuffles = shuffles  # 구성 덱과 같은 순서
+        self.rng = rng or random.Random()
+        self._queue = deque()  # peek로 미리 뽑아 둔 인덱스
+        self._cum_weights = []
+        total = 0.0
+        for weight in deck.weights:  # MixedDeck이 0 가중치 / 빈 덱을 이미 뺐음
+            total += weight
+            self._cum_weights.append(total)
+
+    @property
+    def n(self):
+        return len(self.deck)
+
+    def _draw(self):
+        if not self._cum_weights or self._cum_weights[-1] <= 0:
+            raise IndexError("empty deck")
+        p = self.rng.choices(range(len(self.shuffles)), cum_weights=self._cum_weights)[0]
+        order = self.shuffles[p]
+        if order.n != len(self.deck.parts[p]):
+            order.resize(len(self.deck.parts[p]))
+        return self.deck.offsets[p] + order.next()
+
+    def next(self):
+        return self._queue.popleft() if self._queue else self._draw()
+
+    def peek(self, k):
+        if self.n <= 0:
+            return []
+        while len(self._queue) < k:
+            self._queue.append(self._draw())
+        return list(self._queue)[:k]
+
+    def resize(self, n):
+        pass  # 구성 덱 크기는 _draw에서 확인
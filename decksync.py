@@ -0,0 +1,304 @@
+"""중앙 HTTP 서버에서 기본 덱(terms.json) 동기화 - 바뀐 용어만, gzip으로, 백그라운드 스레드에서
+
+config.json에 "deck_sync_url"이 있을 때만 켜진다 (주기는 "deck_sync_minutes", 기본 10분).
+
+프로토콜 (서버 쪽 변경분은 make_delta, 로컬 대역은 benchmarks/bench_decksync.py 의 DeckServer)
+- GET url?since=<로컬 버전>  - 버전을 모르거나 terms.json이 로컬에서 바뀌었으면 since 없이 전체
+  요청 헤더: If-None-Match(ETag), If-Modified-Since(Last-Modified), Accept-Encoding: gzip
+- 304: 본문 없음 (바뀐 것 없음)
+- 200 전체: {"version": N, "terms": [{"term", "desc"}, ...]}  (목록만 와도 됨 - 버전 없음)
+- 200 변경분: {"version": N, "base": M, "added": [...], "changed": [...], "removed": ["term", ...]}
+  base가 로컬 버전과 다르면 since 없이 전체를 다시 받는다.
+- 결과는 임시 파일 -> fsync -> os.replace 로 terms.json을 교체한다. 앱은 원래 하던 stat 감시(deck-poll)로
+  백그라운드에서 다시 읽으므로 UI 스레드는 네트워크도 파일 쓰기도 기다리지 않는다.
+- 실패하면 지수 백오프 (min_backoff부터 두 배씩, max_backoff까지, 0.5~1배 무작위) 후 다시 시도
+- ETag / Last-Modified / 버전과 마지막으로 쓴 파일의 (mtime, 크기)는 terms.sync.json에 저장
+- 동기화마다 받은 바이트(응답 헤더 + 압축된 본문)를 SyncResult로 남기고 한 줄 출력
+- 절전으로 앱 타이머가 멈춘 동안(set_suspended(True))은 스레드도 깨어나지 않는다.
+  다시 보이면 멈춘 사이 다음 시도 시각(주기 또는 백오프)이 지났을 때만 바로 동기화하고,
+  아니면 남은 시간을 기다린다 (창이 깜빡여도 서버에 요청이 몰리지 않음).
+"""
+import gzip
+import json
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import namedtuple
+
+TIMEOUT = 30  # 요청 하나의 제한 시간 (초)
+MIN_BACKOFF = 30
+MAX_BACKOFF = 3600
+USER_AGENT = "TermMarquee-decksync/1"
+
+# status: "full" / "delta" / "not-modified" / "error", received: 받은 바이트 (헤더 + 본문)
+SyncResult = namedtuple("SyncResult", "status version received body_bytes added changed removed seconds")
+
+
+def state_path_for(deck_path):
+    return os.path.splitext(deck_path)[0] + ".sync.json"
+
+
+def from_config(config, deck_path):
+    """config.json의 "deck_sync_url"로 동기화 시작 -> DeckSync (주소가 없으면 None)"""
+    url = config.get("deck_sync_url")
+    if not url:
+        return None
+    sync = DeckSync(url, deck_path, config.get("deck_sync_minutes", 10) * 60)
+    sync.start()
+    return sync
+
+
+def make_delta(old, new, base, version):
+    """(서버 쪽) base 버전 목록 -> version 목록의 변경분 본문"""
+    old_map = {item["term"]: item for item in old}
+    seen = set()
+    added, changed = [], []
+    for item in new:
+        term = item["term"]
+        seen.add(term)
+        prev = old_map.get(term)
+        if prev is None:
+            added.append(item)
+        elif prev != item:
+            changed.append(item)
+    removed = [term for term in old_map if term not in seen]
+    return {"version": version, "base": base, "added": added, "changed": changed, "removed": removed}
+
+
+def apply_delta(items, delta):
+    """로컬 항목 목록에 변경분 적용 - 남은 항목은 순서 유지, 새 항목은 뒤에"""
+    removed = set(delta.get("removed", ()))
+    updates = {}
+    for item in list(delta.get("changed", ())) + list(delta.get("added", ())):
+        updates[item["term"]] = item
+    out = []
+    for item in items:
+        term = item.get("term")
+        if term in removed:
+            continue
+        out.append(updates.pop(term, item))
+    out.extend(updates.values())
+    return out
+
+
+def check_entries(items):
+    """terms.json으로 쓸 수 있는 목록인지 확인 (deckwatch.read_deck과 같은 기준) - 아니면 ValueError"""
+    if not isinstance(items, list) or not items:
+        raise ValueError("deck must be a non-empty list")
+    for n, item in enumerate(items):
+        if not isinstance(item, dict) or not isinstance(item.get("term"), str) or not item["term"].strip():
+            raise ValueError(f"entry {n} has no term")
+        if not isinstance(item.get("desc", ""), str):
+            raise ValueError(f"entry {n} has an invalid desc")
+
+
+def write_atomic(path, text):
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def deck_text(items):
+    """terms.json 형식 (한 줄에 항목 하나)"""
+    return "[\n" + ",\n".join("  " + json.dumps(item, ensure_ascii=False) for item in items) + "\n]\n"
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+class DeckSync:
+    def __init__(self, url, deck_path, interval=600, timeout=TIMEOUT,
+                 min_backoff=MIN_BACKOFF, max_backoff=MAX_BACKOFF, rng=None, monotonic=time.monotonic):
+        self.url = url
+        self.deck_path = deck_path
+        self.state_path = state_path_for(deck_path)
+        self.interval = interval
+        self.timeout = timeout
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.rng = rng or random.Random()
+        self.monotonic = monotonic
+        self.state = self.load_state()
+        self.failures = 0  # 연속 실패 횟수
+        self.last = None  # 마지막 SyncResult
+        self.syncs = 0
+        self.total_received = 0
+        self.suspended = False
+        self.last_attempt = None  # 마지막 시도 시각 (monotonic)
+        self.retry_after = 0.0    # 그 시도 뒤 다음 시도까지 초 (next_delay)
+        self._stop = threading.Event()
+        self._wake = threading.Event()  # 종료 / 절전 해제 때 대기 중인 스레드 깨우기
+        self._thread = None
+
+    # --- 스레드 ---
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="deck-sync", daemon=True)
+            self._thread.start()
+
+    def close(self):
+        """종료 시 호출 - 요청 중이면 기다리지 않음 (파일은 os.replace로만 바뀌므로 중간에 끊겨도 안전)"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def set_suspended(self, suspended):
+        """절전 상태 (PowerSaver 리스너) - 멈추면 깨어나지 않고, 풀리면 다음 시도 시각부터 다시"""
+        if suspended == self.suspended:
+            return
+        self.suspended = suspended
+        self._wake.set()
+
+    def seconds_until_due(self):
+        """다음 시도까지 남은 초 (0 이하면 지금)"""
+        if self.last_attempt is None:
+            return 0.0
+        return self.last_attempt + self.retry_after - self.monotonic()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.clear()  # 상태를 확인하기 전에 - 그 뒤의 set()은 아래 wait가 받음
+            if self.suspended:
+                self._wake.wait()  # 절전 해제 / 종료까지 잠듦
+                continue
+            remaining = self.seconds_until_due()
+            if remaining > 0:
+                self._wake.wait(remaining)
+                continue
+            self.last_attempt = self.monotonic()
+            self.sync_once()
+            self.retry_after = self.next_delay()
+
+    def next_delay(self):
+        """다음 시도까지 초 - 실패가 이어지면 지수 백오프"""
+        if not self.failures:
+            return self.interval
+        backoff = min(self.max_backoff, self.min_backoff * 2 ** (self.failures - 1))
+        return backoff * self.rng.uniform(0.5, 1.0)
+
+    # --- 상태 ---
+    def load_state(self):
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Deck sync state error: {e}")
+            return {}
+
+    def local_intact(self):
+        """terms.json이 마지막 동기화 뒤로 그대로인지 (로컬에서 고쳤으면 버전/ETag를 믿지 않음)"""
+        return bool(self.state) and self.state.get("stat") == _stat(self.deck_path)
+
+    def save_state(self, headers, version):
+        self.state = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "version": version,
+            "stat": _stat(self.deck_path),
+        }
+        write_atomic(self.state_path, json.dumps(self.state))
+
+    # --- 동기화 ---
+    def sync_once(self):
+        """한 번 동기화 (호출한 스레드에서 네트워크 / 파일 쓰기) -> SyncResult"""
+        start = time.perf_counter()
+        try:
+            result = self._sync(start)
+            self.failures = 0
+        except Exception as e:
+            self.failures += 1
+            print(f"Deck sync error: {e}")
+            result = SyncResult("error", self.state.get("version"), 0, 0, 0, 0, 0, time.perf_counter() - start)
+        self.last = result
+        self.syncs += 1
+        self.total_received += result.received
+        if result.status != "error":
+            print(f"Deck sync: {result.status} v{result.version} +{result.added} -{result.removed} ~{result.changed}, "
+                  f"{result.received:,} bytes in {result.seconds * 1000:.0f} ms")
+        return result
+
+    def _sync(self, start):
+        intact = self.local_intact()
+        version = self.state.get("version") if intact else None
+        status, headers, body, received = self._request(version, intact)
+        if status == 304:
+            return SyncResult("not-modified", version, received, 0, 0, 0, 0, time.perf_counter() - start)
+        payload = json.loads(body.decode("utf-8-sig"))
+        if isinstance(payload, dict) and "base" in payload and (version is None or payload["base"] != version):
+            # 변경분의 기준 버전이 다름 -> 전체를 다시 받음
+            status, headers, body, more = self._request(None, False)
+            received += more
+            payload = json.loads(body.decode("utf-8-sig"))
+
+        local = self.read_local()
+        if isinstance(payload, dict) and "base" in payload:
+            kind = "delta"
+            items = apply_delta(local, payload)
+            counts = (len(payload.get("added", ())), len(payload.get("changed", ())), len(payload.get("removed", ())))
+            check_entries(items)
+        else:
+            kind = "full"
+            items = payload.get("terms") if isinstance(payload, dict) else payload
+            check_entries(items)
+            delta = make_delta(local, items, None, None)
+            counts = (len(delta["added"]), len(delta["changed"]), len(delta["removed"]))
+        new_version = payload.get("version") if isinstance(payload, dict) else None
+        if items != local:
+            write_atomic(self.deck_path, deck_text(items))
+        self.save_state(headers, new_version)
+        return SyncResult(kind, new_version, received, len(body), *counts, time.perf_counter() - start)
+
+    def read_local(self):
+        """지금 terms.json의 항목 (없거나 깨졌으면 빈 목록 -> 전체를 받아야 함)"""
+        try:
+            with open(self.deck_path, encoding="utf-8-sig") as f:
+                items = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if not isinstance(items, list):
+            return []
+        return [item for item in items if isinstance(item, dict) and isinstance(item.get("term"), str)]
+
+    def _request(self, version, conditional):
+        """-> (상태 코드, 응답 헤더, 풀린 본문, 받은 바이트)"""
+        url = self.url
+        headers = {"Accept-Encoding": "gzip", "User-Agent": USER_AGENT}
+        if version is not None:
+            url += ("&" if "?" in url else "?") + f"since={version}"
+        if conditional:
+            if self.state.get("etag"):
+                headers["If-None-Match"] = self.state["etag"]
+            if self.state.get("last_modified"):
+                headers["If-Modified-Since"] = self.state["last_modified"]
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as resp:
+                status, resp_headers, raw = resp.status, resp.headers, resp.read()
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            status, resp_headers, raw = 304, e.headers, b""
+        received = len(str(resp_headers).encode("latin-1", "replace")) + len(raw)
+        body = gzip.decompress(raw) if resp_headers.get("Content-Encoding", "").lower() == "gzip" else raw
+        return status, resp_headers, body, received
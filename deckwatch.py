@@ -0,0 +1,106 @@
+"""terms.json 변경 감지 + 불러온 덱과의 증분 비교
+
+- 감시는 os.stat 폴링(mtime, 크기)만 하므로 root.after 로 자주 불러도 부담이 없다.
+- 변경되면 백그라운드에서 파일을 다시 읽고, 용어 이름(term)을 키로 기존 덱과 비교한다.
+- 기존 용어는 인덱스를 최대한 그대로 두어 셔플/복습 위치가 유지되도록 병합한다.
+  지워진 자리는 새 용어로 채우고, 남는 새 용어는 뒤에 붙인다.
+  새 용어가 모자라 빈자리가 남으면 맨 뒤 항목을 옮겨 채운다.
+"""
+import hashlib
+import json
+import os
+from collections import namedtuple
+
+# entries: 병합된 (term, desc) 목록, mapping: 기존 idx -> 새 idx (남은 용어만)
+DeckUpdate = namedtuple("DeckUpdate", "entries mapping added removed changed")
+
+
+def file_signature(path):
+    """(mtime_ns, 크기) - 파일이 없으면 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class DeckWatcher:
+    def __init__(self, path, signature=None):
+        self.path = path
+        # 덱을 불러온 때의 signature를 받으면 그 뒤로 바뀐 것도 감지 (없으면 지금 파일 기준)
+        self.signature = signature if signature is not None else file_signature(path)
+
+    def changed(self):
+        sig = file_signature(self.path)
+        if sig is None or sig == self.signature:
+            return False
+        self.signature = sig
+        return True
+
+
+def read_deck(path):
+    """terms.json을 읽어 ((term, desc) 목록, 파일 SHA-1) 반환 - 형식이 잘못되면 ValueError"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = json.loads(raw.decode('utf-8'))
+    if not isinstance(data, list):
+        raise ValueError("terms.json must contain a list")
+    entries = []
+    for n, item in enumerate(data):
+        if not isinstance(item, dict) or not isinstance(item.get('term'), str) or not item['term'].strip():
+            raise ValueError(f"entry {n} has no term")
+        desc = item.get('desc', "")
+        if not isinstance(desc, str):
+            raise ValueError(f"entry {n} has an invalid desc")
+        entries.append((item['term'], desc))
+    if not entries:
+        raise ValueError("terms.json is empty")
+    return entries, hashlib.sha1(raw).digest()
+
+
+def diff_deck(old_terms, new_entries):
+    """기존 덱(old_terms)에 새 목록을 병합 - 바뀐 것이 없으면 None"""
+    new_map = {}
+    for term, desc in new_entries:
+        new_map.setdefault(term, desc)  # 같은 이름이 여러 번 있으면 첫 번째만
+
+    merged = []
+    mapping = {}
+    holes = []
+    seen = set()
+    changed = 0
+    for i, data in enumerate(old_terms):
+        term = data['term']
+        if term in new_map and term not in seen:
+            seen.add(term)
+            desc = new_map[term]
+            if desc != data['desc']:
+                changed += 1
+            mapping[i] = len(merged)
+            merged.append((term, desc))
+        else:
+            holes.append(len(merged))
+            merged.append(None)
+    removed = len(holes)
+    added = [(term, desc) for term, desc in new_map.items() if term not in seen]
+    if not added and not removed and not changed:
+        return None
+
+    # 빈자리는 새 용어로 먼저 채우고 나머지 새 용어는 뒤에 추가
+    filled = min(len(holes), len(added))
+    for slot, entry in zip(holes, added):
+        merged[slot] = entry
+    holes = holes[filled:]
+    merged.extend(added[filled:])
+
+    # 그래도 남은 빈자리는 맨 뒤 항목을 옮겨 채움
+    back = {new: old for old, new in mapping.items()}
+    for slot in sorted(holes, reverse=True):
+        last = len(merged) - 1
+        if slot != last:
+            merged[slot] = merged[last]
+            if last in back:
+                mapping[back[last]] = slot
+                back[slot] = back.pop(last)
+        merged.pop()
+    return DeckUpdate(merged, mapping, len(added), removed, changed)
@@ -0,0 +1,442 @@
+"""화면(Tk)과 무관한 마키 엔진: 덱 / 다음 용어 선택 / 설정 / 레이아웃 계산
+
+TermMarquee(Tk 창)는 엔진이 고른 용어와 계산한 크기를 위젯에 반영하는 얇은 뷰다.
+엔진은 디스플레이 없이 만들고 구동할 수 있어서 benchmarks/bench_engine.py 가
+틱/리사이즈/테마 변경을 직접 돌려 성능을 잰다.
+"""
+import os
+import threading
+import time
+
+import configstore
+import decks
+import deckwatch
+import shuffle
+import termpack
+
+THEMES = {
+    "Yellow": {"bg": "#fff7d1", "header": "#e3d8a3", "fg": "#000000"},
+    "Pink":   {"bg": "#fccce4", "header": "#e3a8c3", "fg": "#000000"},
+    "Green":  {"bg": "#ccffcc", "header": "#a8e3a8", "fg": "#000000"},
+    "Blue":   {"bg": "#cceeff", "header": "#a8cee3", "fg": "#000000"},
+    "Purple": {"bg": "#e6ccff", "header": "#c3a8e3", "fg": "#000000"},
+    "Grey":   {"bg": "#f2f2f2", "header": "#d9d9d9", "fg": "#000000"},
+    "Dark":   {"bg": "#333333", "header": "#222222", "fg": "#ffffff"}
+}
+
+# 창마다 따로 저장하는 설정 (config["windows"][slot])
+WINDOW_KEYS = ("theme_name", "interval_seconds", "width", "height", "x", "y", "marquee_mode", "marquee_speed")
+
+DEFAULT_CONFIG = {
+    "theme_name": "Yellow",
+    "interval_seconds": 10,
+    "width": 600,
+    "height": 300
+}
+
+
+class LayoutCalculator:
+    """창 크기 -> 헤더/본문 글자 크기, 용어 레이아웃 -> 창 크기
+
+    header_for / font_size_for 는 지난번과 결과가 같으면 None을 돌려줘서
+    뷰가 위젯을 다시 설정하지 않아도 되게 한다.
+    """
+
+    MIN_WIDTH = 400
+    MAX_WIDTH = 800
+    MIN_HEIGHT = 250
+    MAX_HEIGHT = 500
+
+    def __init__(self):
+        self.header = None     # 마지막 (헤더 높이, 아이콘, 닫기 아이콘) 크기
+        self.font_size = None  # 마지막 본문 글자 크기
+
+    def header_for(self, height):
+        """타이틀 바 높이를 창 높이에 비례하여 계산"""
+        if height <= 1:
+            return None
+        # 창 높이의 9.6%로 설정 (기존 12%의 80%), 최소 28px, 최대 48px
+        header_height = max(28, min(48, int(height * 0.096)))
+        # 아이콘 크기도 타이틀 바 높이에 비례 (일시정지와 재생 아이콘은 같은 크기)
+        icon_size = max(11, min(18, int(header_height * 0.5)))
+        close_icon_size = max(10, min(15, int(header_height * 0.42)))
+        layout = (header_height, icon_size, close_icon_size)
+        if layout == self.header:
+            return None
+        self.header = layout
+        return layout
+
+    def font_size_for(self, width, scale):
+        """본문(용어) 글자 크기 - 설명은 여기서 2pt 작게"""
+        if width <= 1:
+            return None
+        size = max(10, int(int(width / 25) * scale))
+        if size == self.font_size:
+            return None
+        self.font_size = size
+        return size
+
+    def window_for(self, layout):
+        """용어+설명 레이아웃(textmetrics.TextLayout)에 맞는 창 (너비, 높이)"""
+        # 좌우 패딩 50px씩
+        width = max(self.MIN_WIDTH, min(self.MAX_WIDTH, layout.width + 100))
+        # 헤더 초기 추정값 36px + 용어/설명 (최소 70px) + 간격 20px + 위아래 패딩 40px씩
+        height = 36 + max(70, layout.height) + 20 + 40 * 2
+        height = max(self.MIN_HEIGHT, min(self.MAX_HEIGHT, height))
+        return width, height
+
+
+class WindowSettings:
+    """창 하나의 설정 (테마 / 전환 간격 / 크기 / 위치 / 흐르는 설명)
+
+    첫 창(slot None)은 지금까지처럼 config 최상위 키를 쓰고,
+    추가 창은 config["windows"][slot] 구역을 쓴다 (없는 키는 첫 창 값을 따름).
+    덱 / 재생 순서 / 복습 모드는 창과 무관하게 프로세스 전체에서 하나다 (복습 채점만 창마다, slot이 키).
+    """
+
+    def __init__(self, engine, slot=None):
+        self.engine = engine
+        self.slot = slot
+
+    def get(self, key, default=None):
+        config = self.engine.config
+        if self.slot is not None:
+            section = config.get('windows', {}).get(self.slot, {})
+            if key in section:
+                return section[key]
+        return config.get(key, default)
+
+    def update(self, **values):
+        config = self.engine.config
+        if self.slot is None:
+            config.update(values)
+        else:
+            # 저장 스냅샷과 공유하지 않도록 중첩 dict는 새로 만들어 교체
+            windows = dict(config.get('windows', {}))
+            windows[self.slot] = {**windows.get(self.slot, {}), **values}
+            config['windows'] = windows
+        self.engine.save_config()
+
+    @property
+    def theme(self):
+        return THEMES.get(self.get('theme_name'), THEMES[DEFAULT_CONFIG['theme_name']])
+
+    def set_theme(self, theme_name):
+        self.update(theme_name=theme_name)
+        return self.theme
+
+    @property
+    def interval_ms(self):
+        return self.get('interval_seconds') * 1000
+
+    def set_interval(self, seconds):
+        self.update(interval_seconds=seconds)
+
+    def set_marquee(self, enabled=None, speed=None):
+        """흐르는 설명 모드 켜기/끄기, 속도(px/s)"""
+        values = {}
+        if enabled is not None:
+            values['marquee_mode'] = enabled
+        if speed is not None:
+            values['marquee_speed'] = speed
+        self.update(**values)
+
+    def set_window_size(self, width, height):
+        self.update(width=width, height=height)
+
+    def set_position(self, x, y):
+        self.update(x=x, y=y)
+
+
+class MarqueeEngine:
+    def __init__(self, base_path, clock=time.time):
+        self.base_path = base_path
+        self.clock = clock  # 복습 모드 기한 계산용 (벤치마크에서는 가상 시계)
+        self.config_store = None
+        self.config = {}
+        self.decks = None  # 덱 라이브러리 (terms.json + decks/*.json)
+        self.deck_name = decks.DEFAULT_DECK
+        self.deck_shuffles = {}  # 덱 이름 -> 재생 순서 (덱을 바꿔도 덱별 위치 유지)
+        self.terms = []
+        self.shuffle = None  # 중복 없는 랜덤 재생 순서 (load_terms 후 생성)
+        self.srs = None  # 복습 모드(SRS) 스케줄러 - 켜져 있을 때만 생성
+        self.deck_watcher = None  # 덱 파일 변경 감시 (stat 폴링)
+        self.deck_reloading = False
+        self.pending_deck_update = None  # 백그라운드에서 읽은 변경분 (UI 스레드에서 적용)
+        self.last_index = 0  # 마지막으로 표시한 용어 인덱스
+        self.layout = LayoutCalculator()
+        self.main_window = WindowSettings(self)  # 첫 창 (config 최상위 키)
+
+    def load(self):
+        self.load_config()
+        self.load_terms()
+        if self.config.get('srs_mode'):
+            self.start_srs()
+
+    def close(self):
+        # 재생 위치와 아직 쓰지 않은 설정 저장
+        self.save_config()
+        self.config_store.close()
+        if self.srs is not None:
+            self.srs.close()
+
+    # --- 설정 ---
+    def load_config(self):
+        config_path = os.path.join(self.base_path, 'config.json')
+        self.config_store = configstore.ConfigStore(config_path)
+        self.config = self.config_store.load(DEFAULT_CONFIG)
+        if self.config.get("theme_name") not in THEMES:
+            self.config["theme_name"] = "Yellow"
+
+    def save_config(self):
+        if self.deck_shuffles:
+            # 덱별 재생 위치 (이번 실행에서 쓰지 않은 덱의 위치도 유지, 매번 새 dict로 교체)
+            saved = dict(self.config.get('deck_shuffles', {}))
+            for name, order in self.deck_shuffles.items():
+                saved[name] = order.state()
+            self.config['deck_shuffles'] = saved
+            self.config.pop('shuffle', None)
+        # 디스크 쓰기는 백그라운드에서 모아서 처리 (호출한 쪽은 표시만)
+        self.config_store.mark_dirty()
+
+    # 첫 창 설정 (창이 하나일 때와 벤치마크에서 쓰는 단축 경로)
+    @property
+    def theme(self):
+        return self.main_window.theme
+
+    def set_theme(self, theme_name):
+        return self.main_window.set_theme(theme_name)
+
+    @property
+    def interval_ms(self):
+        return self.main_window.interval_ms
+
+    def set_interval(self, seconds):
+        self.main_window.set_interval(seconds)
+
+    def set_marquee(self, enabled=None, speed=None):
+        self.main_window.set_marquee(enabled, speed)
+
+    def set_window_size(self, width, height):
+        self.main_window.set_window_size(width, height)
+
+    # --- 창 ---
+    def window_slots(self):
+        """열어야 할 창들 (첫 창 + config["windows"]의 추가 창)"""
+        return [None] + list(self.config.get('windows', {}))
+
+    def window(self, slot):
+        return self.main_window if slot is None else WindowSettings(self, slot)
+
+    def add_window(self, source=None):
+        """추가 창 구역 만들기 - source 창의 설정을 복사하고 조금 비켜서 배치"""
+        source = source or self.main_window
+        windows = self.config.get('windows', {})
+        slot = str(max((int(k) for k in windows if k.isdigit()), default=1) + 1)
+        values = {key: source.get(key) for key in WINDOW_KEYS if source.get(key) is not None}
+        values['x'] = source.get('x', 200) + 40
+        values['y'] = source.get('y', 200) + 40
+        self.config['windows'] = {**windows, slot: values}
+        self.save_config()
+        return WindowSettings(self, slot)
+
+    def remove_window(self, slot):
+        if self.srs is not None:
+            self.srs.grade_current(slot)  # 닫는 창에 표시 중이던 카드
+        windows = dict(self.config.get('windows', {}))
+        windows.pop(slot, None)
+        self.config['windows'] = windows
+        self.save_config()
+
+    # --- 덱 ---
+    def load_terms(self):
+        if self.decks is None:
+            self.decks = decks.DeckLibrary(self.base_path, self.config.get('deck_cache_mb', 200) * 2**20)
+        # 지난번에 쓰던 덱 (없어졌으면 기본 덱)
+        name = self.config.get('deck', decks.DEFAULT_DECK)
+        terms = self.open_deck(name)
+        if terms is None and name != decks.DEFAULT_DECK:
+            name = decks.DEFAULT_DECK
+            terms = self.open_deck(name)
+        if terms is None:
+            terms = [{"term": "Error", "desc": "terms.json 확인 필요"}]
+        self.set_deck(name, terms)
+
+    def deck_names(self):
+        names = self.decks.names()
+        if self.config.get('mixed_decks'):
+            names.append(decks.MIXED_DECK)
+        return names
+
+    def open_deck(self, name):
+        """덱 열기 - 혼합이면 config의 "mixed_decks" {덱 이름: 가중치}로 구성"""
+        if name != decks.MIXED_DECK:
+            self.decks.pin([name])
+            return self.decks.get(name)
+        weights = self.config.get('mixed_decks', {})
+        self.decks.pin(weights)
+        parts = []
+        for part, weight in weights.items():
+            if decks.mix_weight(weight) <= 0:
+                continue  # 가중치 0이면 열지도 않음
+            terms = self.decks.get(part)
+            if terms is not None and len(terms):
+                parts.append((part, terms, weight))
+        if not parts:
+            print("Mixed deck error: no deck with a positive weight in mixed_decks")
+            return None
+        return decks.MixedDeck(parts)
+
+    def set_deck(self, name, terms):
+        self.deck_name = name
+        self.terms = terms
+        if isinstance(terms, decks.MixedDeck):
+            # 구성 덱마다 자기 재생 순서를 그대로 사용
+            self.shuffle = decks.MixedOrder(terms, [self.deck_shuffle(n, len(t)) for n, t in zip(terms.names, terms.parts)])
+            self.deck_watcher = None  # 혼합 덱은 자동 다시 읽기 대상에서 제외
+        else:
+            self.shuffle = self.deck_shuffle(name, len(terms))
+            # 불러온 뒤(다른 덱을 보는 사이 포함) 파일이 바뀌었으면 첫 감시에서 다시 읽음
+            self.deck_watcher = deckwatch.DeckWatcher(self.decks.path_for(name), self.decks.signatures.get(name))
+
+    def deck_shuffle(self, name, size):
+        """덱의 재생 순서 - 지난 실행의 위치에서 이어서 (config.json의 "deck_shuffles")"""
+        order = self.deck_shuffles.get(name)
+        if order is None:
+            saved = self.config.get('deck_shuffles', {}).get(name)
+            if saved is None and name == decks.DEFAULT_DECK:
+                saved = self.config.get('shuffle')  # 덱이 하나뿐이던 때의 설정
+            order = shuffle.LazyShuffle.from_state(saved or {}, size)
+            self.deck_shuffles[name] = order
+        return order
+
+    def switch_deck(self, name):
+        """덱 전환 - 이미 불러온 덱이면 참조만 바꿈 (열 수 없으면 False)"""
+        terms = self.open_deck(name)
+        if terms is None:
+            print(f"Deck load error: {name}")
+            self.open_deck(self.deck_name)  # 고정 상태 복구
+            return False
+        srs_on = self.srs is not None
+        if srs_on:
+            self.stop_srs()
+        self.set_deck(name, terms)
+        if srs_on:
+            self.start_srs()
+        self.config['deck'] = name
+        self.save_config()
+        return True
+
+    # --- 덱 파일 변경 반영 (hot reload) ---
+    def check_deck(self):
+        """덱 파일이 바뀌었으면 백그라운드에서 다시 읽기 시작 (stat만 확인)"""
+        if not self.deck_reloading and self.deck_watcher is not None and self.deck_watcher.changed():
+            self.deck_reloading = True
+            threading.Thread(target=self.reload_deck_worker, args=(self.terms, self.deck_watcher.path, self.deck_watcher.signature),
+                             name="deck-reload", daemon=True).start()
+
+    def reload_deck_worker(self, terms, terms_path, signature):
+        """(백그라운드) 덱 파일을 다시 읽어 현재 덱과 비교 - 잘못된 파일이면 기존 덱 유지"""
+        try:
+            entries, sha1 = deckwatch.read_deck(terms_path)
+            update = deckwatch.diff_deck(terms, entries)
+            if update is not None and isinstance(terms, termpack.TermPack):
+                mtime_ns, size = signature
+                termpack.write_pack(update.entries, termpack.pack_path_for(terms_path) + ".new",
+                                    mtime_ns, size, sha1)
+            if update is not None:
+                self.pending_deck_update = (terms, update, signature)
+        except Exception as e:
+            print(f"Deck reload error: {e}")
+        finally:
+            self.deck_reloading = False
+
+    def take_deck_update(self):
+        """백그라운드에서 읽은 변경분이 있으면 적용하고 반환 (UI 스레드에서 호출)"""
+        pending, self.pending_deck_update = self.pending_deck_update, None
+        # 읽는 사이 다른 덱으로 바꿨으면 버림
+        if pending is None or pending[0] is not self.terms:
+            return None
+        update = pending[1]
+        self.apply_deck_update(update, pending[2])
+        return update
+
+    def apply_deck_update(self, update, signature=None):
+        """바뀐 용어만 반영하고 셔플/복습 위치는 유지"""
+        if isinstance(self.terms, termpack.TermPack):
+            pack_path = self.terms.path
+            try:
+                # Windows에서는 mmap으로 열린 파일을 교체할 수 없으므로 먼저 닫음
+                self.terms.close()
+                os.replace(pack_path + ".new", pack_path)
+                self.terms = termpack.TermPack(pack_path)
+            except Exception as e:
+                print(f"Term pack swap error: {e}")
+                self.terms = termpack.TermColumns.from_entries(update.entries)
+        else:
+            self.terms = termpack.TermColumns.from_entries(update.entries)
+
+        self.decks.replace(self.deck_name, self.terms, signature)
+        self.last_index = self.map_index(update, self.last_index)
+        self.sync_shuffle()
+        if self.srs is not None:
+            self.srs.remap(update.mapping, len(self.terms))
+
+    def map_index(self, update, idx):
+        """바뀌기 전 덱의 인덱스 -> 새 덱의 인덱스 (창마다 표시 중인 용어 유지용)"""
+        return update.mapping.get(idx, min(idx, len(self.terms) - 1))
+
+    # --- 복습 모드 ---
+    def start_srs(self):
+        import srs
+        # 복습 기록은 덱마다 따로
+        log_name = 'srs.log' if self.deck_name == decks.DEFAULT_DECK else f'srs-{self.deck_name}.log'
+        log_path = os.path.join(self.base_path, log_name)
+        self.srs = srs.SrsScheduler(log_path, lambda i: self.terms[i]['term'], len(self.terms), self.clock)
+
+    def stop_srs(self):
+        self.srs.close()
+        self.srs = None
+
+    def set_srs(self, enabled):
+        if enabled == (self.srs is not None):
+            return
+        if enabled:
+            self.start_srs()
+        else:
+            self.stop_srs()
+        self.config['srs_mode'] = enabled
+        self.save_config()
+
+    def lapse_current(self, idx=None, window=None):
+        """window(창 slot)에 표시 중인 용어를 클릭(검색)함 - 복습 모드에서는 모르는 용어로 채점"""
+        if self.srs is not None:
+            self.srs.lapse(self.last_index if idx is None else idx, window)
+
+    # --- 다음 용어 선택 ---
+    def sync_shuffle(self):
+        # 덱 크기가 바뀌었으면 이미 본 용어는 그대로 두고 늘어난 부분만 순서에 추가
+        if self.shuffle.n != len(self.terms):
+            self.shuffle.resize(len(self.terms))
+
+    def next_shuffle_index(self):
+        # 모든 용어를 한 번씩 소진할 때까지 중복 없이 랜덤 재생
+        self.sync_shuffle()
+        return self.shuffle.next()
+
+    def upcoming_indices(self, n):
+        """다음에 표시될 n개 인덱스 (사이클 경계를 넘어가도 실제 순서와 동일)"""
+        self.sync_shuffle()
+        if self.srs is not None:
+            # 복습 모드: 기한이 된 카드 하나 + 셔플 순서 (틀리면 틱에서 즉시 준비)
+            due = self.srs.peek_due()
+            if due is not None:
+                return [due] + self.shuffle.peek(n - 1)
+        return self.shuffle.peek(n)
+
+    def next_term_index(self, window=None):
+        """window(창 slot)에 보여줄 다음 용어 - 복습 모드에서는 그 창에 표시 중이던 카드를 채점하고 고름"""
+        if self.srs is not None:
+            self.srs.resize(len(self.terms))
+            return self.srs.next(self.next_shuffle_index, window)
+        return self.next_shuffle_index()
@@ -0,0 +1,26 @@
+"""리사이즈/줌 이벤트를 디스플레이 프레임당 최대 한 번의 레이아웃 패스로 합치는 스케줄러"""
+
+FRAME_MS = 16  # 60Hz 기준 한 프레임
+
+
+class FrameScheduler:
+    def __init__(self, root, callback, frame_ms=FRAME_MS):
+        self.root = root
+        self.callback = callback
+        self.frame_ms = frame_ms
+        self._job = None
+
+    def request(self, event=None):
+        """레이아웃 패스 요청 (같은 프레임 안의 요청은 한 번으로 합쳐짐)"""
+        if self._job is None:
+            self._job = self.root.after(self.frame_ms, self._run)
+
+    def _run(self):
+        self._job = None
+        self.callback()
+
+    def cancel(self):
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
@@ -0,0 +1,60 @@
+"""다음에 표시할 용어를 틱 사이 유휴 시간에 미리 준비하는 파이프라인
+
+update_term 틱 자체는 준비된 결과를 위젯에 적용만 하고,
+항목 디코딩 / 레이아웃 측정 / 태그 런 생성은 after_idle 조각으로 나눠 처리한다.
+"""
+from collections import deque
+
+
+class TermLookahead:
+    def __init__(self, root, prepare, upcoming, depth=5):
+        self.root = root
+        self.prepare = prepare    # idx -> 준비된 항목 (dict)
+        self.upcoming = upcoming  # n -> 앞으로 표시할 인덱스 목록
+        self.depth = depth
+        self.ready = {}
+        self._pending = deque()
+        self._planned = False
+        self._job = None
+
+    def refill(self):
+        """다음 유휴 시간부터 앞으로 표시할 용어들을 준비 (틱 직후 호출)"""
+        self._planned = False
+        if self._job is None:
+            self._job = self.root.after_idle(self._step)
+
+    def _plan(self):
+        upcoming = list(self.upcoming(self.depth))
+        wanted = set(upcoming)
+        for idx in list(self.ready):
+            if idx not in wanted:
+                del self.ready[idx]
+        self._pending = deque(i for i in upcoming if i not in self.ready)
+        self._planned = True
+
+    def _step(self):
+        # 한 번의 유휴 콜백에서는 한 가지 일만 처리해서 이벤트 처리를 막지 않음
+        self._job = None
+        if not self._planned:
+            self._plan()
+        elif self._pending:
+            idx = self._pending.popleft()
+            if idx not in self.ready:
+                self.ready[idx] = self.prepare(idx)
+        if self._pending:
+            self._job = self.root.after_idle(self._step)
+
+    def take(self, idx):
+        """준비된 항목을 꺼냄 (아직 준비 전이면 즉시 준비)"""
+        prepared = self.ready.pop(idx, None)
+        return prepared if prepared is not None else self.prepare(idx)
+
+    def reset(self):
+        """용어 목록이 바뀌었을 때 준비된 항목 폐기"""
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+        self.ready.clear()
+        self._pending.clear()
+        self._planned = False
+
@@ -0,0 +1,131 @@
+"""용어 찾아보기: 브라우저 검색은 작업 스레드에서, 자세한 설명은 로컬 SQLite에서
+
+- BrowserLauncher: webbrowser.open 은 데스크톱에 따라 수백 ms 걸리므로 UI 스레드에서 부르지 않는다.
+  작업 스레드 하나가 큐를 비우며, 연달아 클릭하면 아직 열지 않은 이전 요청은 버리고 마지막 것만 연다.
+- DefinitionStore: definitions.db (term -> 긴 설명) 에서 찾고, 최근 본 항목은 LRU로 메모리에 둔다.
+  네트워크 없이 쓰도록 JSON 파일에서 만들 수 있다:
+      python lookup.py definitions.json [definitions.db]
+  JSON 형식: {"용어": "설명", ...} 또는 [{"term": ..., "desc": ...}, ...]
+"""
+import json
+import os
+import pathlib
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+
+
+class BrowserLauncher:
+    def __init__(self):
+        self._pending = None
+        self._lock = threading.Condition()
+        self._thread = None
+        self.opened = 0
+
+    def open(self, url):
+        """바로 반환 - 실제로 여는 것은 작업 스레드"""
+        with self._lock:
+            self._pending = url
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="browser-open", daemon=True)
+                self._thread.start()
+            self._lock.notify()
+
+    def _run(self):
+        import webbrowser
+        while True:
+            with self._lock:
+                while self._pending is None:
+                    self._lock.wait()
+                url, self._pending = self._pending, None
+            try:
+                webbrowser.open(url)
+                self.opened += 1
+            except Exception as e:
+                print(f"Browser open error: {e}")
+
+
+class DefinitionStore:
+    def __init__(self, path, cache_size=64):
+        self.path = path
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # 용어 -> 설명 (없으면 None), 최근 본 것이 뒤
+        self._db = None
+        self._missing = False
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self):
+        if self._db is None and not self._missing:
+            if not os.path.exists(self.path):
+                self._missing = True  # 파일이 생기면 다음 실행부터 사용
+                return None
+            try:
+                uri = pathlib.Path(self.path).resolve().as_uri() + "?mode=ro"
+                self._db = sqlite3.connect(uri, uri=True)
+            except sqlite3.Error as e:
+                print(f"Definitions open error: {e}")
+                self._missing = True
+        return self._db
+
+    def get(self, term):
+        """자세한 설명 (없으면 None)"""
+        if term in self.cache:
+            self.cache.move_to_end(term)
+            self.hits += 1
+            return self.cache[term]
+        self.misses += 1
+        body = None
+        db = self._connect()
+        if db is not None:
+            try:
+                row = db.execute("SELECT body FROM definitions WHERE term = ?", (term,)).fetchone()
+                body = row[0] if row else None
+            except sqlite3.Error as e:
+                print(f"Definitions lookup error: {e}")
+        self.cache[term] = body
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return body
+
+    def recent(self, limit=5):
+        """최근 본 설명이 있는 용어 (최근 것 먼저)"""
+        terms = [t for t, body in reversed(self.cache.items()) if body is not None]
+        return terms[:limit]
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+def import_definitions(json_path, db_path):
+    """JSON 파일로 definitions.db 만들기 (임시 파일에 쓰고 교체)"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        rows = [(str(term), str(body)) for term, body in data.items()]
+    else:
+        rows = [(str(item['term']), str(item.get('desc', item.get('body', "")))) for item in data]
+    tmp_path = db_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    db = sqlite3.connect(tmp_path)
+    try:
+        db.execute("CREATE TABLE definitions (term TEXT PRIMARY KEY, body TEXT NOT NULL)")
+        db.executemany("INSERT OR REPLACE INTO definitions VALUES (?, ?)", rows)
+        db.commit()
+    finally:
+        db.close()
+    os.replace(tmp_path, db_path)
+    return len(rows)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("usage: python lookup.py definitions.json [definitions.db]")
+        sys.exit(1)
+    src = sys.argv[1]
+    dst = sys.argv[2] if len(sys.argv) > 2 else os.path.join(os.path.dirname(os.path.abspath(src)), 'definitions.db')
+    print(f"{import_definitions(src, dst)} definitions -> {dst}")
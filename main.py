@@ -1,17 +1,40 @@
+import sys
+if __name__ == "__main__" and "--tty" in sys.argv[1:]:
+    # 터미널 모드 (SSH / tmux): Tk를 불러오지 않고 시작
+    import ttymarquee
+    sys.exit(ttymarquee.main(sys.argv[1:]))
 import tkinter as tk
 from tkinter import ttk
-import json
+import tkinter.font as tkfont
 import os
-import sys
-import webbrowser
 import time  # [NEW] 클릭 시간 계산용
-import random  # 랜덤 재생용
+import threading  # [NEW] 백그라운드 작업 (검색 색인)
+import textmetrics  # [NEW] 위젯 없이 글자 크기 측정
+import lookahead  # [NEW] 다음 용어 미리 준비 (유휴 시간)
+import layoutsched  # [NEW] 프레임 단위 레이아웃 스케줄러
+import ticksched  # [NEW] monotonic 기한 기반 타이머 (여러 타임라인, after 하나)
+import animation  # [NEW] 하나의 프레임 시계로 hover/클릭 색 애니메이션
+import marquee  # [NEW] Canvas로 흐르는 설명 표시
+# srs, search, lookup(webbrowser, sqlite3) 은 처음 쓸 때 import (시작 시간 단축)
+import decks  # [NEW] 여러 덱 / 혼합 모드
+import engine  # [NEW] Tk와 무관한 엔진 (덱, 용어 선택, 설정, 레이아웃 계산)
+import studylog  # [NEW] 학습 기록 (표시/클릭/일시정지 -> 백그라운드에서 SQLite에 모아 쓰기)
+import powersave  # [NEW] 창이 가려졌거나 자리 비움이면 타이머 전체 정지
+
+class MarqueeApp:
+    """프로세스 하나에 마키 창 여러 개 (모니터마다 / 주제마다)
+
+    덱, 검색 색인, 재생 순서, 타이머 스케줄러, 애니메이터, 다음 용어 준비, 텍스트 측정기는
+    모든 창이 하나를 함께 쓰고, 창(TermMarquee)은 자기 위젯과 창별 설정만 가진다.
+    창별 설정(테마/간격/크기/위치/흐르는 설명)은 config.json의 "windows" 구역 (첫 창은 최상위 키).
+    """
+    DECK_POLL_MS = 2000  # terms.json 변경 확인 주기
+    PERSIST_MS = 60000  # 재생 위치 중간 저장 주기 (비정상 종료 대비)
 
-class TermMarquee:
     def __init__(self):
+        # 숨긴 루트 하나에 창마다 Toplevel (Tk 인터프리터 / 이벤트 루프는 하나)
         self.root = tk.Tk()
-        self.root.title("TermMarquee")
-        self.root.focus_force()
+        self.root.withdraw()
 
         # 경로 설정
         if getattr(sys, 'frozen', False):
@@ -19,93 +42,341 @@ class TermMarquee:
         else:
             self.base_path = os.path.dirname(os.path.abspath(__file__))
 
+        # 덱, 다음 용어 선택, 설정, 레이아웃 계산은 엔진이 담당하고 창은 위젯만 다룸
+        self.engine = engine.MarqueeEngine(self.base_path)
+        # 모든 창의 용어 전환 / 흐르는 설명 / 애니메이션 / 덱 감시 / 중간 저장을 after 하나로 구동
+        self.ticks = ticksched.TickScheduler(self.root)
+        self.windows = []
+        self.saved_ticks = 0  # 마지막 중간 저장 때의 전환 횟수
+        self.search_index = None  # 덱을 불러올 때마다 백그라운드에서 생성
+        self.browser = None  # 웹 검색 작업 스레드 (처음 검색할 때 생성)
+        self.definition_store = None  # 로컬 자세한 설명 (definitions.db, 처음 클릭할 때 열기)
+
+        self.engine.load()
+
+        # 학습 기록 (config의 "study_log": false 로 끌 수 있음)
+        self.study_log = None
+        if self.engine.config.get('study_log', True):
+            self.study_log = studylog.StudyLog(os.path.join(self.base_path, 'study.db'))
+
+        # 중앙 서버에서 terms.json 동기화 (config의 "deck_sync_url"이 있을 때만, 바뀐 파일은 deck-poll이 반영)
+        self.deck_sync = None
+        if self.engine.config.get('deck_sync_url'):
+            import decksync
+            self.deck_sync = decksync.from_config(self.engine.config, self.engine.decks.path_for(decks.DEFAULT_DECK))
+
+        # 성능 계측 (config의 "perf_monitor": true 또는 TERMMARQUEE_PERF=1 일 때만, 끄면 비용 없음)
+        self.perf = None
+        if self.engine.config.get('perf_monitor') or os.environ.get('TERMMARQUEE_PERF'):
+            import perfmon
+            self.perf = perfmon.PerfMonitor(self.ticks, os.path.join(self.base_path, 'perf.jsonl'))
+            self.perf.start()
+
+        # 창 크기 자동 조정용 텍스트 측정기 (공유 Font + LRU 캐시)
+        self.measurer = textmetrics.TextMeasurer(self.root)
+        # 다음 N개 용어를 틱 사이 유휴 시간에 미리 디코딩/측정 (창들이 같은 재생 순서에서 꺼냄)
+        self.lookahead = lookahead.TermLookahead(self.root, self.prepare_term, self.engine.upcoming_indices)
+        # hover/클릭 색 효과는 위젯별 after 대신 공용 프레임 시계로 보간
+        self.animator = animation.Animator(self.ticks)
+        # 절전: 모든 창이 가려졌거나 자리를 비우면 타이머를 모두 멈춤 (config의 "power_save": false 로 끔)
+        self.power = None
+        if self.engine.config.get('power_save', True):
+            self.power = powersave.PowerSaver(self.ticks, self.engine.config.get('idle_minutes', 5) * 60,
+                                              self.inactive_ms)
+            if self.deck_sync is not None:
+                # 타이머가 멈춘 동안은 동기화 스레드도 잠듦 (다시 보이면 바로 동기화)
+                self.power.listeners.append(self.deck_sync.set_suspended)
+
+        for slot in self.engine.window_slots():
+            self.open_window(self.engine.window(slot))
+
+        # terms.json이 바뀌면 재시작 없이 반영
+        self.ticks.add("deck-poll", self.DECK_POLL_MS / 1000, self.poll_deck)
+        self.ticks.add("persist", self.PERSIST_MS / 1000, self.persist_position)
+
+        # 시작 시간 측정 (benchmarks/bench_startup.py): 첫 화면이 그려지면 시각을 기록하고 종료
+        probe_path = os.environ.get('TERMMARQUEE_STARTUP_PROBE')
+        if probe_path:
+            self.root.after_idle(self.report_first_paint, probe_path)
+
+        self.root.mainloop()
+        # 창이 닫힌 뒤 재생 위치와 아직 쓰지 않은 설정 / 학습 기록 저장
+        self.engine.close()
+        if self.deck_sync is not None:
+            self.deck_sync.close()
+        if self.study_log is not None:
+            self.study_log.close()
+        if self.definition_store is not None:
+            self.definition_store.close()
+        if self.perf is not None:
+            self.perf.close()
+
+    # --- 창 ---
+    def open_window(self, settings):
+        window = TermMarquee(self, settings)
+        self.windows.append(window)
+        return window
+
+    def new_window(self, source):
+        """source 창의 설정을 복사해서 창 하나 더 열기"""
+        return self.open_window(self.engine.add_window(source.settings))
+
+    def close_window(self, window):
+        """추가 창은 그 창만 닫고 설정 구역도 지움, 첫 창을 닫으면 프로그램 종료"""
+        if window.settings.slot is None:
+            self.quit()
+            return
+        self.windows.remove(window)
+        self.engine.remove_window(window.settings.slot)
+        window.destroy()
+
+    def quit(self):
+        # 남은 설정은 mainloop 종료 직후 __init__에서 저장
+        self.root.destroy()
+
+    def inactive_ms(self):
+        """마지막 사용자 입력(이 앱 밖 포함) 후 지난 ms - 지원하지 않으면 -1"""
+        try:
+            return int(self.root.tk.call('tk', 'inactive'))
+        except tk.TclError:
+            return -1
+
+    def report_first_paint(self, probe_path):
+        try:
+            with open(probe_path, 'w', encoding='utf-8') as f:
+                f.write(f"{time.time():.6f}\n")
+        except Exception as e:
+            print(f"Startup probe error: {e}")
+        self.quit()
+
+    # --- 덱 (모든 창 공유) ---
+    def switch_deck(self, name):
+        """덱 전환 - 이미 불러온 덱이면 참조만 바꿈"""
+        if name == self.engine.deck_name:
+            return
+        start = time.perf_counter()
+        # 떠나는 덱의 검색 색인은 다시 돌아올 때 쓰도록 보관
+        if self.search_index is not None and not isinstance(self.engine.terms, decks.MixedDeck):
+            self.engine.decks.extras[self.engine.deck_name] = self.search_index
+        switched = self.engine.switch_deck(name)
+        if switched:
+            self.lookahead.reset()
+            self.build_search_index()
+        for window in self.windows:
+            window.on_deck_switched(switched)
+        if self.perf is not None:
+            self.perf.record_deck_switch(time.perf_counter() - start)
+
+    def persist_position(self, late=0.0):
+        """용어가 바뀌었으면 재생 위치 저장 (종료 시에도 저장됨)"""
+        fired = sum(window.term_timeline.fired for window in self.windows)
+        if fired != self.saved_ticks:
+            self.saved_ticks = fired
+            self.engine.save_config()
+
+    def poll_deck(self, late=0.0):
+        """덱 파일 변경 감시 (stat만 확인) + 백그라운드에서 읽은 변경분 적용"""
+        update = self.engine.take_deck_update()
+        if update is not None:
+            for window in self.windows:
+                window.current_index = self.engine.map_index(update, window.current_index)
+            self.lookahead.reset()
+            self.lookahead.refill()
+            self.build_search_index()
+            print(f"Deck reloaded: +{update.added} -{update.removed} ~{update.changed}")
+        self.engine.check_deck()
+
+    def set_srs(self, enabled):
+        self.engine.set_srs(enabled)
+        for window in self.windows:
+            window.refresh_srs_label()
+        # 미리 준비한 다음 용어 순서가 달라지므로 다시 준비
+        self.lookahead.reset()
+        self.lookahead.refill()
+
+    def build_search_index(self):
+        """검색 색인은 백그라운드 스레드에서 만들고, 완성되면 교체"""
+        if not any(window.drawer_built for window in self.windows):
+            return  # 설정창을 처음 열 때 만듦
+        import search
+        terms = self.engine.terms
+        cached = self.engine.decks.extras.get(self.engine.deck_name)
+        if cached is not None and cached.terms is terms:
+            self.search_index = cached
+            return
+        self.search_index = None
+
+        def worker():
+            try:
+                index = search.SearchIndex(terms)
+            except Exception as e:
+                print(f"Search index error: {e}")
+                return
+            # 그사이 덱이 바뀌었으면 버림
+            if terms is self.engine.terms:
+                self.search_index = index
+
+        threading.Thread(target=worker, name="search-index", daemon=True).start()
+
+    # --- 다음 용어 준비 (모든 창 공유) ---
+    def measure_term(self, term, desc):
+        """창 크기 계산용 텍스트 레이아웃 (설명은 최대 창 너비 800px - 패딩에서 줄바꿈)"""
+        return self.measurer.layout(term, desc, ("Malgun Gothic", 14, "bold"), ("Malgun Gothic", 12), 700)
+
+    def prepare_term(self, idx):
+        """틱에서 바로 적용할 수 있도록 항목 디코딩 + 레이아웃 측정 + 태그 런 생성"""
+        data = self.engine.terms[idx]
+        term, desc = data['term'], data['desc']
+        return {
+            'term': term,
+            'runs': (desc, "center"),  # Text.insert에 그대로 넘길 (텍스트, 태그) 런
+            'layout': self.measure_term(term, desc),
+        }
+
+    # --- 찾아보기 (모든 창 공유) ---
+    def search_web(self, term):
+        import lookup
+        if self.browser is None:
+            self.browser = lookup.BrowserLauncher()
+        # 브라우저 실행은 작업 스레드에서 (클릭 핸들러는 바로 반환)
+        self.browser.open(f"https://www.google.com/search?q={term} 뜻")
+
+    def definitions(self):
+        if self.definition_store is None:
+            import lookup
+            db_path = self.engine.config.get('definitions_db') or os.path.join(self.base_path, 'definitions.db')
+            self.definition_store = lookup.DefinitionStore(db_path)
+        return self.definition_store
+
+
+class TermMarquee:
+    """마키 창 하나 (Toplevel) - 덱 / 스케줄러 / 준비된 용어는 MarqueeApp과 공유"""
+    PERF_OVERLAY_MS = 500  # 성능 오버레이 갱신 주기
+    MARQUEE_SPEEDS = [30, 60, 90, 120, 180]  # 흐르는 설명 속도 (px/s)
+    # 성능 계측을 켰을 때 소요 시간을 기록할 콜백 (틱, 레이아웃, 창 이동/크기, 클릭/hover)
+    INSTRUMENTED = ("update_term", "layout_pass", "on_resize_window", "on_root_resize",
+                    "start_move", "do_move", "start_resize", "do_resize", "manual_zoom",
+                    "open_google_search", "on_term_enter", "on_term_leave")
+
+    def __init__(self, app, settings):
+        self.app = app
+        self.settings = settings  # 이 창의 설정 구역 (engine.WindowSettings)
+        self.window = tk.Toplevel(app.root)
+        self.window.title("TermMarquee")
+        self.window.focus_force()
+
+        # 공유 객체
+        self.engine = app.engine
+        self.ticks = app.ticks
+        self.lookahead = app.lookahead
+        self.animator = app.animator
+        self.perf = app.perf
+
         # 초기 변수
-        self.terms = []
-        self.config = {}
-        self.current_index = 0  # (예전 순차 재생용, 호환 유지)
-        self.timer_id = None
+        self.current_index = 0  # 이 창에 표시 중인 용어
         self.drawer_open = False
         self.drawer_width = 240  # 설정창 너비 확장 (시인성 향상)
-        self.is_paused = False 
+        self.is_paused = False
         self.font_scale = 1.0
         self.help_expanded = False  # 사용법이 펼쳐져 있는지 여부 (기본값: 닫힘)
-        self.shuffled_indices = []
-        self.shuffle_pos = 0
-        self.last_index = 0  # 마지막으로 표시한 용어 인덱스
-        
+        self.drawer_built = False  # 설정창은 처음 열 때 구성
+        self.search_result_indices = []
+        self.popover = None  # 자세한 설명 팝오버 (처음 열 때 구성)
+        self.popover_term = None
+
         # 스마트 클릭 변수
         self.click_start_time = 0
         self.click_start_pos = (0, 0)
-        
-        # 테마 정의
-        self.themes = {
-            "Yellow": {"bg": "#fff7d1", "header": "#e3d8a3", "fg": "#000000"},
-            "Pink":   {"bg": "#fccce4", "header": "#e3a8c3", "fg": "#000000"},
-            "Green":  {"bg": "#ccffcc", "header": "#a8e3a8", "fg": "#000000"},
-            "Blue":   {"bg": "#cceeff", "header": "#a8cee3", "fg": "#000000"},
-            "Purple": {"bg": "#e6ccff", "header": "#c3a8e3", "fg": "#000000"},
-            "Grey":   {"bg": "#f2f2f2", "header": "#d9d9d9", "fg": "#000000"},
-            "Dark":   {"bg": "#333333", "header": "#222222", "fg": "#ffffff"}
-        }
 
-        self.load_config()
-        self.load_terms()
+        self.perf_overlay = None
+        self.perf_overlay_timeline = None
+        if self.perf is not None:
+            # 바인딩에 메서드가 넘어가기 전에 교체 (창이 여럿이면 같은 히스토그램에 합산)
+            self.perf.instrument(self, self.INSTRUMENTED)
+
         self.setup_ui()
-        
-        # 첫 용어 로드
+
+        # 첫 용어 로드 후 전환 타이머 시작 (창마다 자기 간격)
+        self.term_timeline = self.ticks.add("term", self.settings.interval_ms / 1000, self.on_tick_timer)
         self.update_term()
-        
+
         # 첫 용어에 맞게 창 크기 자동 조정
-        self.root.update_idletasks()  # UI 업데이트 대기
+        self.window.update_idletasks()  # UI 업데이트 대기
         self.adjust_window_to_content()
-        
-        self.root.mainloop()
 
-    def load_config(self):
-        config_path = os.path.join(self.base_path, 'config.json')
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
-        except Exception:
-            self.config = {
-                "theme_name": "Yellow",
-                "interval_seconds": 10,
-                "width": 600,
-                "height": 300
-            }
-        
-        if self.config.get("theme_name") not in self.themes:
-            self.config["theme_name"] = "Yellow"
+    def destroy(self):
+        """추가 창 닫기 - 이 창의 타임라인과 애니메이션 등록만 정리 (공유 객체는 유지)"""
+        self.ticks.remove(self.term_timeline)
+        self.marquee.close()
+        self.layout_scheduler.cancel()
+        if self.perf_overlay_timeline: self.ticks.remove(self.perf_overlay_timeline)
+        self.animator.forget(self.window)
+        if self.app.study_log is not None:
+            self.app.study_log.hide(self)
+        if self.app.power is not None:
+            self.app.power.forget(self)
+        self.window.destroy()
+
+    def on_visibility(self, event):
+        if event.widget is not self.window:
+            return  # 자식 위젯의 Map/Unmap도 창 바인딩으로 들어옴
+        if event.type == tk.EventType.Unmap:
+            hidden = True
+        elif event.type == tk.EventType.Map:
+            hidden = False
+        else:
+            hidden = event.state == "VisibilityFullyObscured"
+        self.app.power.set_hidden(self, hidden)
 
-    def save_config(self):
-        config_path = os.path.join(self.base_path, 'config.json')
-        try:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
-        except Exception as e:
-            print(f"Config save error: {e}")
+    def close_app(self, event=None):
+        self.app.close_window(self)
 
-    def load_terms(self):
-        terms_path = os.path.join(self.base_path, 'terms.json')
-        try:
-            with open(terms_path, 'r', encoding='utf-8') as f:
-                self.terms = json.load(f)
-        except Exception:
-            self.terms = [{"term": "Error", "desc": "terms.json 확인 필요"}]
+    def on_deck_switched(self, switched):
+        """공유 덱이 바뀜 (실패했으면 선택만 되돌림)"""
+        if self.drawer_built:
+            self.combo_deck.set(self.engine.deck_name)
+        if not switched:
+            return
+        if self.drawer_built:
+            self.on_search_changed()
+        self.jump_to_term(self.engine.next_term_index(self.settings.slot))
+
+    def refresh_deck_list(self):
+        self.combo_deck.configure(values=self.engine.deck_names())
+
+    def change_deck(self, event=None):
+        self.app.switch_deck(self.combo_deck.get())
+        # Combobox의 파란색 하이라이트 제거를 위해 포커스를 다른 곳으로 이동
+        self.window.focus_set()
 
     def setup_ui(self):
-        self.root.overrideredirect(True) 
-        self.root.attributes('-topmost', True)
+        # 반응형 글꼴: 위젯마다 새 튜플을 넘기지 않고 공유 Font의 크기만 바꿈
+        self.fonts = {
+            'settings': tkfont.Font(root=self.window, family="Arial", size=20),
+            'play': tkfont.Font(root=self.window, family="MS Gothic", size=20, weight="bold"),
+            'close': tkfont.Font(root=self.window, family="Arial", size=17),
+            'term': tkfont.Font(root=self.window, family="Malgun Gothic", size=14, weight="bold"),
+            'desc': tkfont.Font(root=self.window, family="Malgun Gothic", size=12),
+        }
+        # 리사이즈/줌 이벤트는 프레임당 한 번의 레이아웃 패스로 합침
+        self.layout_scheduler = layoutsched.FrameScheduler(self.window, self.layout_pass)
+        # 지난번과 같은 크기면 None을 돌려주므로 창마다 따로
+        self.layout = engine.LayoutCalculator()
+
+        self.window.overrideredirect(True) 
+        self.window.attributes('-topmost', True)
         
         # 초기 창 크기는 임시로 설정 (나중에 adjust_window_to_content에서 조정됨)
-        w = self.config.get('width', 600)
-        h = self.config.get('height', 300)
-        self.root.geometry(f"{w}x{h}+200+200")
+        w = self.settings.get('width', 600)
+        h = self.settings.get('height', 300)
+        x = self.settings.get('x', 200)
+        y = self.settings.get('y', 200)
+        self.window.geometry(f"{w}x{h}+{x}+{y}")
         
-        current_theme = self.themes[self.config['theme_name']]
-        self.root.configure(bg="#888888")
+        current_theme = self.settings.theme
+        self.window.configure(bg="#888888")
 
-        self.container = tk.Frame(self.root, bg=current_theme['bg'])
+        self.container = tk.Frame(self.window, bg=current_theme['bg'])
         self.container.pack(fill='both', expand=True, padx=1, pady=1)
 
         # Drawer
@@ -126,7 +397,7 @@ class TermMarquee:
             text="⚙",
             bg=current_theme['header'],
             fg="#555555",
-            font=("Arial", 20),
+            font=self.fonts['settings'],
             cursor="hand2"
         )
         self.btn_settings.pack(side='left', padx=10, pady=2)
@@ -139,7 +410,7 @@ class TermMarquee:
             text="⏸",
             bg=current_theme['header'],
             fg="#555555",
-            font=("MS Gothic", 20, "bold"),  # 설정 아이콘과 동일한 크기로 조정
+            font=self.fonts['play'],  # 설정 아이콘과 동일한 크기로 조정
             cursor="hand2",
         )
         self.btn_play.pack(side='left', padx=(6, 0), pady=2)
@@ -151,14 +422,15 @@ class TermMarquee:
             text="✕",
             bg=current_theme['header'],
             fg="#555555",
-            font=("Arial", 17),
+            font=self.fonts['close'],
             cursor="hand2"
         )
         self.btn_close.pack(side='right', padx=10, pady=2)
-        self.btn_close.bind("<Button-1>", lambda e: self.root.destroy())
+        self.btn_close.bind("<Button-1>", self.close_app)
 
         self.header.bind("<Button-1>", self.start_move)
         self.header.bind("<B1-Motion>", self.do_move)
+        self.header.bind("<ButtonRelease-1>", self.end_move)
 
         # 중앙 콘텐츠 (헤더 아래에 배치, 타이틀 바 침범 방지)
         self.center_frame = tk.Frame(self.main_panel, bg=current_theme['bg'])
@@ -175,7 +447,7 @@ class TermMarquee:
             text="",
             bg=current_theme['bg'],
             fg=current_theme['fg'],
-            font=("Malgun Gothic", 14, "bold"),
+            font=self.fonts['term'],
             cursor="hand2",
             justify="center"
         )
@@ -189,6 +461,7 @@ class TermMarquee:
         # 설명 (Text 위젯)
         self.desc_text = tk.Text(self.content_container, height=3, width=30,
                                  bg=current_theme['bg'], fg=current_theme['fg'],
+                                 font=self.fonts['desc'],
                                  bd=0, highlightthickness=0, cursor="xterm")
         self.desc_text.tag_configure("center", justify='center')
         self.desc_text.pack(fill='both', expand=True)
@@ -197,9 +470,29 @@ class TermMarquee:
         self.desc_text.bind("<Button-1>", lambda e: "break")
         self.desc_text.bind("<B1-Motion>", lambda e: "break")
         # Text 위젯에도 클릭 애니메이션 추가
-        self.add_click_animation(self.desc_text)
-
-        self.root.bind_all("<Control-MouseWheel>", self.manual_zoom)
+        self.animator.register(self.desc_text)
+
+        # 흐르는 설명(마키) 모드: 켜면 용어/설명 위젯 대신 Canvas에 그림
+        self.marquee_on = False
+        self.marquee = marquee.MarqueeCanvas(self.center_frame, self.ticks, self.fonts['term'], self.fonts['desc'],
+                                             current_theme['bg'], current_theme['fg'],
+                                             self.settings.get('marquee_speed', 60))
+        self.marquee.canvas.tag_bind("term", "<Button-1>", self.open_google_search)
+        self.marquee.canvas.tag_bind("term", "<Enter>", lambda e: self.marquee.canvas.config(cursor="hand2"))
+        self.marquee.canvas.tag_bind("term", "<Leave>", lambda e: self.marquee.canvas.config(cursor=""))
+        if self.settings.get('marquee_mode'):
+            self.set_marquee_mode(True)
+
+        # bind_all 대신 창에 바인딩 (창마다 자기 글자 크기 / 오버레이)
+        self.window.bind("<Control-MouseWheel>", self.manual_zoom)
+        if self.perf is not None:
+            self.window.bind("<F12>", self.toggle_perf_overlay)
+        if self.app.power is not None:
+            # 최소화 / 숨김 / 완전히 가려짐 추적, 창 위 입력은 자리 비움에서 바로 복귀
+            for sequence in ("<Map>", "<Unmap>", "<Visibility>"):
+                self.window.bind(sequence, self.on_visibility, add="+")
+            for sequence in ("<Enter>", "<ButtonPress>", "<KeyPress>"):
+                self.window.bind(sequence, lambda e: self.app.power.activity(), add="+")
 
         # 리사이즈 그립
         self.grip = tk.Label(self.main_panel, text="⇲", font=("ui-icons", 12), bg=current_theme['bg'], fg="#aaaaaa", cursor="sizing")
@@ -207,27 +500,19 @@ class TermMarquee:
         self.grip.bind("<Button-1>", self.start_resize)
         self.grip.bind("<B1-Motion>", self.do_resize)
 
-        self.setup_drawer_ui()
         self.main_panel.bind("<Configure>", self.on_resize_window)
-        self.root.bind("<Configure>", self.on_root_resize)
+        self.window.bind("<Configure>", self.on_root_resize)
         
         # 초기 타이틀 바 크기 설정 (모든 UI 구성 후)
-        self.root.update_idletasks()
-        self.apply_responsive_header()
+        self.window.update_idletasks()
+        self.layout_pass()
 
-        # 공통 버튼 피드백/애니메이션 효과 적용
-        self.add_button_feedback(self.btn_settings, hover_bg="#d6c89a", active_bg="#c9bc8f")
-        self.add_button_feedback(self.btn_play, hover_bg="#d6c89a", active_bg="#c9bc8f")
-        self.add_button_feedback(self.btn_close, hover_bg="#d6c89a", active_bg="#c98f8f")
-        self.add_button_feedback(self.term_label, hover_bg=current_theme['bg'], active_bg=current_theme['bg'])
-        self.add_button_feedback(self.grip, hover_bg="#dddddd", active_bg="#cccccc")
-        
-        # 모든 클릭 가능한 위젯에 클릭 애니메이션 추가
-        self.add_click_animation(self.btn_settings)
-        self.add_click_animation(self.btn_play)
-        self.add_click_animation(self.btn_close)
-        self.add_click_animation(self.term_label)
-        self.add_click_animation(self.grip)
+        # 공통 버튼 피드백/애니메이션 효과 적용 (모든 클릭 가능한 위젯)
+        self.animator.register(self.btn_settings, hover="#d6c89a", active="#c9bc8f")
+        self.animator.register(self.btn_play, hover="#d6c89a", active="#c9bc8f")
+        self.animator.register(self.btn_close, hover="#d6c89a", active="#c98f8f")
+        self.animator.register(self.term_label)
+        self.animator.register(self.grip, hover="#dddddd", active="#cccccc")
 
     def setup_drawer_ui(self):
         bg_color = "#f9f9f9"
@@ -242,6 +527,74 @@ class TermMarquee:
         )
         lbl_title.pack(pady=(10, 10))
 
+        # 용어 검색 섹션 (입력하는 대로 용어/설명에서 찾기, 초성 검색 가능)
+        search_section = tk.Frame(self.drawer_panel, bg=bg_color)
+        search_section.pack(fill='x', padx=12, pady=(0, 10))
+
+        lbl_search = tk.Label(
+            search_section,
+            text="용어 검색",
+            font=("Malgun Gothic", 9, "bold"),
+            bg=bg_color,
+            fg="#555555"
+        )
+        lbl_search.pack(anchor="w", pady=(0, 4))
+
+        self.search_entry = tk.Entry(search_section, font=("Malgun Gothic", 9), relief="solid", bd=1)
+        self.search_entry.pack(fill='x')
+        self.search_entry.bind("<KeyRelease>", self.on_search_changed)
+        # overrideredirect 창은 클릭만으로 키보드 포커스를 못 받는 경우가 있어 직접 요청
+        self.search_entry.bind("<Button-1>", lambda e: self.search_entry.focus_force(), add="+")
+
+        self.search_results = tk.Listbox(
+            search_section,
+            height=5,
+            font=("Malgun Gothic", 9),
+            relief="solid",
+            bd=1,
+            highlightthickness=0,
+            activestyle="none"
+        )
+        self.search_results.pack(fill='x', pady=(4, 0))
+        self.search_results.bind("<<ListboxSelect>>", self.on_search_select)
+
+        # 덱 선택 섹션 (terms.json + decks 폴더, 혼합 모드)
+        deck_section = tk.Frame(self.drawer_panel, bg=bg_color)
+        deck_section.pack(fill='x', padx=12, pady=(0, 10))
+
+        lbl_deck = tk.Label(
+            deck_section,
+            text="덱",
+            font=("Malgun Gothic", 9, "bold"),
+            bg=bg_color,
+            fg="#555555"
+        )
+        lbl_deck.pack(side='left')
+
+        self.combo_deck = ttk.Combobox(
+            deck_section,
+            state="readonly",
+            width=14,
+            postcommand=self.refresh_deck_list  # 펼칠 때마다 decks 폴더 다시 확인
+        )
+        self.refresh_deck_list()
+        self.combo_deck.set(self.engine.deck_name)
+        self.combo_deck.pack(side='left', padx=(8, 0))
+        self.combo_deck.bind("<<ComboboxSelected>>", self.change_deck)
+
+        # 창 하나 더 (같은 덱을 공유, 테마/간격/위치는 창마다)
+        lbl_new_window = tk.Label(
+            deck_section,
+            text="＋ 새 창",
+            font=("Malgun Gothic", 9),
+            bg=bg_color,
+            fg="#555555",
+            cursor="hand2"
+        )
+        lbl_new_window.pack(side='right')
+        lbl_new_window.bind("<Button-1>", lambda e: self.app.new_window(self))
+        self.animator.register(lbl_new_window)
+
         # 전환 시간 섹션 (간격 축소)
         time_section = tk.Frame(self.drawer_panel, bg=bg_color)
         time_section.pack(fill='x', padx=12, pady=(0, 10))
@@ -262,7 +615,7 @@ class TermMarquee:
             state="readonly",
             width=8
         )
-        self.combo_time.set(self.config['interval_seconds'])
+        self.combo_time.set(self.settings.get('interval_seconds'))
         self.combo_time.pack(side='left', padx=(8, 0))
         self.combo_time.bind("<<ComboboxSelected>>", self.change_interval)
 
@@ -283,7 +636,7 @@ class TermMarquee:
         color_frame.pack(anchor="w")
 
         col = 0
-        for name, colors in self.themes.items():
+        for name, colors in engine.THEMES.items():
             btn = tk.Label(
                 color_frame,
                 text="  ",
@@ -297,10 +650,67 @@ class TermMarquee:
             btn.grid(row=0, column=col, padx=2, pady=2)  # 모두 row=0에 배치하여 한 줄로
             btn.bind("<Button-1>", lambda e, n=name: self.change_theme(n))
             # 테마 칩에도 피드백 효과 적용
-            self.add_button_feedback(btn, hover_bg=colors['header'], active_bg=colors['bg'])
-            self.add_click_animation(btn)
+            self.animator.register(btn, hover=colors['header'])
             col += 1
 
+        # 흐르는 설명 섹션 (켜기/끄기 + 속도 + 프레임 시간 측정값)
+        marquee_section = tk.Frame(self.drawer_panel, bg=bg_color)
+        marquee_section.pack(fill='x', padx=12, pady=(0, 6))
+
+        marquee_row = tk.Frame(marquee_section, bg=bg_color)
+        marquee_row.pack(fill='x')
+
+        self.lbl_marquee = tk.Label(
+            marquee_row,
+            text=self.marquee_label_text(),
+            font=("Malgun Gothic", 9, "bold"),
+            bg=bg_color,
+            fg="#555555",
+            cursor="hand2"
+        )
+        self.lbl_marquee.pack(side='left')
+        self.lbl_marquee.bind("<Button-1>", self.toggle_marquee)
+        self.animator.register(self.lbl_marquee)
+
+        self.combo_speed = ttk.Combobox(
+            marquee_row,
+            values=self.MARQUEE_SPEEDS,
+            state="readonly",
+            width=5
+        )
+        self.combo_speed.set(self.marquee.speed)
+        self.combo_speed.pack(side='left', padx=(8, 0))
+        self.combo_speed.bind("<<ComboboxSelected>>", self.change_marquee_speed)
+
+        lbl_speed_unit = tk.Label(marquee_row, text="px/s", font=("Malgun Gothic", 8), bg=bg_color, fg="#888888")
+        lbl_speed_unit.pack(side='left', padx=(4, 0))
+
+        self.lbl_marquee_meter = tk.Label(
+            marquee_section,
+            text="",
+            font=("Malgun Gothic", 8),
+            bg=bg_color,
+            fg="#888888"
+        )
+        self.lbl_marquee_meter.pack(anchor="w")
+        self.marquee.on_meter = self.update_marquee_meter
+
+        # 복습 모드 섹션 (클릭한 용어는 자주, 아는 용어는 점점 드물게)
+        srs_section = tk.Frame(self.drawer_panel, bg=bg_color)
+        srs_section.pack(fill='x', padx=12, pady=(0, 6))
+
+        self.lbl_srs = tk.Label(
+            srs_section,
+            text=self.srs_label_text(),
+            font=("Malgun Gothic", 9, "bold"),
+            bg=bg_color,
+            fg="#555555",
+            cursor="hand2"
+        )
+        self.lbl_srs.pack(anchor="w")
+        self.lbl_srs.bind("<Button-1>", self.toggle_srs)
+        self.animator.register(self.lbl_srs)
+
         # 구분선 (간격 축소)
         tk.Frame(self.drawer_panel, height=1, bg="#dddddd").pack(fill='x', padx=12, pady=(6, 8))
         
@@ -336,8 +746,8 @@ class TermMarquee:
         # 클릭 이벤트 바인딩
         help_title.bind("<Button-1>", self.toggle_help)
         self.help_icon.bind("<Button-1>", self.toggle_help)
-        self.add_click_animation(help_title)
-        self.add_click_animation(self.help_icon)
+        self.animator.register(help_title)
+        self.animator.register(self.help_icon)
         
         # 사용법 내용 컨테이너 (기본값: 닫혀있으므로 생성만 하고 표시하지 않음)
         self.help_content = tk.Frame(help_section, bg=bg_color)
@@ -348,7 +758,13 @@ class TermMarquee:
             "• 상단 바 드래그: 창 이동",
             "• ⏸/▶: 일시정지/재생",
             "• ⚙: 설정 열기/닫기",
-            "• 용어 클릭: 구글 검색",
+            "• ＋ 새 창: 같은 덱으로 창 추가 (✕: 추가 창만 닫기)",
+            "• 용어 클릭: 자세한 설명(definitions.db) 또는 구글 검색",
+            "• 용어 검색: 초성(ㅂㄷㄱ)도 가능",
+            "• 복습 모드: 클릭한 용어를 더 자주",
+            "• 덱: decks 폴더의 *.json 추가",
+            "• 흐르는 설명: 긴 설명을 옆으로 흘려 보기",
+            "• F12: 성능 오버레이 (계측 켠 경우)",
             "• Ctrl+휠: 글자 크기",
             "• ⇲: 창 크기 조절"
         ]
@@ -364,11 +780,17 @@ class TermMarquee:
                 justify="left"
             )
             lbl_item.pack(anchor="w", pady=(0, 3))  # 각 줄 사이에 3px 패딩
-            self.add_click_animation(lbl_item)
+            self.animator.register(lbl_item)
 
     def toggle_drawer(self, event=None):
-        current_w = self.root.winfo_width()
-        current_h = self.root.winfo_height()
+        current_w = self.window.winfo_width()
+        current_h = self.window.winfo_height()
+
+        if not self.drawer_built:
+            # 설정창 위젯과 검색 색인은 첫 화면에 필요 없으므로 처음 열 때 만듦
+            self.setup_drawer_ui()
+            self.drawer_built = True
+            self.app.build_search_index()
 
         if self.drawer_open:
             self.drawer_panel.pack_forget()
@@ -379,55 +801,26 @@ class TermMarquee:
             new_w = current_w + self.drawer_width
             self.drawer_open = True
             
-        self.root.geometry(f"{new_w}x{current_h}")
-
-    # 공통 버튼 피드백 + 간단한 애니메이션 (배경색 변화) 유틸
-    def add_button_feedback(self, widget, hover_bg, active_bg):
-        normal_bg = widget.cget("bg")
-
-        def on_enter(e):
-            widget.config(bg=hover_bg)
-
-        def on_leave(e):
-            widget.config(bg=normal_bg)
-
-        def on_click_flash():
-            widget.config(bg=active_bg)
-            # 120ms 후 살짝 밝은 색으로 복구
-            widget.after(120, lambda: widget.config(bg=hover_bg))
-
-        def on_button(e):
-            # 기존에 걸려 있던 클릭 동작은 그대로 두고, 시각 효과만 추가
-            on_click_flash()
-
-        widget.bind("<Enter>", on_enter, add="+")
-        widget.bind("<Leave>", on_leave, add="+")
-        widget.bind("<Button-1>", on_button, add="+")
+        self.window.geometry(f"{new_w}x{current_h}")
+
+    def toggle_perf_overlay(self, event=None):
+        """성능 오버레이 (루프 지연, 틱 오차, 느린 콜백) 켜기/끄기"""
+        if self.perf_overlay is not None:
+            self.ticks.remove(self.perf_overlay_timeline)
+            self.perf_overlay_timeline = None
+            self.perf_overlay.destroy()
+            self.perf_overlay = None
+            return
+        self.perf_overlay = tk.Label(self.main_panel, font=("Consolas", 8), bg="#000000", fg="#33ff33",
+                                     justify="left", anchor="nw")
+        self.perf_overlay.place(x=4, rely=1.0, y=-4, anchor="sw")
+        self.refresh_perf_overlay()
+        # 다른 타이머와 같은 스케줄러 - 창이 모두 가려지면 오버레이 갱신도 멈춤
+        self.perf_overlay_timeline = self.ticks.add("perf-overlay", self.PERF_OVERLAY_MS / 1000,
+                                                    self.refresh_perf_overlay)
 
-    def add_click_animation(self, widget):
-        """모든 위젯에 클릭 애니메이션 효과 추가"""
-        def on_click(e):
-            # 클릭 시 작은 이펙트 (약간 어둡게 → 원래대로)
-            try:
-                # 현재 배경색 저장
-                current_bg = widget.cget("bg")
-                
-                # 어두운 색으로 변경
-                widget.config(bg="#cccccc")
-                
-                # 100ms 후 원래 색으로 복구 (클로저 문제 해결을 위해 기본 인자 사용)
-                def restore_bg(bg_color=current_bg):
-                    try:
-                        widget.config(bg=bg_color)
-                    except:
-                        pass
-                
-                widget.after(100, restore_bg)
-            except:
-                # bg 속성이 없거나 변경할 수 없는 위젯은 스킵
-                pass
-        
-        widget.bind("<Button-1>", on_click, add="+")
+    def refresh_perf_overlay(self, late=0.0):
+        self.perf_overlay.config(text=self.perf.overlay_text())
 
     def toggle_help(self, event=None):
         """사용법 펼치기/접기"""
@@ -444,40 +837,113 @@ class TermMarquee:
         if self.is_paused:
             self.is_paused = False
             self.btn_play.config(text="⏸") 
-            self.update_term()
+            # 멈췄을 때 남아 있던 시간만큼 기다렸다가 전환
+            self.term_timeline.resume()
+            if self.app.study_log is not None:
+                self.app.study_log.resume(self)
         else:
             self.is_paused = True
             self.btn_play.config(text="▶") 
-            if self.timer_id:
-                self.root.after_cancel(self.timer_id)
+            self.term_timeline.pause()
+            if self.app.study_log is not None:
+                self.app.study_log.pause(self)
+
+    def marquee_label_text(self):
+        return ("☑" if self.marquee_on else "☐") + " 흐르는 설명"
+
+    def set_marquee_mode(self, on):
+        self.marquee_on = on
+        if on:
+            self.content_container.place_forget()
+            self.marquee.show_widget(relx=0, rely=0, relwidth=1, relheight=1)
+        else:
+            self.marquee.hide_widget()
+            self.content_container.place(relx=0.5, rely=0.5, anchor="center", relwidth=0.95)
+        # 지금 용어를 새 표시 방식으로 다시 그림
+        if self.engine.terms:
+            self.show_term(self.current_index)
+
+    def toggle_marquee(self, event=None):
+        self.set_marquee_mode(not self.marquee_on)
+        self.settings.set_marquee(enabled=self.marquee_on)
+        self.lbl_marquee.config(text=self.marquee_label_text())
+        if not self.marquee_on:
+            self.lbl_marquee_meter.config(text="")
+
+    def change_marquee_speed(self, event=None):
+        speed = int(self.combo_speed.get())
+        self.marquee.set_speed(speed)
+        self.settings.set_marquee(speed=speed)
+        # Combobox의 파란색 하이라이트 제거를 위해 포커스를 다른 곳으로 이동
+        self.window.focus_set()
 
-    def change_interval(self, event):
-        val = int(self.combo_time.get())
-        self.config['interval_seconds'] = val
-        self.save_config()
+    def update_marquee_meter(self, meter):
+        # 1초에 한 번, 설정창이 열려 있을 때만 표시 갱신
+        if self.drawer_open:
+            self.lbl_marquee_meter.config(text=meter.text())
+
+    def srs_label_text(self):
+        return ("☑" if self.engine.srs is not None else "☐") + " 복습 모드 (SRS)"
+
+    def toggle_srs(self, event=None):
+        self.app.set_srs(self.engine.srs is None)
+
+    def refresh_srs_label(self):
+        if self.drawer_built:
+            self.lbl_srs.config(text=self.srs_label_text())
+
+    def on_search_changed(self, event=None):
+        query = self.search_entry.get()
+        self.search_results.delete(0, "end")
+        self.search_result_indices = []
+        if not query.strip():
+            return
+        if self.app.search_index is None:
+            self.search_results.insert("end", "색인 준비 중...")
+            return
+        self.search_result_indices = self.app.search_index.search(query)
+        for idx in self.search_result_indices:
+            self.search_results.insert("end", self.engine.terms[idx]['term'])
+
+    def on_search_select(self, event=None):
+        selection = self.search_results.curselection()
+        if not selection or selection[0] >= len(self.search_result_indices):
+            return
+        self.jump_to_term(self.search_result_indices[selection[0]])
+
+    def jump_to_term(self, idx):
+        """검색 결과로 바로 이동 (전환 타이머는 처음부터 다시)"""
+        self.show_term(idx)
         if not self.is_paused:
-            self.update_term()
+            self.term_timeline.reset()
+
+    def change_interval(self, event):
+        self.settings.set_interval(int(self.combo_time.get()))
+        # 이번 전환까지 지난 시간은 유지하고 새 간격으로 기한만 다시 계산
+        self.term_timeline.set_interval(self.settings.interval_ms / 1000)
         
         # Combobox의 파란색 하이라이트 제거를 위해 포커스를 다른 곳으로 이동
-        self.root.focus_set()
+        self.window.focus_set()
 
     def change_theme(self, theme_name):
-        self.config['theme_name'] = theme_name
-        self.save_config()
-        t = self.themes[theme_name]
+        t = self.settings.set_theme(theme_name)
         
         self.container.config(bg=t['bg'])
         self.main_panel.config(bg=t['bg'])
         self.header.config(bg=t['header'])
-        self.btn_settings.config(bg=t['header'])
-        self.btn_play.config(bg=t['header'])
-        self.btn_close.config(bg=t['header'])
+        self.animator.set_rest(self.btn_settings, t['header'])
+        self.animator.set_rest(self.btn_play, t['header'])
+        self.animator.set_rest(self.btn_close, t['header'])
         self.center_frame.config(bg=t['bg'])
         self.content_container.config(bg=t['bg'])
         
-        self.term_label.config(bg=t['bg'], fg=t['fg'])
-        self.desc_text.config(bg=t['bg'], fg=t['fg'])
-        self.grip.config(bg=t['bg'])
+        self.term_label.config(fg=t['fg'])
+        self.desc_text.config(fg=t['fg'])
+        # 애니메이션 중이던 효과도 새 테마 색으로 끝나도록
+        self.animator.set_rest(self.term_label, t['bg'])
+        self.animator.set_rest(self.desc_text, t['bg'])
+        self.animator.set_rest(self.grip, t['bg'])
+        self.marquee.set_colors(t['bg'], t['fg'])
 
     def manual_zoom(self, event):
         if event.delta > 0:
@@ -485,116 +951,67 @@ class TermMarquee:
         else:
             self.font_scale -= 0.1
         if self.font_scale < 0.5: self.font_scale = 0.5
-        self.apply_responsive_font()
+        self.layout_scheduler.request()
 
     def on_resize_window(self, event):
         if event.widget == self.main_panel:
-            self.apply_responsive_font()
-            self.apply_responsive_header()
+            self.layout_scheduler.request()
 
     def on_root_resize(self, event):
         """루트 윈도우 크기 변경 시 타이틀 바 높이 조절"""
-        if event.widget == self.root:
-            self.apply_responsive_header()
+        if event.widget == self.window:
+            self.layout_scheduler.request()
+
+    def layout_pass(self):
+        """프레임당 최대 한 번 실행: 계산된 크기가 바뀐 경우에만 위젯에 반영"""
+        changed = self.apply_responsive_font()
+        if changed and self.marquee_on:
+            self.marquee.layout()  # 글자 크기가 바뀌어 설명 폭을 다시 잼
+        self.apply_responsive_header()
 
     def apply_responsive_header(self):
-        """타이틀 바 높이를 창 크기에 비례하여 조절"""
-        height = self.root.winfo_height()
-        if height <= 1: return
+        """타이틀 바 높이를 창 크기에 비례하여 조절 (크기가 그대로면 위젯을 다시 설정하지 않음)"""
+        layout = self.layout.header_for(self.window.winfo_height())
+        if layout is None: return False
+        header_height, icon_size, close_icon_size = layout
         
-        # 창 높이의 9.6%로 설정 (기존 12%의 80%), 최소 28px, 최대 48px
-        header_height = max(28, min(48, int(height * 0.096)))
         self.header.config(height=header_height)
-        
-        # 아이콘 크기도 타이틀 바 높이에 비례하여 조절 (80%로 축소)
-        icon_size = max(11, min(18, int(header_height * 0.5)))
-        play_icon_size = icon_size  # 일시정지와 재생 아이콘 크기를 동일하게
-        close_icon_size = max(10, min(15, int(header_height * 0.42)))
-        
-        self.btn_settings.config(font=("Arial", icon_size))
-        self.btn_play.config(font=("MS Gothic", play_icon_size, "bold"))
-        self.btn_close.config(font=("Arial", close_icon_size))
+        self.fonts['settings'].configure(size=icon_size)
+        self.fonts['play'].configure(size=icon_size)
+        self.fonts['close'].configure(size=close_icon_size)
+        return True
 
     def apply_responsive_font(self):
-        width = self.main_panel.winfo_width()
-        if width <= 1: return
-
-        base_size = int(width / 25)
-        new_size = int(base_size * self.font_scale)
-        if new_size < 10: new_size = 10
+        new_size = self.layout.font_size_for(self.main_panel.winfo_width(), self.font_scale)
+        if new_size is None: return False
         
-        self.term_label.configure(font=("Malgun Gothic", new_size, "bold"))
-        self.desc_text.configure(font=("Malgun Gothic", new_size - 2))
+        self.fonts['term'].configure(size=new_size)
+        self.fonts['desc'].configure(size=new_size - 2)
+        return True
 
     def adjust_window_to_content(self):
         """현재 표시된 용어와 설명에 맞게 창 크기를 자동 조정"""
-        if not self.terms or not hasattr(self, 'term_label'):
+        if not self.engine.terms or not hasattr(self, 'term_label'):
             return
         
-        # 현재 표시된 용어와 설명 가져오기
-        current_term_text = self.term_label.cget("text")
-        self.desc_text.config(state='normal')
-        current_desc_text = self.desc_text.get("1.0", "end-1c")
-        self.desc_text.config(state='disabled')
+        # 현재 표시된 용어와 설명 가져오기 (흐르는 설명 모드에서도 같은 기준)
+        data = self.engine.terms[self.current_index]
+        current_term_text, current_desc_text = data['term'], data['desc']
         
         if not current_term_text:
             return
         
-        # 텍스트 크기 측정
-        term_font = ("Malgun Gothic", 14, "bold")
-        desc_font = ("Malgun Gothic", 12)
-        
-        # 임시 Label로 용어 너비 측정
-        temp_label = tk.Label(self.root, text=current_term_text, font=term_font)
-        temp_label.update_idletasks()
-        term_width = temp_label.winfo_reqwidth()
-        temp_label.destroy()
-        
-        # 설명 텍스트 너비 측정 (최대 너비 제한 고려)
-        desc_lines = current_desc_text.split('\n')
-        max_desc_width = 0
-        for line in desc_lines:
-            if line.strip():
-                temp_label = tk.Label(self.root, text=line, font=desc_font)
-                temp_label.update_idletasks()
-                line_width = temp_label.winfo_reqwidth()
-                max_desc_width = max(max_desc_width, line_width)
-                temp_label.destroy()
-        
-        # 필요한 너비 계산 (패딩 포함)
-        content_width = max(term_width, max_desc_width) + 100  # 좌우 패딩 50px씩
-        min_width = 400
-        max_width = 800
-        window_width = max(min_width, min(max_width, content_width))
-        
-        # 필요한 높이 계산
-        # 헤더 높이 (창 높이의 9.6%, 최소 28px, 최대 48px)
-        estimated_header_height = 36  # 초기 추정값 (기존 45의 80%)
-        # 용어 높이
-        term_height = 30
-        # 설명 높이 (줄 수에 따라)
-        desc_line_count = len([line for line in desc_lines if line.strip()])
-        desc_height = max(40, desc_line_count * 20) + 20  # 최소 40px, 줄당 20px
-        # 위아래 패딩 (동일하게)
-        padding = 40  # 위아래 각 40px
-        
-        content_height = term_height + desc_height + padding * 2
-        window_height = estimated_header_height + content_height
-        
-        # 최소/최대 높이 제한
-        min_height = 250
-        max_height = 500
-        window_height = max(min_height, min(max_height, window_height))
+        # 임시 위젯 없이 캐시된 폰트 측정값으로 레이아웃 계산
+        layout = self.app.measure_term(current_term_text, current_desc_text)
+        window_width, window_height = self.layout.window_for(layout)
         
         # 창 크기 설정
-        x = self.root.winfo_x()
-        y = self.root.winfo_y()
-        self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        x = self.window.winfo_x()
+        y = self.window.winfo_y()
+        self.window.geometry(f"{window_width}x{window_height}+{x}+{y}")
         
         # 설정 저장
-        self.config['width'] = window_width
-        self.config['height'] = window_height
-        self.save_config()
+        self.settings.set_window_size(window_width, window_height)
 
     # --- [스마트 클릭 + Hover 구현] ---
     def on_text_down(self, event):
@@ -625,12 +1042,74 @@ class TermMarquee:
 
     def on_term_leave(self, event):
         """용어 영역에서 벗어났을 때: 원래 테마 색상 복구"""
-        theme = self.themes[self.config['theme_name']]
-        self.term_label.config(cursor="hand2", fg=theme['fg'])
+        self.term_label.config(cursor="hand2", fg=self.settings.theme['fg'])
 
     def open_google_search(self, event):
-        term = self.terms[self.last_index]['term']
-        webbrowser.open(f"https://www.google.com/search?q={term} 뜻")
+        # 복습 모드: 검색했다 = 모르는 용어
+        self.engine.lapse_current(self.current_index, self.settings.slot)
+        term = self.engine.terms[self.current_index]['term']
+        if self.app.study_log is not None:
+            self.app.study_log.click(self.engine.deck_name, term)
+        # 로컬 사전에 자세한 설명이 있으면 창 안에서 보여주고, 없으면 웹 검색
+        body = self.app.definitions().get(term)
+        if body is not None:
+            self.show_definition(term, body)
+        else:
+            self.app.search_web(term)
+
+    def show_definition(self, term, body):
+        """자세한 설명 팝오버 (창 안, 최근 본 용어 바로가기 포함)"""
+        if self.popover is None:
+            self.build_popover()
+        self.popover_term = term
+        self.popover_title.config(text=term)
+        self.popover_body.config(state='normal')
+        self.popover_body.delete("1.0", "end")
+        self.popover_body.insert("1.0", body)
+        self.popover_body.config(state='disabled')
+
+        for child in self.popover_recent.winfo_children():
+            child.destroy()
+        for recent in self.app.definitions().recent(6):
+            if recent == term:
+                continue
+            lbl = tk.Label(self.popover_recent, text=recent, font=("Malgun Gothic", 8), bg="#eeeeee",
+                           fg="#555555", cursor="hand2", padx=4)
+            lbl.pack(side='left', padx=(0, 4))
+            lbl.bind("<Button-1>", lambda e, t=recent: self.show_definition(t, self.app.definitions().get(t)))
+
+        self.popover.place(relx=0.5, rely=0.55, anchor="center", relwidth=0.92, relheight=0.8)
+        self.popover.lift()
+
+    def build_popover(self):
+        bg = "#ffffff"
+        self.popover = tk.Frame(self.main_panel, bg=bg, relief="solid", bd=1)
+
+        top = tk.Frame(self.popover, bg=bg)
+        top.pack(fill='x', padx=8, pady=(6, 2))
+        self.popover_title = tk.Label(top, font=("Malgun Gothic", 11, "bold"), bg=bg, fg="#333333", anchor="w")
+        self.popover_title.pack(side='left', fill='x', expand=True)
+
+        btn_close = tk.Label(top, text="✕", font=("Arial", 10), bg=bg, fg="#777777", cursor="hand2")
+        btn_close.pack(side='right')
+        btn_close.bind("<Button-1>", self.hide_definition)
+        self.animator.register(btn_close, hover="#eeeeee")
+
+        btn_web = tk.Label(top, text="웹 검색", font=("Malgun Gothic", 9, "underline"), bg=bg, fg="#3366cc", cursor="hand2")
+        btn_web.pack(side='right', padx=(0, 8))
+        btn_web.bind("<Button-1>", lambda e: self.app.search_web(self.popover_term))
+
+        self.popover_body = tk.Text(self.popover, font=("Malgun Gothic", 10), wrap="word", bg=bg,
+                                    bd=0, highlightthickness=0, height=4)
+        self.popover_body.pack(fill='both', expand=True, padx=8)
+
+        self.popover_recent = tk.Frame(self.popover, bg=bg)
+        self.popover_recent.pack(fill='x', padx=8, pady=(2, 6))
+        self.window.bind("<Escape>", self.hide_definition)
+
+    def hide_definition(self, event=None):
+        if self.popover is not None:
+            self.popover.place_forget()
 
     def start_move(self, event):
         self.x = event.x
@@ -639,49 +1118,61 @@ class TermMarquee:
     def do_move(self, event):
         deltax = event.x - self.x
         deltay = event.y - self.y
-        x = self.root.winfo_x() + deltax
-        y = self.root.winfo_y() + deltay
-        self.root.geometry(f"+{x}+{y}")
+        x = self.window.winfo_x() + deltax
+        y = self.window.winfo_y() + deltay
+        self.window.geometry(f"+{x}+{y}")
+
+    def end_move(self, event):
+        # 다음 실행에도 같은 자리(모니터)에 열리도록
+        self.settings.set_position(self.window.winfo_x(), self.window.winfo_y())
 
     def start_resize(self, event):
         self.rx = event.x_root
         self.ry = event.y_root
-        self.rw = self.root.winfo_width()
-        self.rh = self.root.winfo_height()
+        self.rw = self.window.winfo_width()
+        self.rh = self.window.winfo_height()
 
     def do_resize(self, event):
         dx = event.x_root - self.rx
         dy = event.y_root - self.ry
         new_w = max(300, self.rw + dx)
         new_h = max(150, self.rh + dy)
-        self.root.geometry(f"{new_w}x{new_h}")
+        self.window.geometry(f"{new_w}x{new_h}")
+
+    def show_term(self, idx):
+        entry = self.lookahead.take(idx)
+        
+        if self.marquee_on:
+            self.marquee.show(entry['term'], entry['runs'][0])
+        else:
+            self.term_label.config(text=entry['term'])
+            
+            self.desc_text.config(state='normal')
+            self.desc_text.delete("1.0", "end")
+            self.desc_text.insert("1.0", *entry['runs'])
+
+        # 이 창에 표시 중인 인덱스 (검색용) + 엔진에는 마지막으로 표시한 용어
+        self.current_index = idx
+        self.engine.last_index = idx
+        if self.app.study_log is not None:
+            # 이전 용어는 머문 시간과 함께 기록
+            self.app.study_log.show(self, self.engine.deck_name, entry['term'])
+
+    def on_tick_timer(self, late):
+        if self.perf is not None:
+            # 이상적인 전환 시각보다 늦게 울린 만큼
+            self.perf.record_drift(late)
+        self.update_term()
 
     def update_term(self):
         if self.is_paused: return
-        if not self.terms: return
-
-        # 모든 용어를 한 번씩 소진할 때까지 중복 없이 랜덤 재생
-        if not self.shuffled_indices or len(self.shuffled_indices) != len(self.terms) or self.shuffle_pos >= len(self.shuffled_indices):
-            self.shuffled_indices = list(range(len(self.terms)))
-            random.shuffle(self.shuffled_indices)
-            self.shuffle_pos = 0
-
-        idx = self.shuffled_indices[self.shuffle_pos]
-        data = self.terms[idx]
-        
-        self.term_label.config(text=data['term'])
-        
-        self.desc_text.config(state='normal')
-        self.desc_text.delete("1.0", "end")
-        self.desc_text.insert("1.0", data['desc'], "center")
+        if not self.engine.terms: return
 
-        # 마지막으로 사용한 인덱스 기록 (검색용)
-        self.last_index = idx
-        # 다음 위치로 이동
-        self.shuffle_pos += 1
+        idx = self.engine.next_term_index(self.settings.slot)
+        self.show_term(idx)
 
-        if self.timer_id: self.root.after_cancel(self.timer_id)
-        self.timer_id = self.root.after(self.config['interval_seconds'] * 1000, self.update_term)
+        # 다음 틱까지의 유휴 시간에 이어질 용어들 준비
+        self.lookahead.refill()
 
 if __name__ == "__main__":
-    TermMarquee()
\ No newline at end of file
+    MarqueeApp()
\ No newline at end of file
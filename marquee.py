@@ -0,0 +1,162 @@
+"""흐르는 설명(마키) 표시: Canvas 텍스트 항목을 canvas.move 로 이동
+
+- 용어/설명은 틱마다 Canvas 텍스트 항목으로 한 번만 만들고 폭을 한 번만 잰다.
+  이후 프레임에서는 bbox 등 Tk 질의 없이 파이썬 쪽 x 좌표만 갱신하고 canvas.move 한 번만 호출한다.
+- 설명이 화면 폭보다 길 때만 흐르고, 짧으면 가운데 고정이며 프레임 시계도 멈춘다.
+- 이동량은 실제 경과 시간 x 속도(px/s)로 계산하고 소수점 이하는 누적하므로,
+  프레임이 늦어져도 속도가 일정하다.
+- FrameMeter: 프레임 간격 / 프레임 처리 시간 / 프로세스 CPU 사용률(1초 구간)
+"""
+import time
+import tkinter as tk
+
+FPS = 60
+GAP = 80  # 설명 끝과 다시 들어오는 앞부분 사이 간격 (px)
+MAX_STEP = 0.25  # 한 프레임에 반영하는 최대 경과 시간 (초)
+
+
+class FrameMeter:
+    """흐르는 동안의 프레임 시간과 CPU 사용률 (window 초마다 갱신)"""
+
+    def __init__(self, window=1.0):
+        self.window = window
+        self.fps = 0.0
+        self.frame_ms = 0.0    # 평균 프레임 처리 시간
+        self.max_ms = 0.0      # 구간 안 최대 프레임 처리 시간
+        self.cpu_percent = 0.0
+        self.reset()
+
+    def reset(self):
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self._frames = 0
+        self._busy = 0.0
+        self._max = 0.0
+
+    def record(self, start):
+        now = time.perf_counter()
+        spent = now - start
+        self._frames += 1
+        self._busy += spent
+        if spent > self._max:
+            self._max = spent
+        elapsed = now - self._wall
+        if elapsed >= self.window:
+            cpu = time.process_time()
+            self.fps = self._frames / elapsed
+            self.frame_ms = self._busy / self._frames * 1000
+            self.max_ms = self._max * 1000
+            self.cpu_percent = (cpu - self._cpu) / elapsed * 100
+            self._wall, self._cpu = now, cpu
+            self._frames, self._busy, self._max = 0, 0.0, 0.0
+            return True
+        return False
+
+    def text(self):
+        return f"{self.fps:.0f} fps · 프레임 {self.frame_ms:.2f}ms (최대 {self.max_ms:.1f}) · CPU {self.cpu_percent:.1f}%"
+
+
+class MarqueeCanvas:
+    def __init__(self, parent, ticks, term_font, desc_font, bg, fg, speed=60):
+        self.ticks = ticks
+        self.term_font = term_font
+        self.desc_font = desc_font
+        self.speed = speed  # px/s
+        self.canvas = tk.Canvas(parent, bg=bg, bd=0, highlightthickness=0)
+        self.fg = fg
+        self.term_item = None
+        self.desc_item = None
+        self.term = ""
+        self.desc = ""
+        self.desc_width = 0
+        self.x = 0.0        # 설명 항목의 왼쪽 x (파이썬에서만 추적)
+        self.drawn_x = 0    # 캔버스에 실제로 반영된 정수 x
+        self.width = 1
+        self.height = 1
+        self.on_meter = None  # 1초마다 FrameMeter 갱신 알림
+        self.meter = FrameMeter()
+        self._last = None
+        self.frame = ticks.add("marquee", 1 / FPS, self._frame, start=False)
+        self.canvas.bind("<Configure>", self._on_configure)
+
+    def show(self, term, desc):
+        """새 용어 표시 - 항목을 다시 만들고 폭을 한 번 잼"""
+        self.term, self.desc = term, " ".join(desc.split())  # 한 줄로
+        self.canvas.delete("all")
+        self.term_item = self.canvas.create_text(0, 0, text=self.term, font=self.term_font, fill=self.fg,
+                                                 anchor="s", tags=("term",))
+        self.desc_item = self.canvas.create_text(0, 0, text=self.desc, font=self.desc_font, fill=self.fg,
+                                                 anchor="nw", tags=("desc",))
+        self.layout(restart=True)
+
+    def layout(self, restart=False):
+        """용어는 가운데, 설명은 짧으면 가운데 / 길면 오른쪽 끝에서 흘러 들어옴 (글자 크기가 바뀌면 다시 호출)"""
+        if self.term_item is None:
+            return
+        self.desc_width = self.desc_font.measure(self.desc)
+        mid = self.height // 2
+        self.canvas.coords(self.term_item, self.width / 2, mid - 4)
+        if self.scrolling:
+            if restart:
+                self.x = float(self.width)
+        else:
+            self.x = (self.width - self.desc_width) / 2
+        self.drawn_x = int(self.x)
+        self.canvas.coords(self.desc_item, self.drawn_x, mid + 6)
+        self._update_clock()
+
+    @property
+    def scrolling(self):
+        return self.desc_width > self.width - 20
+
+    def _update_clock(self):
+        if self.scrolling and self.canvas.winfo_ismapped():
+            if not self.frame.running:
+                self._last = None
+                self.meter.reset()
+                self.frame.start(0)
+        elif self.frame.running:
+            self.frame.stop()
+
+    def _on_configure(self, event):
+        self.width, self.height = max(1, event.width), max(1, event.height)
+        self.layout()
+
+    def _frame(self, late):
+        start = time.perf_counter()
+        now = self.ticks.clock()
+        if self._last is not None:
+            # 절전 등으로 멈췄다 재개하면 그동안의 시간은 건너뜀 (한 번에 멀리 튀지 않게)
+            self.x -= self.speed * min(now - self._last, MAX_STEP)
+            if self.x + self.desc_width < 0:
+                # 다 지나가면 오른쪽 끝(+ 간격)에서 다시
+                self.x += self.desc_width + max(self.width, GAP)
+            x = int(self.x)
+            if x != self.drawn_x:
+                self.canvas.move(self.desc_item, x - self.drawn_x, 0)
+                self.drawn_x = x
+        self._last = now
+        if self.meter.record(start) and self.on_meter is not None:
+            self.on_meter(self.meter)
+
+    def set_speed(self, speed):
+        self.speed = speed
+
+    def set_colors(self, bg, fg):
+        self.fg = fg
+        self.canvas.config(bg=bg)
+        self.canvas.itemconfigure("all", fill=fg)
+
+    def show_widget(self, **place):
+        self.canvas.place(**place)
+        self.canvas.update_idletasks()
+        self.width, self.height = max(1, self.canvas.winfo_width()), max(1, self.canvas.winfo_height())
+        self.layout(restart=True)
+
+    def hide_widget(self):
+        self.frame.stop()
+        self.canvas.place_forget()
+
+    def close(self):
+        """창을 닫을 때 프레임 타임라인 제거"""
+        self.ticks.remove(self.frame)
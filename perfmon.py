@@ -0,0 +1,203 @@
+"""성능 계측 (켰을 때만 동작): 콜백 소요 시간, 이벤트 루프 지연, 틱 타이머 오차
+
+- 콜백은 instrument()로 인스턴스 메서드를 시간 재는 래퍼로 바꿔 끼운다.
+  바인딩보다 먼저 호출해야 하며, 끄면 아예 바꿔 끼우지 않으므로 추가 비용이 없다.
+- 이벤트 루프 지연: heartbeat_ms 주기 타임라인(TickScheduler)이 기한보다 늦게 울린 만큼 기록
+  하트비트와 내보내기도 앱의 다른 타이머와 같은 TickScheduler에서 돌므로 절전 중에는 함께 멈춘다.
+- 틱 오차: 전환 타이머가 예정 시각보다 늦게 울린 만큼 기록
+- 전환 틱 콜백(update_term)은 한 프레임(16ms)을 넘긴 횟수도 오버레이 / 내보내기에 함께 표시
+- 레이아웃 패스(layout_pass)는 초당 횟수도 표시 (프레임당 한 번이면 60/s 이하)
+- 덱 전환에 걸린 시간은 record_deck_switch()로 기록 (다른 콜백과 함께 오버레이에 나옴)
+- 값은 고정 크기 로그 구간 히스토그램에 쌓고, export_ms 마다 JSONL 한 줄씩 내보낸 뒤 비운다.
+"""
+import json
+import math
+import time
+from array import array
+
+
+class Histogram:
+    """고정 크기 로그 구간 히스토그램 (10us ~ 약 2.6s, 구간 경계는 2^(1/4)배씩)"""
+
+    BASE = 10e-6
+    STEPS = 4      # 2배당 구간 수
+    BUCKETS = 72   # 마지막 구간은 그 이상 전부
+
+    def __init__(self):
+        self.counts = array('L', [0]) * self.BUCKETS
+        self.reset()
+
+    def reset(self):
+        for i in range(self.BUCKETS):
+            self.counts[i] = 0
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        if seconds <= self.BASE:
+            i = 0
+        else:
+            i = min(self.BUCKETS - 1, int(math.log2(seconds / self.BASE) * self.STEPS) + 1)
+        self.counts[i] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def bound(self, i):
+        return self.BASE * 2 ** (i / self.STEPS)
+
+    def count_over(self, seconds):
+        """seconds 이상인 구간에 든 표본 수 (구간 폭만큼의 오차는 있음)"""
+        return sum(n for i, n in enumerate(self.counts) if i and self.bound(i - 1) >= seconds)
+
+    def percentile(self, p):
+        """p(0~100) 백분위수의 구간 상한 (초) - 구간 폭만큼의 오차는 있음"""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * p / 100)
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(self.bound(i), self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class PerfMonitor:
+    LOOP_LAG = "loop_lag"
+    TICK_DRIFT = "tick_drift"
+    TICK = "update_term"  # 용어 전환 틱 콜백 (instrument로 감싼 TermMarquee.update_term)
+    LAYOUT = "layout_pass"  # 리사이즈/줌을 합친 레이아웃 패스 (TermMarquee.layout_pass)
+    DECK_SWITCH = "deck_switch"  # 덱 전환 (모든 창 갱신까지)
+    FRAME_BUDGET = 0.016
+
+    def __init__(self, ticks, export_path=None, heartbeat_ms=100, export_ms=60000):
+        self.ticks = ticks  # ticksched.TickScheduler
+        self.export_path = export_path
+        self.heartbeat_ms = heartbeat_ms
+        self.export_ms = export_ms
+        self.histograms = {}
+        self.window_start = time.perf_counter()  # 히스토그램을 비운 시각 (초당 횟수 기준)
+        self._beat = None
+        self._export = None
+
+    def histogram(self, name):
+        hist = self.histograms.get(name)
+        if hist is None:
+            hist = self.histograms[name] = Histogram()
+        return hist
+
+    # --- 콜백 ---
+    def wrap(self, name, fn):
+        hist = self.histogram(name)
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                hist.record(clock() - start)
+
+        timed.__name__ = getattr(fn, '__name__', name)
+        return timed
+
+    def instrument(self, obj, names):
+        """obj의 메서드들을 시간 재는 래퍼로 교체 (bind/after 에 넘기기 전에 호출)"""
+        for name in names:
+            setattr(obj, name, self.wrap(name, getattr(obj, name)))
+
+    # --- 이벤트 루프 / 타이머 ---
+    def start(self):
+        self._beat = self.ticks.add("perf-heartbeat", self.heartbeat_ms / 1000, self.record_lag)
+        if self.export_path:
+            self._export = self.ticks.add("perf-export", self.export_ms / 1000, self._periodic_export)
+
+    def record_lag(self, late):
+        """하트비트 타임라인이 기한보다 늦게 울린 시간(초) = 이벤트 루프 지연"""
+        self.histogram(self.LOOP_LAG).record(late)
+
+    def record_drift(self, late):
+        """전환 타이머가 예정 시각보다 늦게 울린 시간(초) 기록"""
+        self.histogram(self.TICK_DRIFT).record(late)
+
+    def record_deck_switch(self, seconds):
+        """덱 전환에 걸린 시간(초) 기록 - 오버레이에서는 다른 콜백과 함께 p99 순으로 나옴"""
+        self.histogram(self.DECK_SWITCH).record(seconds)
+
+    # --- 내보내기 ---
+    def summary(self):
+        stats = {name: hist.summary() for name, hist in self.histograms.items() if hist.count}
+        if self.TICK in stats:
+            stats[self.TICK]["over_frame"] = self.histograms[self.TICK].count_over(self.FRAME_BUDGET)
+        if self.LAYOUT in stats:
+            stats[self.LAYOUT]["per_s"] = round(self.rate(self.LAYOUT), 2)
+        return stats
+
+    def rate(self, name):
+        """비운 뒤로 초당 표본 수"""
+        hist = self.histograms.get(name)
+        elapsed = time.perf_counter() - self.window_start
+        return hist.count / elapsed if hist is not None and elapsed > 0 else 0.0
+
+    def export(self):
+        """히스토그램마다 JSONL 한 줄씩 추가한 뒤 비움 (구간별 시계열)"""
+        stats = self.summary()
+        if not stats or not self.export_path:
+            return
+        ts = round(time.time(), 3)
+        try:
+            with open(self.export_path, 'a', encoding='utf-8') as f:
+                for name, values in stats.items():
+                    f.write(json.dumps({"ts": ts, "name": name, **values}) + "\n")
+        except Exception as e:
+            print(f"Perf export error: {e}")
+            return
+        for hist in self.histograms.values():
+            hist.reset()
+        self.window_start = time.perf_counter()
+
+    def _periodic_export(self, late=0.0):
+        self.export()
+
+    def close(self):
+        for timeline in (self._beat, self._export):
+            if timeline is not None:
+                try:
+                    self.ticks.remove(timeline)
+                except Exception:
+                    pass  # mainloop가 끝난 뒤면 after 취소가 실패할 수 있음
+        self._beat = self._export = None
+        self.export()
+
+    def overlay_text(self, limit=6):
+        """디버그 오버레이용 요약 (루프 지연, 틱 오차, 전환 틱 콜백, 가장 느린 콜백 순)"""
+        lines = []
+        for name in (self.LOOP_LAG, self.TICK_DRIFT):
+            hist = self.histograms.get(name)
+            if hist is not None and hist.count:
+                lines.append(f"{name} p99 {hist.percentile(99) * 1000:.1f} max {hist.max * 1000:.1f} ms")
+        tick = self.histograms.get(self.TICK)
+        if tick is not None and tick.count:
+            lines.append(f"tick p99 {tick.percentile(99) * 1000:.2f} max {tick.max * 1000:.1f} ms, "
+                         f"{tick.count_over(self.FRAME_BUDGET)}/{tick.count} over frame")
+        layout = self.histograms.get(self.LAYOUT)
+        if layout is not None and layout.count:
+            lines.append(f"layout {self.rate(self.LAYOUT):.1f}/s p99 {layout.percentile(99) * 1000:.2f} ms")
+        pinned = (self.LOOP_LAG, self.TICK_DRIFT, self.TICK, self.LAYOUT)
+        callbacks = [(hist.percentile(99), name, hist) for name, hist in self.histograms.items()
+                     if name not in pinned and hist.count]
+        for p99, name, hist in sorted(callbacks, reverse=True)[:limit]:
+            lines.append(f"{name} x{hist.count} p99 {p99 * 1000:.2f} ms")
+        return "\n".join(lines) or "no samples"
@@ -0,0 +1,77 @@
+"""절전: 창이 모두 숨겨졌거나 가려졌을 때, 또는 사용자가 자리를 비웠을 때 타이머를 모두 멈춤
+
+- 창마다 <Map> / <Unmap> / <Visibility>로 보이는지 추적한다. 모든 창이 최소화·숨김·완전히 가려짐이면
+  TickScheduler.suspend()로 용어 전환 / 흐르는 설명 / 애니메이션 / 덱 감시 / 중간 저장을 모두 멈춘다.
+  after도 걸지 않으므로 다시 보일 때까지 타이머로는 한 번도 깨어나지 않는다.
+- 자리 비움은 `tk inactive`(마지막 입력 후 지난 ms)로 판단한다. IDLE_CHECK_SECONDS 마다 확인해서
+  idle_seconds를 넘으면 멈춘다. 멈춘 동안에는 복귀 확인 하나만 RESUME_CHECK_SECONDS 마다 돈다.
+  창에 마우스가 들어오거나 클릭하면 바로 복귀한다. `tk inactive`를 지원하지 않으면(-1) 확인하지 않는다.
+- 다시 보이거나 사용자가 돌아오면 각 타임라인은 멈출 때 남은 시간부터 이어 간다.
+- 타이머 밖에서 도는 작업(덱 동기화 스레드 등)은 listeners에 등록하면 멈출 때 / 재개할 때
+  listener(suspended)로 알림을 받는다.
+- Tk와 무관하므로 benchmarks/bench_powersave.py 가 가상 루프로 깨어난 횟수를 센다.
+"""
+
+IDLE_CHECK_SECONDS = 30
+RESUME_CHECK_SECONDS = 2
+
+
+class PowerSaver:
+    def __init__(self, ticks, idle_seconds=300, inactive_ms=None):
+        self.ticks = ticks
+        self.idle_seconds = idle_seconds
+        self.inactive_ms = inactive_ms  # () -> 마지막 사용자 입력 후 ms (모르면 음수)
+        self.hidden = {}  # 창 -> 안 보임 여부
+        self.idle = False
+        self.suspends = 0  # 멈춘 횟수
+        self.listeners = []  # listener(suspended) - 멈춤 상태가 바뀔 때마다
+        self.idle_check = None
+        if inactive_ms is not None and idle_seconds > 0 and inactive_ms() >= 0:
+            self.idle_check = ticks.add("idle-check", IDLE_CHECK_SECONDS, self.check_idle)
+
+    @property
+    def all_hidden(self):
+        return bool(self.hidden) and all(self.hidden.values())
+
+    @property
+    def suspended(self):
+        return self.ticks.suspended
+
+    def set_hidden(self, window, hidden):
+        if self.hidden.get(window) != hidden:
+            self.hidden[window] = hidden
+            self.update()
+
+    def forget(self, window):
+        if self.hidden.pop(window, None) is not None:
+            self.update()
+
+    def activity(self):
+        """창 위 입력 - 자리 비움으로 멈춰 있었으면 바로 재개"""
+        if self.idle:
+            self.idle = False
+            self.update()
+
+    def check_idle(self, late=0.0):
+        idle = self.inactive_ms() >= self.idle_seconds * 1000
+        if idle != self.idle:
+            self.idle = idle
+            self.update()
+
+    def update(self):
+        was_suspended = self.ticks.suspended
+        if self.all_hidden:
+            self.ticks.suspend()
+        elif self.idle:
+            # 복귀 확인만 남김 (더 자주)
+            self.ticks.suspend(keep=(self.idle_check,))
+            self.idle_check.set_interval(RESUME_CHECK_SECONDS)
+        else:
+            self.ticks.resume()
+            if self.idle_check is not None:
+                self.idle_check.set_interval(IDLE_CHECK_SECONDS)
+        if self.ticks.suspended and not was_suspended:
+            self.suspends += 1
+        if self.ticks.suspended != was_suspended:
+            for listener in self.listeners:
+                listener(self.ticks.suspended)
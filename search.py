@@ -0,0 +1,232 @@
+"""용어 검색 색인: 접두어 검색 + 역색인 + 한글 초성 검색
+
+덱을 불러올 때 한 번 만든다.
+- 단어 사전은 정렬된 배열로 저장한다. 사실상 평탄화한 트라이이며,
+  접두어에 해당하는 단어 구간을 bisect로 O(log V) 만에 찾는다.
+- 역색인은 단어 번호 -> 용어 인덱스 목록이며, 하나의 array('I')에 이어 붙여 둔다.
+- 한글 단어는 초성 문자열(비동기 -> ㅂㄷㄱ)도 함께 색인한다.
+  그래서 "ㅂㄷㄱ" 같은 초성 질의도 같은 접두어 검색으로 찾는다.
+- 질의의 단어마다 용어 이름 또는 설명 중 어디에든 있으면 되고, 모든 단어가 이름에 있는 결과가 먼저 나온다.
+  여러 단어는 정렬된 역색인끼리 교집합 (적은 것부터 bisect로 건너뜀, 후보 수 상한 없음).
+- 입력 중인 마지막 단어는 조합 중인 음절도 찾는다: "비동ㄱ"은 "비동" 뒤에 초성이 ㄱ인 음절,
+  받침 없는 "비도"는 "비도"~"비돟"(받침만 다른 음절)로 시작하는 단어. 둘 다 사전 구간 하나라서 bisect로 찾는다.
+"""
+import re
+from array import array
+from bisect import bisect_left
+
+_WORD = re.compile(r"[0-9a-z가-힣ㄱ-ㅎ]+")
+_CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+
+_HANGUL = re.compile(r"[가-힣]")
+# 한글 음절 11172자 -> 초성 (str.translate 용 표)
+_CHOSUNG_TABLE = {0xAC00 + i: _CHOSUNG[i // 588] for i in range(11172)}
+_END = "\U0010ffff"
+MERGED_CACHE = 16  # 여러 단어에 걸친 구간의 합친 역색인을 보관할 개수
+TERM_FIRST_POSTINGS = 4096  # 이름 역색인이 이 이하인 단어가 있으면 이름 일치를 덱 전체에서 먼저 찾음
+
+
+def _is_syllable(ch):
+    return "가" <= ch <= "힣"
+
+
+def query_key(word, typing=False):
+    """질의 단어 -> (사전 구간 시작 키, 끝 키, 본문 부분 문자열 검사용 고정 부분)
+
+    typing: 입력 중인 단어 - 끝의 자음(초성)이나 받침 없는 음절을 조합 중인 음절로 봄
+    """
+    if typing and len(word) > 1 and _is_syllable(word[-2]) and word[-1] in _CHOSUNG:
+        first = 0xAC00 + _CHOSUNG.index(word[-1]) * 588
+        base = word[:-1]
+        return base + chr(first), base + chr(first + 587) + _END, base
+    if typing and _is_syllable(word[-1]) and (ord(word[-1]) - 0xAC00) % 28 == 0:
+        base = word[:-1]
+        return word, base + chr(ord(word[-1]) + 27) + _END, base
+    return word, word + _END, word
+
+
+def chosung(word):
+    """한글 음절을 초성으로 바꾼 문자열 (한글이 아닌 글자는 그대로)"""
+    return word.translate(_CHOSUNG_TABLE)
+
+
+def tokenize(text):
+    """검색 단어 목록 (소문자, 한글 단어는 초성 문자열 포함)"""
+    words = _WORD.findall(text.lower())
+    tokens = set(words)
+    for w in words:
+        if _HANGUL.search(w):
+            tokens.add(w.translate(_CHOSUNG_TABLE))
+    return tokens
+
+
+class PrefixIndex:
+    """정렬된 단어 사전 + 평탄화한 역색인"""
+
+    def __init__(self, texts):
+        postings = {}
+        for idx, text in enumerate(texts):
+            for token in tokenize(text):
+                lst = postings.get(token)
+                if lst is None:
+                    postings[token] = lst = array("I")
+                lst.append(idx)
+        self.words = sorted(postings)
+        self.starts = array("I", [0])
+        self.postings = array("I")
+        self._merged = {}  # 단어 구간 -> 합쳐 정렬한 역색인 (sorted_postings)
+        for w in self.words:
+            self.postings.extend(postings[w])
+            self.starts.append(len(self.postings))
+
+    def word_range(self, prefix):
+        """prefix로 시작하는 단어들의 사전 구간 [lo, hi)"""
+        return self.key_range(prefix, prefix + _END)
+
+    def key_range(self, start, end):
+        """start <= 단어 < end 인 단어들의 사전 구간 [lo, hi)"""
+        lo = bisect_left(self.words, start)
+        hi = bisect_left(self.words, end, lo)
+        return lo, hi
+
+    def count(self, word_range):
+        lo, hi = word_range
+        return self.starts[hi] - self.starts[lo]
+
+    def sorted_postings(self, word_range):
+        """구간 안 단어들의 역색인을 합친 정렬된 목록 -> (배열, 시작, 끝)
+
+        단어가 하나면 원래 배열의 그 부분을 그대로 쓰고, 여럿이면 합쳐 정렬한 것을 MERGED_CACHE개까지 보관
+        (입력 중에는 앞 단어들의 구간이 그대로라 다시 정렬하지 않음).
+        """
+        lo, hi = word_range
+        if hi - lo <= 1:
+            return self.postings, self.starts[lo], self.starts[hi]
+        merged = self._merged.pop(word_range, None)
+        if merged is None:
+            merged = array("I", sorted(self.postings[self.starts[lo]:self.starts[hi]]))
+            if len(self._merged) >= MERGED_CACHE:
+                del self._merged[next(iter(self._merged))]
+        self._merged[word_range] = merged  # 최근에 쓴 것을 뒤로
+        return merged, 0, len(merged)
+
+    def iter_matches(self, word_range):
+        lo, hi = word_range
+        postings, starts = self.postings, self.starts
+        for w in range(lo, hi):
+            for p in range(starts[w], starts[w + 1]):
+                yield postings[p]
+
+
+class SearchIndex:
+    def __init__(self, terms):
+        # 용어 이름과 설명을 따로 색인해서 이름이 맞는 결과를 먼저 보여줌
+        self.terms = terms
+        self.size = len(terms)
+        self.term_index = PrefixIndex(t['term'] for t in terms)
+        self.desc_index = PrefixIndex(t['desc'] for t in terms)
+
+    def memory_estimate(self):
+        """색인이 차지하는 대략적인 메모리 (바이트)"""
+        total = 0
+        for index in (self.term_index, self.desc_index):
+            total += index.postings.itemsize * len(index.postings) + index.starts.itemsize * len(index.starts)
+            total += sum(len(w) for w in index.words) + 60 * len(index.words)
+        return total
+
+    def search(self, query, limit=20):
+        """질의의 모든 단어를 (접두어로) 이름 또는 설명에 포함하는 용어 인덱스 목록 - 최대 limit개
+
+        단어가 여럿이면 단어마다 정렬된 역색인을 적은 것부터 bisect로 건너뛰며 교집합을 구한다.
+        후보 수에 상한이 없어 일치하는 항목을 놓치지 않고, 덱 순서로 limit개가 차면 멈춘다.
+        모든 단어가 이름에 있는 결과가 먼저 (이름 역색인이 TERM_FIRST_POSTINGS보다 크면 찾은 것 안에서만).
+        """
+        words = _WORD.findall(query.lower())
+        if not words:
+            return []
+        typing = not query[-1:].isspace()
+        keys = [query_key(w, typing and n == len(words) - 1) for n, w in enumerate(words)]
+        fields = (self.term_index, self.desc_index)
+        # 단어마다 (이름 구간, 설명 구간)
+        ranges = [tuple(index.key_range(start, end) for index in fields) for start, end, _ in keys]
+        if len(words) == 1:
+            return self._search_word(ranges[0], limit)
+
+        # 1) 모든 단어가 이름에 있는 항목 - 이름 역색인이 작을 때만 덱 전체에서 (이름은 보통 짧아서 대개 이 경우)
+        term_counts = [self.term_index.count(rs[0]) for rs in ranges]
+        hits = []
+        exhaustive = min(term_counts) <= TERM_FIRST_POSTINGS
+        if exhaustive and min(term_counts):
+            hits = intersect([[self.term_index.sorted_postings(rs[0])] for rs in ranges], limit)
+            if len(hits) >= limit:
+                return hits
+        # 2) 단어마다 이름이나 설명 중 하나에 있는 항목 (이름 또는 설명 역색인의 합집합끼리 교집합)
+        lists = [[index.sorted_postings(r) for index, r in zip(fields, rs) if index.count(r)] for rs in ranges]
+        if not all(lists):
+            return hits
+        rest = intersect(lists, limit - len(hits), set(hits))
+        if not exhaustive:
+            # 이름 역색인이 커서 1)을 건너뜀 - 찾은 것 안에서만 이름에 모두 있는 항목을 앞으로
+            rest.sort(key=lambda idx: not all(_has_token(self.terms[idx]['term'], key) for key in keys))
+        return hits + rest
+
+    def _search_word(self, ranges, limit):
+        """단어 하나: 이름 역색인 -> 설명 역색인 순으로 limit개"""
+        results = []
+        seen = set()
+        for index, word_range in zip((self.term_index, self.desc_index), ranges):
+            for idx in index.iter_matches(word_range):
+                if idx not in seen:
+                    seen.add(idx)
+                    results.append(idx)
+                    if len(results) >= limit:
+                        return results
+        return results
+
+
+def _has_token(text, key):
+    """text의 검색 단어(초성 포함) 중 key 구간에 드는 것이 있는지"""
+    start, end, _ = key
+    return any(start <= token < end for token in tokenize(text))
+
+
+def _seek(cursors, x):
+    """단어 하나의 역색인들(칸마다 [배열, 위치, 끝])에서 x 이상인 가장 작은 인덱스 (없으면 None)"""
+    best = None
+    for cursor in cursors:
+        arr, pos, end = cursor
+        if pos < end and arr[pos] < x:
+            pos = cursor[1] = bisect_left(arr, x, pos, end)
+        if pos < end and (best is None or arr[pos] < best):
+            best = arr[pos]
+    return best
+
+
+def intersect(lists, limit, skip=()):
+    """단어마다 정렬된 역색인 목록 lists[n] = [(배열, 시작, 끝), ...] (단어 안에서는 합집합) 의 교집합
+
+    적은 단어부터 돌아가며 지금 후보 x 이상으로 bisect 해서 건너뛰고, 모든 단어가 x에서 만나면 결과.
+    인덱스 순으로 limit개 (skip에 있는 것은 빼고).
+    """
+    words = sorted(([list(p) for p in postings] for postings in lists),
+                   key=lambda cursors: sum(end - pos for _, pos, end in cursors))
+    n = len(words)
+    out = []
+    x = 0
+    while True:
+        agree = i = 0
+        while agree < n:
+            v = _seek(words[i], x)
+            if v is None:
+                return out
+            if v == x:
+                agree += 1
+            else:
+                x, agree = v, 1
+            i = i + 1 if i + 1 < n else 0
+        if x not in skip:
+            out.append(x)
+            if len(out) >= limit:
+                return out
+        x += 1
@@ -0,0 +1,133 @@
+"""중복 없는 랜덤 재생 순서를 리스트 없이 만드는 지연 셔플
+
+[0, n) 위의 시드 기반 전단사(Feistel 네트워크 + cycle walking)로
+pos번째 인덱스를 그때그때 계산하므로 덱 크기와 상관없이 상태는 시드/위치 몇 개뿐이다.
+
+덱이 커지면 현재 사이클 뒤에 새 구간 [이전 크기, 새 크기)를 따로 섞어서 덧붙인다.
+이미 본 용어는 다시 섞지 않고, 새 용어는 이번 사이클 안에 한 번씩 나온다.
+덱이 줄어들면 범위를 벗어난 인덱스는 건너뛴다.
+"""
+import random
+
+_M64 = (1 << 64) - 1
+_ROUNDS = 4
+
+
+def _mix(x):
+    """splitmix64 마무리 함수"""
+    x = (x + 0x9E3779B97F4A7C15) & _M64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _M64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _M64
+    return x ^ (x >> 31)
+
+
+class _Permutation:
+    """[0, size) 위의 시드 기반 전단사"""
+
+    def __init__(self, size, seed):
+        self.size = size
+        bits = max(2, (size - 1).bit_length())
+        self.half = (bits + 1) // 2
+        self.mask = (1 << self.half) - 1
+        self.keys = [_mix(seed ^ (r * 0xD1B54A32D192ED03 & _M64)) for r in range(_ROUNDS)]
+
+    def __call__(self, i):
+        half, mask, size = self.half, self.mask, self.size
+        x = i
+        while True:
+            left, right = x >> half, x & mask
+            for key in self.keys:
+                left, right = right, left ^ (_mix(right ^ key) & mask)
+            x = (left << half) | right
+            # 2의 거듭제곱 범위 밖이면 다시 돌림 (평균 4회 미만)
+            if x < size:
+                return x
+
+
+class LazyShuffle:
+    def __init__(self, n, seed=None, pos=0, bounds=None):
+        self.n = n
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.pos = pos
+        # 현재 사이클을 이루는 구간 경계 [0, b1, b2, ...] - 구간마다 따로 섞음
+        self.bounds = list(bounds) if bounds else [0, n]
+        self._perms = {}
+        if n > self.bounds[-1]:
+            self.resize(n)
+
+    @property
+    def cycle_length(self):
+        return self.bounds[-1]
+
+    def _perm(self, seg, seed, bounds):
+        key = (seed, bounds[seg], bounds[seg + 1])
+        perm = self._perms.get(key)
+        if perm is None:
+            if len(self._perms) > 8:
+                self._perms.clear()
+            perm = _Permutation(bounds[seg + 1] - bounds[seg], _mix(seed ^ bounds[seg]))
+            self._perms[key] = perm
+        return perm
+
+    def _at(self, pos, seed, bounds):
+        seg = 0
+        while pos >= bounds[seg + 1]:
+            seg += 1
+        return bounds[seg] + self._perm(seg, seed, bounds)(pos - bounds[seg])
+
+    def _walk(self):
+        """현재 위치부터 (인덱스, 다음 상태)를 차례로 생성 - 사이클이 끝나면 다음 사이클로"""
+        seed, pos, bounds = self.seed, self.pos, self.bounds
+        while True:
+            if pos >= bounds[-1]:
+                # 다음 사이클: 시드를 결정적으로 이어가서 미리보기(peek)와 실제 순서가 같도록
+                seed, pos, bounds = _mix(seed), 0, [0, self.n]
+            idx = self._at(pos, seed, bounds)
+            pos += 1
+            if idx < self.n:
+                yield idx, seed, pos, bounds
+
+    def next(self):
+        if self.n <= 0:
+            raise IndexError("empty deck")
+        while True:
+            if self.pos >= self.bounds[-1]:
+                self.seed, self.pos, self.bounds = _mix(self.seed), 0, [0, self.n]
+            idx = self._at(self.pos, self.seed, self.bounds)
+            self.pos += 1
+            if idx < self.n:
+                return idx
+
+    def peek(self, k):
+        """다음에 나올 k개 인덱스 (위치는 바꾸지 않음)"""
+        if self.n <= 0:
+            return []
+        out = []
+        for idx, _, _, _ in self._walk():
+            if len(out) >= k:
+                break
+            out.append(idx)
+        return out
+
+    def resize(self, n):
+        """덱 크기 변경: 늘어난 부분만 현재 사이클 뒤에 새 구간으로 추가"""
+        if n > self.bounds[-1]:
+            self.bounds.append(n)
+        self.n = n
+
+    def state(self):
+        """config.json에 저장할 상태"""
+        return {"seed": self.seed, "pos": self.pos, "bounds": list(self.bounds)}
+
+    @classmethod
+    def from_state(cls, state, n):
+        """저장된 상태에서 이어서 재생 (형식이 맞지 않으면 새로 시작)"""
+        try:
+            seed = int(state["seed"]) & _M64
+            bounds = [int(b) for b in state["bounds"]]
+            pos = int(state["pos"])
+            if bounds[0] != 0 or any(a >= b for a, b in zip(bounds, bounds[1:])) or not 0 <= pos <= bounds[-1]:
+                raise ValueError(bounds)
+        except (KeyError, TypeError, ValueError, IndexError):
+            return cls(n)
+        return cls(n, seed, pos, bounds)
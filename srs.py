@@ -0,0 +1,275 @@
+"""간격 반복(SM-2) 복습 모드
+
+- 한 번이라도 본 용어만 복습 카드가 되고, 카드는 (due, idx, version) 최소 힙에 들어간다.
+  다음 용어 선택은 힙 top 확인 + pop 이라 O(log n)이며 전체를 훑지 않는다.
+- 복습할 카드가 없으면 기존 셔플 순서에서 새 용어를 가져온다 (처음 보는 순간 카드가 됨).
+  기한이 남은 카드는 건너뛰고, 새 용어가 없으면(거의 모두 카드) 기한이 가장 가까운 카드를 당겨 복습한다.
+  (방금 보여준 카드는 다른 카드가 있으면 연달아 당기지 않음)
+- 채점: 다음 틱으로 넘어갈 때까지 용어를 클릭(검색)하지 않았으면 통과, 클릭했으면 실패.
+  창이 여럿이면 창마다 따로 채점한다 (window 키 - 창 설정 slot, 창이 하나면 None).
+- 복습 기록은 srs.log에 한 줄씩 추가만 하고, 쓸모없는 줄이 많아지면 새 파일로 압축한다.
+"""
+import heapq
+import os
+import time
+
+DAY = 86400
+RELEARN_SECONDS = 600  # 실패한 카드는 10분 뒤 다시
+MIN_EASE = 1.3
+START_EASE = 2.5
+PASS_QUALITY = 4
+LAPSE_QUALITY = 1
+FALLBACK_TRIES = 256  # 셔플 순서에서 새 용어를 찾을 최대 횟수 (틱 하나의 비용 상한)
+
+
+def _escape(text):
+    return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+def _unescape(text):
+    out = []
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch == "\\" and i + 1 < len(text):
+            nxt = text[i + 1]
+            out.append({"t": "\t", "n": "\n"}.get(nxt, nxt))
+            i += 2
+        else:
+            out.append(ch)
+            i += 1
+    return "".join(out)
+
+
+class Card:
+    __slots__ = ("due", "ease", "interval", "reps", "version")
+
+    def __init__(self, due=0.0, ease=START_EASE, interval=0.0, reps=0):
+        self.due = due
+        self.ease = ease
+        self.interval = interval
+        self.reps = reps
+        self.version = 0
+
+
+class SrsScheduler:
+    def __init__(self, log_path, term_at, size, clock=time.time):
+        self.log_path = log_path
+        self.term_at = term_at  # idx -> 용어 문자열 (로그 키)
+        self.size = size
+        self.clock = clock
+        self.cards = {}  # idx -> Card
+        self.heap = []   # (due, idx, version)
+        self.current = {}     # 창 -> 지금 표시 중인 카드 idx (채점 대상이면)
+        self.last_shown = {}  # 창 -> 마지막으로 보여준 idx
+        self.lapsed = set()   # 표시 중인 카드를 클릭(모름)한 창
+        self.log_lines = 0
+        self._log = None
+        self._load()
+
+    # --- 선택 / 채점 ---
+    def next(self, fallback, window=None):
+        """window에 다음에 보여줄 인덱스: 기한이 된 카드 -> 셔플 순서의 새 용어 -> 기한이 가장 가까운 카드"""
+        self.grade_current(window)
+        top = self._top()
+        if top is not None and top[0] <= self.clock():
+            return self._take(top[1], window)
+        # 기한이 된 카드가 없으므로 셔플 순서에서 나온 카드는 모두 기한 전 -> 건너뜀
+        for _ in range(min(FALLBACK_TRIES, self.size)):
+            idx = fallback()
+            if idx not in self.cards:
+                self.current[window] = self.last_shown[window] = idx  # 처음 보는 용어 -> 채점해서 카드로
+                return idx
+        if top is not None:
+            return self._take_early(top[1], window)
+        return fallback()
+
+    def _top(self):
+        """힙 top의 유효한 (due, idx) - 다시 채점되었거나 덱에서 빠진 항목은 버림"""
+        heap = self.heap
+        while heap:
+            due, idx, version = heap[0]
+            card = self.cards.get(idx)
+            if card is not None and card.version == version and idx < self.size:
+                return due, idx
+            heapq.heappop(heap)
+        return None
+
+    def _take(self, idx, window):
+        heapq.heappop(self.heap)
+        self.current[window] = self.last_shown[window] = idx
+        return idx
+
+    def _take_early(self, idx, window):
+        """기한 전 카드 당기기 - 힙 top이 이 창에 방금 보여준 카드면 그다음 카드"""
+        if idx != self.last_shown.get(window):
+            return self._take(idx, window)
+        entry = heapq.heappop(self.heap)
+        other = self._top()
+        if other is not None:
+            self._take(other[1], window)
+        heapq.heappush(self.heap, entry)
+        return other[1] if other is not None else self._take(idx, window)
+
+    def peek_due(self):
+        """기한이 된 카드가 힙 top에 있으면 그 인덱스 (미리 준비용)"""
+        if self.heap:
+            due, idx, version = self.heap[0]
+            card = self.cards.get(idx)
+            if card is not None and card.version == version and due <= self.clock():
+                return idx
+        return None
+
+    def lapse(self, idx, window=None):
+        """window에 표시 중인 용어를 클릭(검색)함 = 모름"""
+        if idx == self.current.get(window):
+            self.lapsed.add(window)
+        elif idx in self.cards:
+            # 채점 대상이 아니던 카드도 클릭하면 곧 다시 나오도록
+            self._review(idx, LAPSE_QUALITY)
+
+    def grade_current(self, window=None):
+        """window에 표시 중이던 카드 채점 (다음 용어로 넘어가거나 창을 닫을 때)"""
+        idx = self.current.pop(window, None)
+        if idx is not None:
+            self._review(idx, LAPSE_QUALITY if window in self.lapsed else PASS_QUALITY)
+        self.lapsed.discard(window)
+
+    def _review(self, idx, quality):
+        card = self.cards.get(idx)
+        if card is None:
+            card = self.cards[idx] = Card()
+        if quality < 3:
+            card.reps = 0
+            card.interval = RELEARN_SECONDS
+        else:
+            card.reps += 1
+            if card.reps == 1:
+                card.interval = DAY
+            elif card.reps == 2:
+                card.interval = 6 * DAY
+            else:
+                card.interval = card.interval * card.ease
+        card.ease = max(MIN_EASE, card.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        card.due = self.clock() + card.interval
+        self._push(idx, card)
+        self._append(idx, card)
+
+    def _push(self, idx, card):
+        card.version += 1
+        heapq.heappush(self.heap, (card.due, idx, card.version))
+
+    # --- 영속화 (추가 전용 로그) ---
+    # 한 줄 = idx \t due \t ease \t interval \t reps \t 용어  (용어는 마지막 칸, 탭/줄바꿈은 이스케이프)
+    def _load(self):
+        records = {}
+        try:
+            with open(self.log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    self.log_lines += 1
+                    parts = line.rstrip("\n").split("\t", 5)
+                    if len(parts) != 6:
+                        continue  # 쓰다 만 마지막 줄 등
+                    term = parts[5]
+                    if "\\" in term:
+                        term = _unescape(term)
+                    records[term] = parts  # 같은 용어는 마지막 줄이 최신
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"SRS log load error: {e}")
+
+        # 기록된 인덱스의 용어가 그대로면 바로 사용, 덱이 바뀌어 어긋난 것만 전체에서 다시 찾음
+        missing = {}
+        for term, parts in records.items():
+            try:
+                idx = int(parts[0])
+                if 0 <= idx < self.size and self.term_at(idx) == term:
+                    self._restore(idx, parts)
+                else:
+                    missing[term] = parts
+            except ValueError:
+                continue
+        if missing:
+            for idx in range(self.size):
+                parts = missing.pop(self.term_at(idx), None)
+                if parts is not None:
+                    self._restore(idx, parts)
+                    if not missing:
+                        break
+        # 카드마다 push 하지 않고 한 번에 힙 구성
+        self.heap = [(card.due, idx, card.version) for idx, card in self.cards.items()]
+        heapq.heapify(self.heap)
+
+        if self.needs_compaction():
+            self.compact()
+
+    def _restore(self, idx, parts):
+        try:
+            card = Card(float(parts[1]), float(parts[2]), float(parts[3]), int(parts[4]))
+        except ValueError:
+            return
+        card.version = 1
+        self.cards[idx] = card
+
+    def _record(self, idx, card):
+        term = self.term_at(idx)
+        if "\\" in term or "\t" in term or "\n" in term:
+            term = _escape(term)
+        return f"{idx}\t{card.due:.1f}\t{card.ease:.3f}\t{card.interval:.1f}\t{card.reps}\t{term}\n"
+
+    def _append(self, idx, card):
+        try:
+            if self._log is None:
+                self._log = open(self.log_path, 'a', encoding='utf-8')
+            self._log.write(self._record(idx, card))
+            self._log.flush()
+            self.log_lines += 1
+        except Exception as e:
+            print(f"SRS log write error: {e}")
+
+    def needs_compaction(self):
+        return self.log_lines > 2 * len(self.cards) + 1000
+
+    def compact(self):
+        """카드당 최신 한 줄만 남긴 새 로그로 원자적 교체"""
+        self._close_log()
+        tmp_path = self.log_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for idx, card in self.cards.items():
+                    f.write(self._record(idx, card))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.log_path)
+            self.log_lines = len(self.cards)
+        except Exception as e:
+            print(f"SRS log compact error: {e}")
+
+    def resize(self, size):
+        self.size = size
+
+    def remap(self, mapping, size):
+        """덱을 다시 불러와 인덱스가 바뀌었을 때: 남은 용어의 카드만 새 인덱스로 옮김"""
+        self.cards = {mapping[idx]: card for idx, card in self.cards.items() if idx in mapping}
+        self.heap = [(card.due, idx, card.version) for idx, card in self.cards.items()]
+        heapq.heapify(self.heap)
+        for window, idx in list(self.current.items()):
+            if idx in mapping:
+                self.current[window] = mapping[idx]
+            else:
+                del self.current[window]
+                self.lapsed.discard(window)
+        self.last_shown = {window: mapping[idx] for window, idx in self.last_shown.items() if idx in mapping}
+        self.size = size
+
+    def _close_log(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def close(self):
+        """종료 시 호출: 로그가 많이 쌓였으면 다음 실행을 위해 압축"""
+        self._close_log()
+        if self.needs_compaction():
+            self.compact()
@@ -0,0 +1,238 @@
+"""학습 기록: 용어 표시(머문 시간) / 클릭 / 일시정지 / 재생 이벤트를 SQLite(WAL)에 모아 쓰기
+
+- UI 스레드는 메모리 버퍼에 튜플 하나를 붙이기만 한다 (sqlite3 import도 하지 않음).
+  기록 스레드는 버퍼가 비어 있으면 잠들어 있다가, 첫 이벤트부터 FLUSH_SECONDS 동안
+  (또는 버퍼가 BATCH 개를 넘을 때까지) 모아서 한 트랜잭션으로 쓴다.
+- 이벤트는 events(ts, term_id, kind, dwell) 에 쌓고, 같은 트랜잭션에서 totals(term_id, kind)
+  누적값도 올려 두므로 용어별 통계는 이벤트 수와 무관하게 기본 키 조회 몇 번이다.
+  용어 문자열은 terms 테이블에 한 번만 저장.
+- ROLLUP_AFTER_DAYS 보다 오래된 이벤트는 하루 단위 rollups(term_id, day, kind, count, dwell)로
+  합치고 지운다 (COMPACT_SECONDS 마다, 기록 스레드에서).
+- DB를 열 수 없거나 기록 스레드가 오류로 끝나면 (한 번만 출력하고) 기록을 끈다.
+  그 뒤의 이벤트는 버퍼에 쌓지 않고 버린다.
+"""
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+SHOWN, CLICK, PAUSE, RESUME = 1, 2, 3, 4
+KIND_NAMES = {SHOWN: "shown", CLICK: "clicks", PAUSE: "pauses", RESUME: "resumes"}
+
+FLUSH_SECONDS = 2.0
+BATCH = 1000
+COMPACT_SECONDS = 6 * 3600
+ROLLUP_AFTER_DAYS = 14
+DAY = 86400
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS terms (id INTEGER PRIMARY KEY, deck TEXT NOT NULL, term TEXT NOT NULL, UNIQUE (deck, term));
+CREATE TABLE IF NOT EXISTS events (ts REAL NOT NULL, term_id INTEGER NOT NULL, kind INTEGER NOT NULL, dwell REAL NOT NULL);
+CREATE INDEX IF NOT EXISTS events_ts ON events (ts);
+CREATE TABLE IF NOT EXISTS totals (term_id INTEGER NOT NULL, kind INTEGER NOT NULL, count INTEGER NOT NULL,
+                                   dwell REAL NOT NULL, PRIMARY KEY (term_id, kind)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS rollups (term_id INTEGER NOT NULL, day INTEGER NOT NULL, kind INTEGER NOT NULL,
+                                    count INTEGER NOT NULL, dwell REAL NOT NULL,
+                                    PRIMARY KEY (term_id, day, kind)) WITHOUT ROWID;
+"""
+
+
+def connect(path):
+    import sqlite3
+    db = sqlite3.connect(path, check_same_thread=False)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")  # WAL에서는 전원이 나가도 DB가 깨지지 않음 (마지막 몇 건만 유실)
+    db.executescript(SCHEMA)
+    return db
+
+
+class StudyLog:
+    def __init__(self, path, clock=time.time, monotonic=time.monotonic):
+        self.path = path
+        self.clock = clock
+        self.monotonic = monotonic
+        self.buffer = deque()  # (ts, deck, term, kind, dwell) - append/popleft는 스레드 안전
+        self.current = {}    # 창 -> [deck, term, 시작 ts, 시작 monotonic, 멈춘 monotonic, 멈춘 시간 합]
+        self.written = 0
+        self.flushes = 0
+        self.disabled = False  # 기록 스레드가 끝남 (DB 열기 / 쓰기 실패)
+        self._wake = threading.Event()
+        self._closing = False
+        self._reader = None
+        self._thread = threading.Thread(target=self._run, name="study-log", daemon=True)
+        self._thread.start()
+
+    # --- UI 스레드 ---
+    def record(self, deck, term, kind, dwell=0.0, ts=None):
+        if self.disabled:
+            return  # 쓸 스레드가 없음 - 버퍼가 끝없이 자라지 않도록
+        self.buffer.append((self.clock() if ts is None else ts, deck, term, kind, dwell))
+        if len(self.buffer) == 1 or len(self.buffer) >= BATCH:
+            self._wake.set()  # 첫 이벤트 (잠든 기록 스레드 깨우기) / 버퍼가 참
+
+    def show(self, window, deck, term):
+        """window에 새 용어가 표시됨 - 이전 용어는 머문 시간(멈춘 시간 제외)과 함께 기록"""
+        self.hide(window)
+        self.current[window] = [deck, term, self.clock(), self.monotonic(), None, 0.0]
+
+    def hide(self, window):
+        shown = self.current.pop(window, None)
+        if shown is None:
+            return
+        deck, term, ts, start, paused_at, paused = shown
+        now = self.monotonic()
+        if paused_at is not None:
+            paused += now - paused_at
+        self.record(deck, term, SHOWN, max(0.0, now - start - paused), ts)
+
+    def pause(self, window):
+        shown = self.current.get(window)
+        if shown is not None:
+            if shown[4] is None:
+                shown[4] = self.monotonic()
+            self.record(shown[0], shown[1], PAUSE)
+
+    def resume(self, window):
+        shown = self.current.get(window)
+        if shown is not None:
+            if shown[4] is not None:
+                shown[5] += self.monotonic() - shown[4]
+                shown[4] = None
+            self.record(shown[0], shown[1], RESUME)
+
+    def click(self, deck, term):
+        self.record(deck, term, CLICK)
+
+    def close(self):
+        """표시 중인 용어까지 기록하고 남은 버퍼를 쓴 뒤 종료"""
+        for window in list(self.current):
+            self.hide(window)
+        self._closing = True
+        self._wake.set()
+        self._thread.join(timeout=10)
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    # --- 기록 스레드 ---
+    def _run(self):
+        try:
+            db = connect(self.path)
+        except Exception as e:
+            print(f"Study log open error: {e}")
+            self._disable()
+            return
+        term_ids = {}
+        next_compact = time.monotonic() + 60  # 시작 직후는 피해서
+        try:
+            while True:
+                if not self.buffer:
+                    self._wake.wait()  # 쌓인 것이 없으면 첫 이벤트까지 잠듦 (창이 숨겨진 동안 깨어나지 않음)
+                if not self._closing:
+                    self._wake.clear()
+                    self._wake.wait(FLUSH_SECONDS)  # 첫 이벤트부터 FLUSH_SECONDS 동안 모음 (BATCH가 차면 바로)
+                self._wake.clear()
+                if self.buffer:
+                    self._flush(db, term_ids)
+                if self._closing:
+                    while self.buffer:  # 쓰는 사이 들어온 것까지
+                        self._flush(db, term_ids)
+                    break
+                if time.monotonic() >= next_compact:
+                    next_compact = time.monotonic() + COMPACT_SECONDS
+                    compact(db, self.clock() - ROLLUP_AFTER_DAYS * DAY)
+        except Exception as e:
+            print(f"Study log error: {e}")
+            self._disable()
+        finally:
+            db.close()
+
+    def _disable(self):
+        self.disabled = True
+        self.buffer.clear()  # 쌓여 있던 이벤트는 버림
+
+    def _flush(self, db, term_ids):
+        # 지금까지 쌓인 것만 떼어 냄 (그 사이 UI 스레드가 붙이는 것은 다음 번에)
+        buffer = self.buffer
+        batch = [buffer.popleft() for _ in range(len(buffer))]
+        rows = []
+        with db:
+            for ts, deck, term, kind, dwell in batch:
+                key = (deck, term)
+                term_id = term_ids.get(key)
+                if term_id is None:
+                    db.execute("INSERT OR IGNORE INTO terms (deck, term) VALUES (?, ?)", key)
+                    row = db.execute("SELECT id FROM terms WHERE deck = ? AND term = ?", key).fetchone()
+                    term_id = term_ids[key] = row[0]
+                rows.append((ts, term_id, kind, dwell))
+            append_events(db, rows)
+        self.written += len(rows)
+        self.flushes += 1
+
+    # --- 조회 (기록 스레드와 별도 연결 - WAL이라 쓰는 중에도 막히지 않음) ---
+    def stats(self, deck, term):
+        if self._reader is None:
+            self._reader = connect(self.path)
+        return term_stats(self._reader, deck, term)
+
+
+def append_events(db, rows):
+    """(ts, term_id, kind, dwell) 이벤트 추가 + totals 누적 (호출한 쪽의 트랜잭션 안에서)"""
+    db.executemany("INSERT INTO events VALUES (?, ?, ?, ?)", rows)
+    totals = {}
+    for _, term_id, kind, dwell in rows:
+        total = totals.get((term_id, kind))
+        if total is None:
+            totals[(term_id, kind)] = [1, dwell]
+        else:
+            total[0] += 1
+            total[1] += dwell
+    db.executemany("""
+        INSERT INTO totals VALUES (?, ?, ?, ?)
+        ON CONFLICT (term_id, kind) DO UPDATE SET count = count + excluded.count, dwell = dwell + excluded.dwell
+    """, ((term_id, kind, count, dwell) for (term_id, kind), (count, dwell) in totals.items()))
+
+
+def compact(db, before_ts):
+    """before_ts 이전 이벤트를 하루 단위 rollups로 합치고 지움 -> 합친 이벤트 수 (totals는 그대로)"""
+    with db:
+        db.execute("""
+            INSERT INTO rollups (term_id, day, kind, count, dwell)
+            SELECT term_id, CAST(ts / 86400 AS INTEGER), kind, COUNT(*), SUM(dwell)
+            FROM events WHERE ts < ? GROUP BY 1, 2, 3
+            ON CONFLICT (term_id, day, kind) DO UPDATE SET count = count + excluded.count, dwell = dwell + excluded.dwell
+        """, (before_ts,))
+        return db.execute("DELETE FROM events WHERE ts < ?", (before_ts,)).rowcount
+
+
+def term_stats(db, deck, term):
+    """용어 하나의 누적 통계 {"shown", "clicks", "pauses", "resumes", "dwell"}"""
+    stats = {name: 0 for name in KIND_NAMES.values()}
+    stats["dwell"] = 0.0
+    row = db.execute("SELECT id FROM terms WHERE deck = ? AND term = ?", (deck, term)).fetchone()
+    if row is None:
+        return stats
+    for kind, count, dwell in db.execute("SELECT kind, count, dwell FROM totals WHERE term_id = ?", (row[0],)):
+        name = KIND_NAMES.get(kind)
+        if name is not None:
+            stats[name] += count
+        if kind == SHOWN:
+            stats["dwell"] += dwell
+    return stats
+
+
+def top_terms(db, kind=CLICK, limit=20):
+    """kind 이벤트가 많은 용어 -> [(deck, term, count)]"""
+    return db.execute("""
+        SELECT t.deck, t.term, s.count FROM totals s JOIN terms t ON t.id = s.term_id
+        WHERE s.kind = ? ORDER BY s.count DESC LIMIT ?
+    """, (kind, limit)).fetchall()
+
+
+if __name__ == "__main__":
+    # 많이 클릭한(모르는) 용어 보기: python studylog.py [study.db]
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), "study.db")
+    db = connect(path)
+    for deck, term, count in top_terms(db):
+        print(f"{count:6d}  [{deck}] {term}")
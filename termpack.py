@@ -0,0 +1,249 @@
+"""terms.json을 인덱스가 있는 바이너리 팩(terms.pack)으로 컴파일하고 mmap으로 여는 모듈
+
+팩 구조 (모두 little-endian)
+    헤더   : magic(4) version(H) reserved(H) count(I) src_mtime_ns(q) src_size(Q) src_sha1(20s)
+    인덱스 : (count * 2 + 1)개의 uint64 오프셋 - blob 시작 기준
+    blob   : term0 desc0 term1 desc1 ... (UTF-8)
+
+i번째 항목의 term은 offsets[2i]:offsets[2i+1], desc는 offsets[2i+1]:offsets[2i+2] 구간.
+
+팩 파일을 쓸 수 없을 때(읽기 전용 폴더 등)는 같은 구조를 메모리에 두는 TermColumns를 쓴다.
+"""
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+
+MAGIC = b"TMPK"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIqQ20s")
+OFFSET = struct.Struct("<Q")
+
+
+def pack_path_for(json_path):
+    """terms.json -> terms.pack"""
+    return os.path.splitext(json_path)[0] + ".pack"
+
+
+def file_sha1(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+class PackWriter:
+    """팩 파일을 항목 단위로 스트리밍 작성
+
+    blob은 임시 파일에 바로 쓰고 메모리에는 오프셋(항목당 16바이트)만 둔다.
+    finish()에서 헤더 + 인덱스를 쓰고 blob을 이어 붙인 뒤 교체한다.
+    """
+
+    def __init__(self, pack_path):
+        self.pack_path = pack_path
+        self.offsets = array('Q', [0])
+        self._pos = 0
+        self._blob = tempfile.TemporaryFile()
+
+    def add(self, term, desc):
+        self.add_encoded(term.encode("utf-8"), desc.encode("utf-8"))
+
+    def add_encoded(self, term_raw, desc_raw):
+        """이미 UTF-8로 인코딩된 항목 추가"""
+        blob = self._blob
+        blob.write(term_raw)
+        blob.write(desc_raw)
+        self._pos += len(term_raw)
+        self.offsets.append(self._pos)
+        self._pos += len(desc_raw)
+        self.offsets.append(self._pos)
+
+    @property
+    def count(self):
+        return (len(self.offsets) - 1) // 2
+
+    def finish(self, src_mtime_ns=0, src_size=0, src_sha1=b"\0" * 20):
+        tmp_path = self.pack_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION, 0, self.count, src_mtime_ns, src_size, src_sha1))
+                if sys.byteorder != "little":
+                    self.offsets.byteswap()
+                self.offsets.tofile(f)
+                self._blob.seek(0)
+                shutil.copyfileobj(self._blob, f, 1 << 20)
+        finally:
+            self._blob.close()
+        os.replace(tmp_path, self.pack_path)
+        return self.count
+
+    def abort(self):
+        self._blob.close()
+
+
+def write_pack(entries, pack_path, src_mtime_ns=0, src_size=0, src_sha1=b"\0" * 20):
+    """(term, desc) 문자열 쌍 목록으로 팩 파일 작성 (임시 파일에 쓴 뒤 교체)"""
+    writer = PackWriter(pack_path)
+    try:
+        for term, desc in entries:
+            writer.add(term, desc)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.finish(src_mtime_ns, src_size, src_sha1)
+
+
+def _entries_from_json(data):
+    for item in data:
+        yield str(item.get("term", "")), str(item.get("desc", ""))
+
+
+def build_pack(json_path, pack_path=None):
+    """terms.json을 읽어 팩으로 컴파일"""
+    pack_path = pack_path or pack_path_for(json_path)
+    st = os.stat(json_path)
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    write_pack(_entries_from_json(data), pack_path, st.st_mtime_ns, st.st_size, file_sha1(json_path))
+    return pack_path
+
+
+def _read_header(pack_path):
+    try:
+        with open(pack_path, "rb") as f:
+            raw = f.read(HEADER.size)
+    except OSError:
+        return None
+    if len(raw) != HEADER.size:
+        return None
+    header = HEADER.unpack(raw)
+    if header[0] != MAGIC or header[1] != VERSION:
+        return None
+    return header
+
+
+def ensure_pack(json_path, pack_path=None):
+    """팩이 없거나 terms.json이 바뀌었으면 다시 빌드하고 팩 경로를 반환
+
+    mtime/크기가 같으면 그대로 사용하고, mtime만 바뀐 경우(복사, touch 등)에는
+    SHA-1을 비교해서 내용이 같으면 헤더만 갱신한다.
+    """
+    pack_path = pack_path or pack_path_for(json_path)
+    st = os.stat(json_path)
+    header = _read_header(pack_path)
+    if header is not None:
+        _, _, _, _, mtime_ns, size, sha1 = header
+        if mtime_ns == st.st_mtime_ns and size == st.st_size:
+            return pack_path
+        if size == st.st_size and sha1 == file_sha1(json_path):
+            with open(pack_path, "r+b") as f:
+                f.write(HEADER.pack(MAGIC, VERSION, 0, header[3], st.st_mtime_ns, size, sha1))
+            return pack_path
+    return build_pack(json_path, pack_path)
+
+
+class TermPack:
+    """mmap 기반 읽기 전용 용어 목록
+
+    self.terms[idx]['term'] 형태의 기존 접근 방식을 그대로 지원하며,
+    인덱싱할 때 해당 항목 하나만 디코딩한다.
+    """
+
+    def __init__(self, pack_path):
+        self.path = pack_path
+        self._file = open(pack_path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        magic, version, _, count, _, _, _ = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a term pack: {pack_path}")
+        self._count = count
+        self._index_start = HEADER.size
+        self._blob_start = HEADER.size + (count * 2 + 1) * OFFSET.size
+
+    def __len__(self):
+        return self._count
+
+    def _text(self, start, end):
+        base = self._blob_start
+        return self._mm[base + start:base + end].decode("utf-8")
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += self._count
+        if not 0 <= idx < self._count:
+            raise IndexError("term index out of range")
+        a, b, c = struct.unpack_from("<3Q", self._mm, self._index_start + idx * 2 * OFFSET.size)
+        return {"term": self._text(a, b), "desc": self._text(b, c)}
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+
+class TermColumns:
+    """메모리 안의 열 형식 용어 목록 (UTF-8 blob 하나 + array('I') 오프셋)
+
+    항목마다 dict/str 객체를 들고 있지 않으므로 항목당 추가 비용은 오프셋 8바이트뿐이다.
+    TermPack과 같이 self.terms[idx]['term'] 으로 접근하고, 인덱싱할 때 그 항목만 디코딩한다.
+    """
+
+    def __init__(self, blob, offsets):
+        self._blob = blob
+        self._offsets = offsets
+        self._count = (len(offsets) - 1) // 2
+
+    @classmethod
+    def from_entries(cls, entries):
+        """(term, desc) 문자열 쌍 목록으로 만들기 - blob 합계가 4GB를 넘으면 OverflowError"""
+        buf = bytearray()
+        offsets = array('I', [0])
+        for term, desc in entries:
+            for text in (term, desc):
+                buf += text.encode("utf-8")
+                offsets.append(len(buf))
+        return cls(buf, offsets)  # bytes()로 복사하면 만드는 동안 최대 메모리가 두 배
+
+    def __len__(self):
+        return self._count
+
+    def _text(self, start, end):
+        return self._blob[start:end].decode("utf-8")
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += self._count
+        if not 0 <= idx < self._count:
+            raise IndexError("term index out of range")
+        offsets = self._offsets
+        i = idx * 2
+        return {"term": self._text(offsets[i], offsets[i + 1]), "desc": self._text(offsets[i + 1], offsets[i + 2])}
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def nbytes(self):
+        """blob + 오프셋 배열 크기 (바이트)"""
+        return len(self._blob) + len(self._offsets) * self._offsets.itemsize
+
+
+def open_pack(json_path):
+    """terms.json에 대응하는 팩을 (필요하면 빌드해서) 연다"""
+    return TermPack(ensure_pack(json_path))
@@ -0,0 +1,49 @@
+"""공용 픽스처: 디스플레이 없이 쓰는 가상 시계 / 임시 덱 / 엔진
+
+가상 시계 이벤트 루프 / 가상 사용자는 simloop.py (benchmarks/ 스크립트도 함께 씀).
+"""
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import engine  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def write_deck(base, size):
+    with open(os.path.join(base, "terms.json"), "w", encoding="utf-8") as f:
+        json.dump([{"term": f"용어{i}", "desc": f"설명 {i}"} for i in range(size)], f, ensure_ascii=False)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def make_engine(tmp_path, clock):
+    """make_engine(size) -> 임시 폴더의 terms.json(size개)을 불러온 MarqueeEngine (끝나면 close)"""
+    engines = []
+
+    def make(size=1000):
+        write_deck(str(tmp_path), size)
+        eng = engine.MarqueeEngine(str(tmp_path), clock)
+        eng.load()
+        engines.append(eng)
+        return eng
+
+    yield make
+    for eng in engines:
+        eng.close()
@@ -0,0 +1,63 @@
+"""테스트 / 벤치마크 공용 가상 시계 이벤트 루프 (디스플레이 없이 after 를 흉내)
+
+after 는 0~TIMER_LATE 늦게 울리고, work() 는 콜백 하나의 작업 시간(0~WORK)만큼 시계를 넘긴다.
+User 는 같은 시계 위의 가상 사용자 입력 (절전의 자리 비움 판단용).
+benchmarks/ 스크립트도 이 모듈을 가져다 쓴다.
+"""
+import heapq
+import itertools
+import random
+
+TIMER_LATE = 0.015
+WORK = 0.005
+
+
+class SimRoot:
+    """가상 시계 이벤트 루프 (after / after_cancel 만 제공)"""
+
+    def __init__(self, seed=1):
+        self.now = 0.0
+        self.rng = random.Random(seed)
+        self.queue = []
+        self.cancelled = set()
+        self.ids = itertools.count(1)
+        self.wakeups = 0
+
+    def clock(self):
+        return self.now
+
+    def after(self, ms, callback, *args):
+        job = next(self.ids)
+        heapq.heappush(self.queue, (self.now + ms / 1000 + self.rng.uniform(0, TIMER_LATE), job, callback, args))
+        return job
+
+    def after_cancel(self, job):
+        self.cancelled.add(job)
+
+    def work(self):
+        self.now += self.rng.uniform(0, WORK)
+
+    def run_until(self, end):
+        while self.queue and self.queue[0][0] <= end:
+            when, job, callback, args = heapq.heappop(self.queue)
+            if job in self.cancelled:
+                self.cancelled.discard(job)
+                continue
+            self.now = max(self.now, when)
+            self.wakeups += 1
+            callback(*args)
+        self.now = max(self.now, end)
+
+
+class User:
+    """가상 사용자 입력 시각 (tk inactive 대신)"""
+
+    def __init__(self, root):
+        self.root = root
+        self.last_input = 0.0
+        self.present = True
+
+    def inactive_ms(self):
+        if self.present:
+            self.last_input = self.root.now
+        return int((self.root.now - self.last_input) * 1000)
@@ -0,0 +1,72 @@
+"""config.json 지연 쓰기: 설정 변경은 디스크를 기다리지 않고, 쓰기 횟수는 시간에 비례해 제한됨"""
+import json
+import os
+import time
+
+import configstore
+
+DEFAULTS = {"theme_name": "Yellow", "interval_seconds": 10, "width": 600, "height": 300}
+
+
+def change(config, store, i):
+    # change_theme / change_interval / adjust_window_to_content 가 하는 일
+    config["theme_name"] = ["Yellow", "Pink", "Green", "Blue"][i % 4]
+    config["interval_seconds"] = 5 + i % 12 * 5
+    config["width"] = 400 + i % 400
+    store.mark_dirty()
+
+
+def saved(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_setters_do_not_wait_for_disk(tmp_path):
+    path = str(tmp_path / "config.json")
+    store = configstore.ConfigStore(path, debounce=0.01, max_delay=0.05)
+    config = store.load(DEFAULTS)
+    # 디스크가 멈춘 상황: 쓰기 잠금을 잡고 있어도 설정 변경은 바로 돌아와야 함
+    with store._write_lock:
+        t0 = time.monotonic()
+        for i in range(1000):
+            change(config, store, i)
+        assert time.monotonic() - t0 < 1.0
+        time.sleep(0.1)  # 백그라운드 쓰기가 잠금에서 기다리는 동안
+        assert store.writes == 0
+    store.close()
+    assert saved(path) == config
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_writes_are_bounded_while_hammering(tmp_path):
+    path = str(tmp_path / "config.json")
+    store = configstore.ConfigStore(path, debounce=0.05, max_delay=0.2)
+    config = store.load(DEFAULTS)
+    t0 = time.monotonic()
+    calls = 0
+    while time.monotonic() - t0 < 1.0:
+        change(config, store, calls)
+        calls += 1
+    elapsed = time.monotonic() - t0
+    writes_during = store.writes
+    store.close()
+    # 계속 바뀌어도 max_delay마다 한 번 이하 (+ 종료 시 한 번)
+    assert writes_during <= elapsed / store.max_delay + 1
+    assert store.writes <= writes_during + 1
+    assert calls > 100 * store.writes
+    assert saved(path) == config
+
+
+def test_quiet_changes_are_coalesced(tmp_path):
+    path = str(tmp_path / "config.json")
+    store = configstore.ConfigStore(path, debounce=0.05, max_delay=1.0)
+    config = store.load(DEFAULTS)
+    for i in range(50):
+        change(config, store, i)
+    deadline = time.monotonic() + 5
+    while store.writes == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert store.writes == 1
+    assert saved(path) == config
+    store.close()
+    assert store.writes == 1
@@ -0,0 +1,69 @@
+"""혼합 덱: 가중치가 0인 덱은 빼고, 모두 0이면 만들 때 거절 (틱에서 터지지 않음)"""
+import json
+import os
+import random
+import time
+
+import pytest
+
+import decks
+import shuffle
+
+
+def write_part(base, name, size):
+    os.makedirs(os.path.join(base, "decks"), exist_ok=True)
+    with open(os.path.join(base, "decks", name + ".json"), "w", encoding="utf-8") as f:
+        f.write("[" + ",".join(f'{{"term": "{name}{i}", "desc": "d"}}' for i in range(size)) + "]")
+
+
+def test_zero_weight_parts_are_dropped():
+    a = [{"term": f"a{i}", "desc": ""} for i in range(10)]
+    b = [{"term": f"b{i}", "desc": ""} for i in range(10)]
+    deck = decks.MixedDeck([("a", a, 0), ("b", b, "2"), ("c", a, "x"), ("d", a, -1)])
+    assert deck.names == ["b"] and deck.weights == [2.0] and len(deck) == 10
+    with pytest.raises(ValueError):
+        decks.MixedDeck([("a", a, 0), ("b", b, 0.0)])
+    # inf / NaN / 아주 큰 값도 거절 - 남은 덱으로 뽑기가 그대로 됨
+    deck = decks.MixedDeck([("a", a, float("inf")), ("b", b, 1), ("c", a, float("nan")), ("d", a, 1e308), ("e", a, 10**400)])
+    assert deck.names == ["b"]
+    order = decks.MixedOrder(deck, [shuffle.LazyShuffle(10, seed=1)], random.Random(1))
+    assert sorted(order.next() for _ in range(10)) == list(range(10))
+
+
+def test_all_zero_mix_is_rejected_not_crashing_the_tick(make_engine, tmp_path):
+    eng = make_engine(100)
+    write_part(str(tmp_path), "A", 20)
+    write_part(str(tmp_path), "B", 20)
+    eng.config["mixed_decks"] = {"A": 0, "B": 0}
+    assert eng.switch_deck(decks.MIXED_DECK) is False
+    assert eng.deck_name == decks.DEFAULT_DECK
+    eng.next_term_index()
+
+    eng.config["mixed_decks"] = {"A": 0, "B": 1}
+    assert eng.switch_deck(decks.MIXED_DECK) is True
+    assert all(eng.terms[eng.next_term_index()]["term"].startswith("B") for _ in range(50))
+
+
+def wait_reload(eng):
+    eng.check_deck()
+    for _ in range(500):
+        if not eng.deck_reloading:
+            break
+        time.sleep(0.01)
+    return eng.take_deck_update()
+
+
+def test_deck_changed_while_another_is_shown_is_reloaded(make_engine, tmp_path):
+    eng = make_engine(100)
+    write_part(str(tmp_path), "B", 20)
+    assert eng.switch_deck("B") is True
+    # 다른 덱을 보는 사이 기본 덱 파일이 바뀜 (덱 동기화 등)
+    with open(tmp_path / "terms.json", "w", encoding="utf-8") as f:
+        json.dump([{"term": f"용어{i}", "desc": f"새 설명 {i}"} for i in range(120)], f, ensure_ascii=False)
+    assert eng.switch_deck(decks.DEFAULT_DECK) is True
+    update = wait_reload(eng)
+    assert update is not None and update.added == 20 and update.changed == 100
+    assert len(eng.terms) == 120 and eng.terms[0]["desc"] == "새 설명 0"
+    # 같은 파일이면 다시 읽지 않음
+    assert eng.switch_deck("B") is True and eng.switch_deck(decks.DEFAULT_DECK) is True
+    assert not eng.deck_watcher.changed()
@@ -0,0 +1,67 @@
+"""덱 동기화: 절전 중에는 스레드가 깨어나지 않고, 풀리면 다음 시도 시각이 지났을 때만 동기화"""
+import threading
+import time
+
+import decksync
+
+
+class CountingSync(decksync.DeckSync):
+    """네트워크 없이 sync_once 호출만 셈 (monotonic은 가상 시계)"""
+
+    def __init__(self, deck_path, interval, clock):
+        super().__init__("http://127.0.0.1:9/terms.json", deck_path, interval, monotonic=clock)
+        self.calls = 0
+        self.synced = threading.Event()
+
+    def sync_once(self):
+        self.calls += 1
+        self.synced.set()
+
+
+def flicker(sync):
+    """창이 가려졌다가 다시 보임"""
+    sync.synced.clear()
+    sync.set_suspended(True)
+    time.sleep(0.05)
+    sync.set_suspended(False)
+
+
+def test_no_sync_while_suspended(tmp_path, clock):
+    sync = CountingSync(str(tmp_path / "terms.json"), 0.02, clock)
+    sync.set_suspended(True)
+    sync.start()
+    clock.now += 3600
+    time.sleep(0.3)
+    assert sync.calls == 0  # 실제 주기(20ms)가 여러 번 지나도 한 번도 안 함
+    sync.set_suspended(False)
+    assert sync.synced.wait(5)  # 한 번도 안 했으므로 바로
+    sync.close()
+
+
+def test_resume_waits_for_the_next_due_time(tmp_path, clock):
+    sync = CountingSync(str(tmp_path / "terms.json"), 600, clock)
+    sync.start()
+    assert sync.synced.wait(5) and sync.calls == 1
+    for _ in range(5):
+        clock.now += 60
+        flicker(sync)
+    time.sleep(0.2)
+    assert sync.calls == 1  # 10분 주기 중 5분만 지남 -> 다시 보여도 요청하지 않음
+
+    clock.now += 301
+    flicker(sync)
+    assert sync.synced.wait(5) and sync.calls == 2  # 멈춘 사이 기한이 지났으면 바로
+    sync.close()
+
+
+def test_resume_keeps_backoff(tmp_path, clock):
+    sync = CountingSync(str(tmp_path / "terms.json"), 600, clock)
+    sync.failures = 3  # 실패 중: 백오프(2분 이상) 동안은 다시 보여도 요청하지 않음
+    sync.start()
+    assert sync.synced.wait(5)
+    assert sync.retry_after >= decksync.MIN_BACKOFF * 2
+    clock.now += sync.retry_after - 1
+    flicker(sync)
+    time.sleep(0.2)
+    assert sync.calls == 1
+    sync.close()
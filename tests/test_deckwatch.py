@@ -0,0 +1,93 @@
+"""덱 증분 비교: 남은 용어는 인덱스 유지, 빈자리는 새 용어 -> 맨 뒤 항목 순으로 채움"""
+import random
+
+import deckwatch
+
+
+def deck(*names):
+    return [{"term": name, "desc": f"{name} 설명"} for name in names]
+
+
+def entries(*names):
+    return [(name, f"{name} 설명") for name in names]
+
+
+def check(old, new, update):
+    """병합 결과가 새 목록과 같은 집합이고, mapping/개수가 실제 차이와 맞는지"""
+    old_terms = {data["term"] for data in old}
+    new_map = dict(reversed(new))  # 같은 이름은 첫 번째 것
+    assert dict(update.entries) == new_map and len(update.entries) == len(new_map)
+    assert update.added == len(new_map.keys() - old_terms)
+    assert update.removed == len(old) - len(update.mapping)
+    assert update.changed == sum(data["desc"] != new_map[data["term"]]
+                                 for i, data in enumerate(old) if i in update.mapping)
+    for i, j in update.mapping.items():
+        assert update.entries[j][0] == old[i]["term"]
+    assert sorted(update.mapping.values()) == sorted(set(update.mapping.values()))
+
+
+def test_unchanged_deck_gives_none():
+    assert deckwatch.diff_deck(deck("a", "b", "c"), entries("c", "a", "b")) is None
+    assert deckwatch.diff_deck(deck("a", "b"), entries("a", "b", "a")) is None  # 중복은 첫 번째만
+
+
+def test_kept_terms_keep_their_index():
+    old = deck("a", "b", "c", "d")
+    new = entries("d", "x", "b", "a", "c")
+    update = deckwatch.diff_deck(old, new)
+    assert update.mapping == {0: 0, 1: 1, 2: 2, 3: 3}
+    assert update.entries[4] == ("x", "x 설명")
+    assert (update.added, update.removed, update.changed) == (1, 0, 0)
+    check(old, new, update)
+
+
+def test_removed_slots_are_filled_by_added_terms():
+    old = deck("a", "b", "c", "d")
+    new = entries("a", "y", "c", "x", "z")
+    update = deckwatch.diff_deck(old, new)
+    assert update.mapping == {0: 0, 2: 2}
+    assert [term for term, desc in update.entries] == ["a", "y", "c", "x", "z"]
+    assert (update.added, update.removed, update.changed) == (3, 2, 0)
+    check(old, new, update)
+
+
+def test_leftover_holes_are_filled_from_the_tail():
+    old = deck("a", "b", "c", "d", "e", "f")
+    new = entries("a", "c", "e", "f")
+    update = deckwatch.diff_deck(old, new)
+    # 뒤쪽 빈자리부터: d(3) 자리에 f, b(1) 자리에 e를 옮김
+    assert [term for term, desc in update.entries] == ["a", "e", "c", "f"]
+    assert update.mapping == {0: 0, 2: 2, 4: 1, 5: 3}
+    assert (update.added, update.removed, update.changed) == (0, 2, 0)
+    check(old, new, update)
+
+    # 빈자리가 맨 끝이면 옮기지 않고 줄이기만
+    update = deckwatch.diff_deck(old, entries("a", "b", "c", "d"))
+    assert update.mapping == {0: 0, 1: 1, 2: 2, 3: 3} and len(update.entries) == 4
+
+
+def test_changed_desc_is_not_counted_as_added():
+    old = deck("a", "b", "c")
+    new = [("a", "a 설명"), ("b", "새 설명"), ("c", "c 설명"), ("d", "d 설명")]
+    update = deckwatch.diff_deck(old, new)
+    assert (update.added, update.removed, update.changed) == (1, 0, 1)
+    assert update.entries[1] == ("b", "새 설명") and update.mapping[1] == 1
+    check(old, new, update)
+
+    # 이름이 바뀌면 지우고 새로 추가한 것 (같은 자리에 들어감)
+    update = deckwatch.diff_deck(old, [("a", "a 설명"), ("B", "b 설명"), ("c", "c 설명")])
+    assert (update.added, update.removed, update.changed) == (1, 1, 0)
+    assert update.entries[1] == ("B", "b 설명") and 1 not in update.mapping
+
+
+def test_random_edits_match_the_set_difference():
+    rng = random.Random(7)
+    for _ in range(300):
+        old = deck(*rng.sample(range(60), rng.randint(0, 30)))
+        new = [(name, rng.choice(["", f"{name} 설명"]))
+               for name in rng.choices(range(60), k=rng.randint(1, 30))]
+        update = deckwatch.diff_deck(old, new)
+        if update is None:
+            assert {d["term"]: d["desc"] for d in old} == dict(reversed(new))
+        else:
+            check(old, new, update)
@@ -0,0 +1,64 @@
+"""엔진 성능 회귀 추적 (pytest-benchmark): 틱 / 리사이즈 / 테마 변경을 디스플레이 없이
+
+python -m pytest tests/test_engine_perf.py --benchmark-autosave   # 결과 저장
+python -m pytest tests/test_engine_perf.py --benchmark-compare    # 지난 결과와 비교
+(benchmarks/bench_engine.py 와 같은 동작을 CI에서 반복 측정)
+"""
+import itertools
+
+import engine
+import textmetrics
+
+DECK_SIZE = 20000
+
+
+def ticker(eng, clock):
+    """틱 하나 (update_term 이 엔진에 하는 일) -> 다음 5개 인덱스"""
+    def tick():
+        eng.last_index = eng.next_term_index()
+        clock.now += 60
+        return eng.upcoming_indices(5)
+    return tick
+
+
+def test_tick(benchmark, make_engine, clock):
+    eng = make_engine(DECK_SIZE)
+    upcoming = benchmark(ticker(eng, clock))
+    assert len(upcoming) == 5 and all(0 <= i < DECK_SIZE for i in upcoming)
+
+
+def test_tick_srs(benchmark, make_engine, clock):
+    eng = make_engine(DECK_SIZE)
+    eng.set_srs(True)
+    tick = ticker(eng, clock)
+    for _ in range(3):
+        tick()  # 카드는 다음 틱에서 채점되므로 벤치마크 횟수와 상관없이 카드가 있도록
+    cards = len(eng.srs.cards)
+    assert cards >= 2
+    benchmark(tick)
+    assert len(eng.srs.cards) >= cards
+
+
+def test_resize(benchmark, make_engine):
+    layout = make_engine(100).layout
+    sizes = itertools.count()
+
+    def resize():
+        i = next(sizes)
+        width = 300 + (i * 7) % 900
+        height = 150 + (i * 5) % 600
+        layout.header_for(height)
+        layout.font_size_for(width, 1.0 + (i % 5) * 0.1)
+        return layout.window_for(textmetrics.TextLayout(width - 150, 1 + i % 4, 30 + 20 * (i % 4)))
+
+    width, height = benchmark(resize)
+    assert engine.LayoutCalculator.MIN_WIDTH <= width <= engine.LayoutCalculator.MAX_WIDTH
+    assert engine.LayoutCalculator.MIN_HEIGHT <= height <= engine.LayoutCalculator.MAX_HEIGHT
+
+
+def test_theme_change(benchmark, make_engine):
+    eng = make_engine(100)
+    names = itertools.cycle(engine.THEMES)
+
+    theme = benchmark(lambda: eng.set_theme(next(names)))
+    assert theme in engine.THEMES.values()
@@ -0,0 +1,27 @@
+"""리사이즈/줌 이벤트가 아무리 많아도 레이아웃 패스는 프레임당 한 번"""
+import layoutsched
+from simloop import SimRoot
+
+
+def test_one_layout_pass_per_frame():
+    root = SimRoot()
+    passes = []
+    sched = layoutsched.FrameScheduler(root, lambda: passes.append(root.now))
+    # 1초 동안 1ms마다 <Configure> (창 끌어서 크기 바꾸기)
+    for ms in range(1000):
+        root.run_until(ms / 1000)
+        sched.request()
+    root.run_until(2.0)
+    assert 1000 / (layoutsched.FRAME_MS + 15) <= len(passes) <= 1000 / layoutsched.FRAME_MS + 1
+    gaps = [b - a for a, b in zip(passes, passes[1:])]
+    assert min(gaps) >= layoutsched.FRAME_MS / 1000
+
+
+def test_cancel_drops_pending_pass():
+    root = SimRoot()
+    passes = []
+    sched = layoutsched.FrameScheduler(root, lambda: passes.append(root.now))
+    sched.request()
+    sched.cancel()
+    root.run_until(1.0)
+    assert passes == []
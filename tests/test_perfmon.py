@@ -0,0 +1,94 @@
+"""성능 계측: 감싼 전환 틱 콜백의 소요 시간이 오버레이와 JSONL 내보내기에 나옴"""
+import json
+import time
+
+import perfmon
+import powersave
+import ticksched
+from simloop import SimRoot, TIMER_LATE
+
+
+def sim_ticks():
+    root = SimRoot()
+    return root, ticksched.TickScheduler(root, root.clock)
+
+
+class View:
+    def __init__(self):
+        self.slow = False
+
+    def update_term(self):
+        if self.slow:
+            time.sleep(0.03)
+
+    def layout_pass(self):
+        pass
+
+
+def test_tick_callback_is_reported(tmp_path):
+    path = tmp_path / "perf.jsonl"
+    perf = perfmon.PerfMonitor(sim_ticks()[1], str(path))
+    view = View()
+    perf.instrument(view, ("update_term",))
+    for _ in range(20):
+        view.update_term()
+    view.slow = True
+    view.update_term()
+
+    text = perf.overlay_text()
+    assert text.splitlines()[0].startswith("tick p99")
+    assert "1/21 over frame" in text
+
+    perf.close()
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    tick = next(row for row in rows if row["name"] == perfmon.PerfMonitor.TICK)
+    assert tick["count"] == 21 and tick["over_frame"] == 1 and tick["max_ms"] >= 30
+
+
+def test_layout_pass_rate_is_reported(tmp_path):
+    path = tmp_path / "perf.jsonl"
+    perf = perfmon.PerfMonitor(sim_ticks()[1], str(path))
+    view = View()
+    perf.instrument(view, ("layout_pass",))
+    perf.window_start -= 2.0  # 2초 동안
+    for _ in range(100):
+        view.layout_pass()
+
+    assert 45 <= perf.rate(perfmon.PerfMonitor.LAYOUT) <= 50
+    line = perf.overlay_text().splitlines()[0]
+    assert line.startswith("layout ") and "/s" in line
+
+    perf.close()
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    layout = next(row for row in rows if row["name"] == perfmon.PerfMonitor.LAYOUT)
+    assert layout["count"] == 100 and 45 <= layout["per_s"] <= 50
+
+
+def test_deck_switch_time_is_reported(tmp_path):
+    perf = perfmon.PerfMonitor(sim_ticks()[1], str(tmp_path / "perf.jsonl"))
+    perf.record_deck_switch(0.120)
+    assert any(line.startswith("deck_switch x1 p99") for line in perf.overlay_text().splitlines())
+    assert perf.summary()[perfmon.PerfMonitor.DECK_SWITCH]["max_ms"] == 120.0
+
+
+def test_heartbeat_is_suspended_with_other_timers(tmp_path):
+    root, ticks = sim_ticks()
+    perf = perfmon.PerfMonitor(ticks, str(tmp_path / "perf.jsonl"))
+    perf.start()
+    root.run_until(10)
+    lag = perf.histogram(perfmon.PerfMonitor.LOOP_LAG)
+    assert lag.count >= 90 and lag.max <= TIMER_LATE + 0.002  # 늦게 울린 만큼 = 루프 지연
+
+    power = powersave.PowerSaver(ticks)
+    power.set_hidden("window", True)
+    before = root.wakeups
+    root.run_until(root.now + 600)
+    assert root.wakeups == before  # 가려진 동안 하트비트/내보내기로 깨어나지 않음
+    assert not (tmp_path / "perf.jsonl").exists()
+
+    beats = lag.count
+    power.set_hidden("window", False)
+    root.run_until(root.now + 1)
+    assert lag.count > beats and lag.max <= TIMER_LATE + 0.002  # 멈춘 시간은 지연으로 안 잡힘
+    perf.close()
+    assert ticks.timelines == []
@@ -0,0 +1,77 @@
+"""절전: 모든 창이 가려지면 타이머로 한 번도 깨어나지 않고, 자리 비움이면 복귀 확인만 돎"""
+import pytest
+
+import powersave
+import ticksched
+from simloop import SimRoot, TIMER_LATE, User
+
+INTERVAL = 10.0
+IDLE_SECONDS = 300
+MINUTES = 10
+
+
+@pytest.fixture
+def app():
+    """앱과 같은 타임라인 + 창 두 개 (모두 보임)"""
+    root = SimRoot(seed=3)
+    ticks = ticksched.TickScheduler(root, root.clock)
+    user = User(root)
+    fired = []
+    term = ticks.add("term", INTERVAL, lambda late: fired.append(root.now))
+    ticks.add("deck-poll", 2.0, lambda late: root.work())
+    ticks.add("persist", 60.0, lambda late: root.work())
+    ticks.add("marquee", 1 / 60, lambda late: None)
+    power = powersave.PowerSaver(ticks, IDLE_SECONDS, user.inactive_ms)
+    power.set_hidden("window 1", False)
+    power.set_hidden("window 2", False)
+    root.run_until(60)
+    return root, ticks, power, user, term, fired
+
+
+def wakeups_during(root, minutes):
+    before = root.wakeups
+    root.run_until(root.now + minutes * 60)
+    return root.wakeups - before
+
+
+def test_no_wakeups_while_all_windows_hidden(app):
+    root, ticks, power, user, term, fired = app
+    changes = []
+    power.listeners.append(changes.append)
+    power.set_hidden("window 1", True)
+    assert wakeups_during(root, 1) > 0  # 창 하나는 아직 보임
+    root.run_until(root.now + INTERVAL * 0.4)
+    power.set_hidden("window 2", True)
+    remaining = term.remaining
+    count = len(fired)
+    ticks.add("animation", 0.016, lambda late: None)  # 가려진 동안 시작된 애니메이션도
+    assert wakeups_during(root, MINUTES) == 0
+    assert len(fired) == count and power.suspended
+    assert changes == [True]  # 타이머 밖 작업(덱 동기화)에도 알림
+
+    shown_at = root.now
+    power.set_hidden("window 1", False)
+    root.run_until(root.now + INTERVAL * 1.5)
+    assert changes == [True, False]
+    assert fired[count] - shown_at == pytest.approx(remaining, abs=TIMER_LATE + 0.002)
+
+
+def test_user_away_only_checks_for_return(app):
+    root, ticks, power, user, term, fired = app
+    user.present = False
+    root.run_until(root.now + IDLE_SECONDS + powersave.IDLE_CHECK_SECONDS)
+    assert power.idle and power.suspended
+    assert wakeups_during(root, MINUTES) <= MINUTES * 60 / powersave.RESUME_CHECK_SECONDS + 1
+
+    user.present = True
+    root.run_until(root.now + powersave.RESUME_CHECK_SECONDS + TIMER_LATE)
+    assert not power.suspended
+
+
+def test_hidden_and_away_stops_everything(app):
+    root, ticks, power, user, term, fired = app
+    user.present = False
+    root.run_until(root.now + IDLE_SECONDS + powersave.IDLE_CHECK_SECONDS)
+    power.set_hidden("window 1", True)
+    power.set_hidden("window 2", True)
+    assert wakeups_during(root, MINUTES) == 0
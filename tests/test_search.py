@@ -0,0 +1,58 @@
+"""검색: 질의 단어는 이름/설명 어디에 있어도 되고, 조합 중인 마지막 음절도 찾음"""
+import pytest
+
+import search
+
+DECK = [
+    {"term": "Cache (캐시)", "desc": "자주 쓰는 데이터를 빠른 저장소에 보관"},
+    {"term": "Async (비동기)", "desc": "기다리지 않고 진행"},
+    {"term": "빠른 정렬", "desc": "분할 정복 캐시 친화"},
+    {"term": "도메인", "desc": "주소 이름"},
+    {"term": "Socket", "desc": "Cache 정렬 예제"},
+    {"term": "빠른 캐시 교체", "desc": "교체 정책"},
+]
+
+
+@pytest.fixture
+def index():
+    return search.SearchIndex(DECK)
+
+
+def test_words_may_come_from_term_and_desc(index):
+    # 캐시는 이름, 빠른은 설명에만 있음
+    assert index.search("캐시 빠른") == [5, 0, 2]
+    assert index.search("정렬 cache") == [4]
+
+
+def test_term_hits_come_first(index):
+    # 5번만 두 단어가 모두 이름에 있음 - 나머지는 덱 순서
+    assert index.search("빠른 캐시") == [5, 0, 2]
+
+
+def test_sparse_match_is_not_dropped():
+    # 두 단어 모두 흔하지만 함께 나오는 항목은 뒤쪽에 하나뿐
+    deck = ([{"term": f"alpha{i}", "desc": "a"} for i in range(2000)]
+            + [{"term": f"beta{i}", "desc": "b"} for i in range(2000)])
+    deck[1500] = {"term": "alphazz special", "desc": "beta"}
+    index = search.SearchIndex(deck)
+    assert index.search("alpha beta") == [1500]
+    assert index.search("alpha special") == [1500]
+    assert index.search("beta alpha", limit=1) == [1500]
+
+
+def test_syllable_being_typed(index):
+    assert index.search("비동ㄱ") == [1]  # 받침 없이 초성만 친 상태
+    assert index.search("비도") == [1]  # 받침을 치기 전
+    assert index.search("ㅂㄷㄱ") == [1]
+    # 입력이 끝난 단어(뒤에 공백)는 그대로 접두어로만 찾음
+    assert index.search("비동ㄱ ") == []
+    assert index.search("비동기 ") == [1]
+
+
+def test_query_key_ranges():
+    start, end, stem = search.query_key("비동ㄱ", typing=True)
+    assert start <= "비동기" < end and start <= "비동급" < end
+    assert not start <= "비동나" < end and stem == "비동"
+    start, end, stem = search.query_key("비도", typing=True)
+    assert start <= "비동기" < end and not start <= "비두" < end
+    assert search.query_key("비도") == ("비도", "비도" + search._END, "비도")
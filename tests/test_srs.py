@@ -0,0 +1,93 @@
+"""복습 모드: 통과한 카드는 기한 전에는 다시 나오지 않고, 간격이 늘수록 덜 나옴"""
+import srs
+from shuffle import LazyShuffle
+
+TICK = 10
+TICKS_PER_DAY = 8 * 3600 // TICK  # 하루 8시간 켜 둠
+
+
+def scheduler(tmp_path, clock, size):
+    return srs.SrsScheduler(str(tmp_path / "srs.log"), lambda i: f"Term {i}", size, clock)
+
+
+def run_days(sched, order, clock, days, clicked=()):
+    """days일 동안 틱마다 다음 용어 - clicked 용어는 나올 때마다 클릭(모름) -> {idx: [표시 시각]}"""
+    shown = {}
+    for _ in range(days):
+        for _ in range(TICKS_PER_DAY):
+            idx = sched.next(order.next)
+            shown.setdefault(idx, []).append(clock.now)
+            if idx in clicked:
+                sched.lapse(idx)
+            clock.now += TICK
+        clock.now += 16 * 3600  # 밤사이
+    return shown
+
+
+def test_known_cards_wait_for_their_due_time(tmp_path, clock):
+    sched = scheduler(tmp_path, clock, 5000)
+    order = LazyShuffle(5000, seed=1)
+    first = order.peek(1)[0]
+    shown = run_days(sched, order, clock, 1, clicked={first})
+    # 모르는 용어는 RELEARN_SECONDS마다, 아는 용어는 하루 안에 한 번만
+    assert len(shown[first]) >= 8 * 3600 // (srs.RELEARN_SECONDS + TICK)
+    assert max(len(times) for idx, times in shown.items() if idx != first) == 1
+    sched.close()
+
+
+def test_passed_card_show_rate_drops_as_interval_grows(tmp_path, clock):
+    size = 200000
+    sched = scheduler(tmp_path, clock, size)
+    order = LazyShuffle(size, seed=2)
+    first = order.peek(1)[0]
+    shown = run_days(sched, order, clock, 30)
+    times = shown[first]
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    # 하루 -> 6일 -> 약 15일: 통과할수록 간격이 늘어남 (기한 전에는 나오지 않음)
+    assert len(times) == 4
+    assert gaps[0] >= srs.DAY and all(b > a * 2 for a, b in zip(gaps, gaps[1:]))
+    sched.close()
+
+
+def test_all_cards_none_due_shows_earliest(tmp_path, clock):
+    sched = scheduler(tmp_path, clock, 3)
+    order = LazyShuffle(3, seed=3)
+    seen = []
+    for _ in range(3):
+        seen.append(sched.next(order.next))
+        clock.now += TICK
+    assert sorted(seen) == [0, 1, 2]
+    # 셋 다 카드이고 기한 전 -> 기한이 가장 가까운(가장 먼저 본) 카드를 당겨 복습
+    assert sched.next(order.next) == seen[0]
+    assert sched.next(order.next) == seen[1]
+    sched.close()
+
+
+def test_lapsed_card_does_not_repeat_every_tick(tmp_path, clock):
+    # 모두 카드인 작은 덱에서 계속 모르는 카드: 기한이 가장 가깝지만 연달아 나오지는 않음
+    sched = scheduler(tmp_path, clock, 3)
+    order = LazyShuffle(3, seed=4)
+    shown = []
+    for _ in range(30):
+        idx = sched.next(order.next)
+        if idx == 0:
+            sched.lapse(idx)
+        shown.append(idx)
+        clock.now += TICK
+    assert all(a != b for a, b in zip(shown, shown[1:]))
+    assert shown.count(0) >= 10
+    sched.close()
+
+
+def test_each_window_grades_its_own_card(tmp_path, clock):
+    # 창 두 개가 번갈아 틱: 한 창에서 클릭한 카드가 다른 창의 틱 때문에 통과로 채점되지 않음
+    sched = scheduler(tmp_path, clock, 1000)
+    order = LazyShuffle(1000, seed=5)
+    a = sched.next(order.next, "a")
+    b = sched.next(order.next, "b")
+    sched.lapse(a, "a")
+    sched.next(order.next, "b")  # b만 넘어감 -> b의 카드만 통과로 채점
+    assert sched.cards[b].interval == srs.DAY and a not in sched.cards
+    sched.next(order.next, "a")
+    assert sched.cards[a].interval == srs.RELEARN_SECONDS
+    sched.close()
@@ -0,0 +1,27 @@
+"""학습 기록: DB를 열 수 없으면 기록을 끄고 버퍼도 더 쌓지 않음"""
+import studylog
+
+
+def test_open_failure_disables_recording(tmp_path, capsys):
+    log = studylog.StudyLog(str(tmp_path / "missing" / "study.db"))
+    log._thread.join(timeout=10)
+    assert log.disabled
+    for i in range(10 * studylog.BATCH):
+        log.click("기본", f"용어{i}")
+    log.show("window", "기본", "용어")
+    log.hide("window")
+    assert not log.buffer
+    log.close()
+    assert capsys.readouterr().out.count("Study log open error") == 1
+
+
+def test_events_are_written(tmp_path):
+    path = str(tmp_path / "study.db")
+    log = studylog.StudyLog(path)
+    for _ in range(3):
+        log.click("기본", "캐시")
+    log.close()
+    assert not log.disabled and log.written == 3
+    db = studylog.connect(path)
+    assert studylog.term_stats(db, "기본", "캐시")["clicks"] == 3
+    db.close()
@@ -0,0 +1,68 @@
+"""기한 기반 타이머: 가상 시계로 24시간 돌려도 틱 오차가 쌓이지 않음, 일시정지 후 남은 시간 유지"""
+import pytest
+
+import ticksched
+from simloop import SimRoot, TIMER_LATE, WORK
+
+HOURS = 24
+INTERVAL = 10.0
+
+
+def run_day(make_timelines):
+    root = SimRoot()
+    sched = ticksched.TickScheduler(root, root.clock)
+    ticks = []
+    make_timelines(root, sched, ticks)
+    root.run_until(HOURS * 3600)
+    return ticks
+
+
+def deadline_timelines(root, sched, ticks):
+    def on_term(late):
+        ticks.append(root.now)
+        root.work()
+
+    sched.add("term", INTERVAL, on_term)
+    sched.add("animation", 1.0, lambda late: root.work())
+    sched.add("persist", 60.0, lambda late: root.work())
+
+
+def test_drift_stays_bounded_over_a_day():
+    ticks = run_day(deadline_timelines)
+    expected = int(HOURS * 3600 / INTERVAL)
+    assert expected - 1 <= len(ticks) <= expected
+    errors = [t - (k + 1) * INTERVAL for k, t in enumerate(ticks)]
+    # 한 번 늦어도 다음 기한은 원래 시각 기준 -> 오차는 타이머 지연 + 작업 시간 이내, 누적 없음
+    assert max(abs(e) for e in errors) <= TIMER_LATE + WORK
+    assert abs(errors[-1]) <= TIMER_LATE + WORK
+
+
+def test_rearming_after_work_drifts():
+    # 비교 대상: 매번 after(주기)로 다시 걸면 지연이 쌓임 (위 테스트가 의미 있는지 확인)
+    root = SimRoot()
+    ticks = []
+
+    def tick():
+        ticks.append(root.now)
+        root.work()
+        root.after(int(INTERVAL * 1000), tick)
+
+    root.after(int(INTERVAL * 1000), tick)
+    root.run_until(HOURS * 3600)
+    assert ticks[-1] - len(ticks) * INTERVAL > 60
+
+
+def test_pause_keeps_remaining_time():
+    root = SimRoot(seed=2)
+    sched = ticksched.TickScheduler(root, root.clock)
+    fired = []
+    term = sched.add("term", INTERVAL, lambda late: fired.append(root.now))
+    root.run_until(INTERVAL * 0.3)
+    term.pause()
+    remaining = term.remaining
+    assert remaining == pytest.approx(INTERVAL * 0.7, abs=TIMER_LATE)
+    root.run_until(INTERVAL * 5)
+    assert not fired
+    term.resume()
+    root.run_until(INTERVAL * 7)
+    assert fired[0] - INTERVAL * 5 == pytest.approx(remaining, abs=TIMER_LATE + 0.002)
@@ -0,0 +1,84 @@
+"""위젯을 만들지 않고 글자 폭/높이를 재는 텍스트 측정 모듈
+
+임시 Label을 만들고 update_idletasks()로 레이아웃을 강제하던 방식 대신,
+공유 tkinter.font.Font 객체의 measure()/metrics()를 사용하고
+(글꼴, 텍스트) 단위로 결과를 LRU 캐시에 보관한다.
+"""
+import math
+from collections import OrderedDict, namedtuple
+import tkinter.font as tkfont
+
+# width: 가장 넓은 줄의 폭(px), line_count: 줄바꿈 포함 설명 줄 수, height: 전체 높이(px)
+TextLayout = namedtuple("TextLayout", "width line_count height")
+
+
+class TextMeasurer:
+    def __init__(self, root, max_entries=4096):
+        self.root = root
+        self.max_entries = max_entries
+        self._fonts = {}
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, spec):
+        """("Malgun Gothic", 14, "bold") 형태의 글꼴 튜플에 대응하는 공유 Font"""
+        f = self._fonts.get(spec)
+        if f is None:
+            family, size = spec[0], spec[1]
+            styles = spec[2:]
+            f = tkfont.Font(
+                root=self.root,
+                family=family,
+                size=size,
+                weight="bold" if "bold" in styles else "normal",
+                slant="italic" if "italic" in styles else "roman",
+            )
+            self._fonts[spec] = f
+        return f
+
+    def _cached(self, key, compute):
+        cache = self._cache
+        try:
+            value = cache[key]
+        except KeyError:
+            self.misses += 1
+            value = compute()
+            cache[key] = value
+            if len(cache) > self.max_entries:
+                cache.popitem(last=False)
+            return value
+        self.hits += 1
+        cache.move_to_end(key)
+        return value
+
+    def width(self, spec, text):
+        return self._cached((spec, text), lambda: self.font(spec).measure(text))
+
+    def linespace(self, spec):
+        return self._cached((spec, None), lambda: self.font(spec).metrics("linespace"))
+
+    def layout(self, term, desc, term_font, desc_font, wrap_width):
+        """용어 + 설명의 전체 레이아웃 계산
+
+        설명은 wrap_width(px)를 넘는 줄을 글자 단위로 접는다고 보고 줄 수를 센다.
+        """
+        key = ("layout", term, desc, term_font, desc_font, wrap_width)
+
+        def compute():
+            term_w = self.width(term_font, term)
+            desc_w = 0
+            line_count = 0
+            for line in desc.split("\n"):
+                if not line.strip():
+                    continue
+                w = self.width(desc_font, line)
+                desc_w = max(desc_w, w)
+                line_count += max(1, math.ceil(w / wrap_width)) if wrap_width > 0 else 1
+            height = self.linespace(term_font) + line_count * self.linespace(desc_font)
+            return TextLayout(max(term_w, desc_w), line_count, height)
+
+        return self._cached(key, compute)
+
+    def clear(self):
+        self._cache.clear()
@@ -0,0 +1,190 @@
+"""monotonic 기한 기반 타이머: 여러 타임라인을 하나의 after 예약으로 구동
+
+- 주기 타임라인은 '이전 기한 + 주기'로 다음 기한을 정한다. 콜백이 늦게 불리거나
+  오래 걸려도 다음 틱에서 바로잡히므로 오차가 쌓이지 않는다.
+  (한 주기 넘게 밀렸으면 놓친 틱은 몰아서 부르지 않고 다음 기한으로 건너뜀)
+- 일시정지하면 남은 시간을 기억했다가 재개할 때 그만큼만 기다린다.
+- 주기를 바꾸면 이미 지난 시간은 유지한 채 새 주기로 기한을 다시 계산한다.
+- Tk에는 가장 가까운 기한 하나에 대한 after만 걸어 둔다.
+- suspend()는 (keep을 뺀) 모든 타임라인을 일시정지처럼 멈추고 after도 걸지 않는다.
+  resume()하면 각자 남은 시간부터 이어 간다. (창이 가려졌을 때 / 자리 비움, powersave.py)
+  root는 after / after_cancel 만 있으면 되므로 디스플레이 없이 가상 루프로도 돌릴 수 있다.
+"""
+import math
+import time
+
+EARLY_SLACK = 0.001  # 이만큼 이르게 깨어나도 기한이 된 것으로 봄 (after의 ms 반올림)
+
+
+class Timeline:
+    def __init__(self, scheduler, name, interval, callback, periodic=True):
+        self.scheduler = scheduler
+        self.name = name
+        self.interval = interval  # 초
+        self.callback = callback  # callback(late): late = 기한보다 늦은 시간(초)
+        self.periodic = periodic
+        self.deadline = None   # 다음 기한 (clock 기준), 멈춰 있으면 None
+        self.remaining = None  # 일시정지 중 남은 시간
+        self.started = None    # 현재 주기의 시작 시각 (주기 변경 시 경과 시간 계산용)
+        self.fired = 0
+
+    @property
+    def running(self):
+        return self.deadline is not None
+
+    @property
+    def paused(self):
+        return self.remaining is not None
+
+    def start(self, delay=None):
+        """지금부터 delay(기본: 한 주기) 뒤에 첫 기한"""
+        now = self.scheduler.clock()
+        delay = self.interval if delay is None else delay
+        self.started = now + delay - self.interval
+        self.deadline = now + delay
+        self.remaining = None
+        self.scheduler.rearm()
+
+    reset = start
+
+    def stop(self):
+        self.deadline = None
+        self.remaining = None
+        self.scheduler.rearm()
+
+    def pause(self):
+        if self in self.scheduler._held:
+            # suspend로 멈춘 동안 일시정지 -> resume 때 다시 켜지 않음
+            self.scheduler._held.remove(self)
+            return
+        if self.deadline is None:
+            return
+        self.remaining = max(0.0, self.deadline - self.scheduler.clock())
+        self.deadline = None
+        self.scheduler.rearm()
+
+    def resume(self):
+        if self.remaining is None:
+            return
+        self.start(self.remaining)
+
+    def set_interval(self, interval):
+        """주기 변경 - 현재 주기에서 이미 지난 시간은 그대로 인정"""
+        if self.paused:
+            elapsed = self.interval - self.remaining
+            self.interval = interval
+            self.remaining = max(0.0, interval - elapsed)
+            return
+        self.interval = interval
+        if self.deadline is not None:
+            self.deadline = max(self.started + interval, self.scheduler.clock())
+            self.scheduler.rearm()
+
+    def _fire(self, now):
+        late = now - self.deadline
+        self.fired += 1
+        if self.periodic:
+            # 이상적인 일정 기준으로 다음 기한 (밀린 주기는 건너뜀)
+            skipped = math.floor(late / self.interval) if late > 0 else 0
+            self.started = self.deadline + skipped * self.interval
+            self.deadline = self.started + self.interval
+        else:
+            self.deadline = None
+        self.callback(max(0.0, late))
+
+
+class TickScheduler:
+    def __init__(self, root, clock=time.monotonic):
+        self.root = root
+        self.clock = clock
+        self.timelines = []
+        self._job = None
+        self._armed_at = None  # 걸어 둔 after가 깨어날 기한
+        self._firing = False
+        self.suspended = False
+        self.keep = ()         # 멈춘 동안에도 도는 타임라인
+        self._held = []        # suspend로 멈춘 타임라인 (resume에서 이어서)
+        self.wakeups = 0       # after로 깨어난 횟수
+
+    def add(self, name, interval, callback, periodic=True, start=True):
+        timeline = Timeline(self, name, interval, callback, periodic)
+        self.timelines.append(timeline)
+        if start:
+            timeline.start()
+        return timeline
+
+    def remove(self, timeline):
+        timeline.deadline = None
+        self.timelines.remove(timeline)
+        if timeline in self._held:
+            self._held.remove(timeline)
+        self.rearm()
+
+    def next_deadline(self):
+        timelines = self.keep if self.suspended else self.timelines
+        deadlines = [t.deadline for t in timelines if t.deadline is not None]
+        return min(deadlines) if deadlines else None
+
+    def rearm(self):
+        """가장 가까운 기한에 맞춰 after 하나만 유지"""
+        if self._firing:
+            return  # _run 끝에서 한 번에 다시 검
+        deadline = self.next_deadline()
+        if deadline == self._armed_at:
+            return
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+        self._armed_at = deadline
+        if deadline is not None:
+            delay_ms = max(0, math.ceil((deadline - self.clock()) * 1000))
+            self._job = self.root.after(delay_ms, self._run)
+
+    def _run(self):
+        self._job = None
+        self._armed_at = None
+        self._firing = True
+        self.wakeups += 1
+        try:
+            now = self.clock()
+            # 콜백이 다른 타임라인을 바꿀 수 있으므로 매번 기한을 다시 확인
+            for timeline in list(self.keep if self.suspended else self.timelines):
+                if timeline.deadline is not None and timeline.deadline <= now + EARLY_SLACK:
+                    timeline._fire(self.clock())
+        finally:
+            self._firing = False
+            self.rearm()
+
+    def suspend(self, keep=()):
+        """keep 외의 모든 타임라인을 멈춤 (다시 부르면 keep만 바꿈)
+
+        멈춘 동안 start/reset된 타임라인도 기한만 정해 두고 resume 때 건다.
+        """
+        self.keep = tuple(keep)
+        self.suspended = True
+        for timeline in self.timelines:
+            if timeline in self.keep:
+                if timeline in self._held:
+                    self._held.remove(timeline)
+                    timeline.resume()
+            elif timeline.deadline is not None and timeline not in self._held:
+                timeline.pause()
+                self._held.append(timeline)
+        self.rearm()
+
+    def resume(self):
+        """suspend로 멈춘 타임라인을 남은 시간부터 이어서"""
+        if not self.suspended:
+            return
+        self.suspended = False
+        self.keep = ()
+        held, self._held = self._held, []
+        for timeline in held:
+            if timeline in self.timelines:
+                timeline.resume()
+        self.rearm()
+
+    def cancel(self):
+        for timeline in self.timelines:
+            timeline.deadline = None
+        self.rearm()
@@ -0,0 +1,352 @@
+"""터미널 모드: Tk 없이 curses 화면 또는 한 줄 출력(tmux 상태 줄)으로 용어 보여주기
+
+    python main.py --tty            curses 화면 (SSH / tmux 창)
+    python main.py --tty --line     용어가 바뀔 때마다 "용어 — 설명" 한 줄 출력
+        tmux: set -g status-right '#(python /path/to/main.py --tty --line --width 80)'
+        (tmux는 계속 실행 중인 #() 명령의 마지막 줄을 상태 줄에 보여준다)
+
+- Tk 앱과 같은 terms.json / decks / config.json(interval_seconds, 덱, 덱별 재생 위치)과
+  엔진(중복 없는 셔플, 복습 모드, 덱 자동 다시 읽기)을 쓰므로 어느 쪽에서 이어 봐도 된다.
+- 타이머는 같은 TickScheduler를 Tk after 대신 TtyLoop로 구동한다. 기다리는 동안은
+  getch(timeout) / sleep 한 번으로 잠들어 있으므로 다음 기한 전에는 깨어나지 않는다.
+- tkinter / 글꼴 측정 / 미리 준비(lookahead)는 불러오지 않는다.
+  (benchmarks/bench_tty.py 로 Tk 앱과 시작 시간 / 최대 RSS 비교)
+"""
+import argparse
+import os
+import signal
+import sys
+import time
+import unicodedata
+
+import engine
+import ticksched
+
+DECK_POLL_SECONDS = 2  # 덱 파일 변경 확인 주기 (Tk 앱과 같음)
+PERSIST_SECONDS = 60   # 재생 위치 중간 저장 주기
+INTERVALS = list(range(5, 65, 5))  # +/- 로 고르는 전환 간격 (Tk 설정창과 같은 값)
+KEYS_HELP = "space 일시정지  n 다음  +/- 간격  d 덱  q 종료"
+
+
+class TtyLoop:
+    """TickScheduler의 root 대신 쓰는 after / after_cancel (기다리기는 화면 쪽에서)"""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.jobs = {}  # 번호 -> (기한, 콜백)
+        self._next_id = 0
+
+    def after(self, ms, callback):
+        self._next_id += 1
+        self.jobs[self._next_id] = (self.clock() + ms / 1000, callback)
+        return self._next_id
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def timeout(self):
+        """가장 가까운 기한까지 남은 초 (예약이 없으면 None = 무기한)"""
+        if not self.jobs:
+            return None
+        return max(0.0, min(deadline for deadline, _ in self.jobs.values()) - self.clock())
+
+    def run_due(self):
+        now = self.clock()
+        for job, (deadline, callback) in list(self.jobs.items()):
+            if deadline <= now and self.jobs.pop(job, None) is not None:
+                callback()
+
+
+# --- 터미널 글자 폭 (한글 등 전각 문자는 2칸) ---
+def char_width(ch):
+    if unicodedata.combining(ch):
+        return 0
+    return 2 if unicodedata.east_asian_width(ch) in "WF" else 1
+
+
+def text_width(text):
+    return sum(char_width(ch) for ch in text)
+
+
+def clip(text, width):
+    """width 칸에 맞게 자름 (잘렸으면 끝에 …)"""
+    if text_width(text) <= width:
+        return text
+    out = []
+    used = 0
+    for ch in text:
+        w = char_width(ch)
+        if used + w > width - 1:
+            break
+        out.append(ch)
+        used += w
+    return "".join(out) + "…"
+
+
+def wrap(text, width):
+    """width 칸 단위 줄바꿈 (단어 단위, 한 단어가 너무 길면 글자 단위)"""
+    lines = []
+    line, used = [], 0
+    for word in text.split():
+        w = text_width(word)
+        if used and used + 1 + w <= width:
+            line.append(" " + word)
+            used += 1 + w
+            continue
+        if used:
+            lines.append("".join(line))
+            line, used = [], 0
+        while w > width:
+            head = clip(word, width + 1)[:-1] or word[0]  # width 칸에 들어가는 만큼
+            lines.append(head)
+            word = word[len(head):]
+            w = text_width(word)
+        line, used = [word], w
+    if used:
+        lines.append("".join(line))
+    return lines
+
+
+class TtyMarquee:
+    """엔진 + 틱 스케줄러 + 화면(curses 또는 한 줄 출력)"""
+
+    def __init__(self, base_path, line_mode=False, width=0, out=None):
+        self.base_path = base_path
+        self.line_mode = line_mode
+        self.width = width  # 한 줄 모드에서 줄 길이 제한 (칸, 0이면 제한 없음)
+        self.out = out or sys.stdout
+        self.engine = engine.MarqueeEngine(base_path)
+        self.loop = TtyLoop()
+        self.ticks = ticksched.TickScheduler(self.loop)
+        self.settings = self.engine.main_window  # 전환 간격은 Tk 첫 창과 같은 설정
+        self.screen = None
+        self.entry = None  # 표시 중인 {"term", "desc"}
+        self.is_paused = False
+        self.running = True
+        self.saved_ticks = 0
+        self.probe_path = os.environ.get('TERMMARQUEE_STARTUP_PROBE')
+
+    def run(self):
+        self.engine.load()
+        deck_sync = None
+        if self.engine.config.get('deck_sync_url'):
+            import decks
+            import decksync
+            deck_sync = decksync.from_config(self.engine.config, self.engine.decks.path_for(decks.DEFAULT_DECK))
+        try:
+            self.term_timeline = self.ticks.add("term", self.settings.interval_ms / 1000, self.on_tick_timer)
+            self.ticks.add("deck-poll", DECK_POLL_SECONDS, self.poll_deck)
+            self.ticks.add("persist", PERSIST_SECONDS, self.persist_position)
+            if self.line_mode:
+                self.run_line()
+            else:
+                import curses
+                curses.wrapper(self.run_curses)
+        finally:
+            self.ticks.cancel()
+            self.engine.close()
+            if deck_sync is not None:
+                deck_sync.close()
+
+    # --- 용어 ---
+    def show_next(self):
+        if not self.engine.terms:
+            return
+        idx = self.engine.next_term_index()
+        data = self.engine.terms[idx]
+        self.entry = {'term': data['term'], 'desc': data['desc']}
+        self.engine.last_index = idx
+        self.render()
+        if self.probe_path:
+            self.report_first_paint()
+
+    def on_tick_timer(self, late):
+        if not self.is_paused:
+            self.show_next()
+
+    def poll_deck(self, late=0.0):
+        update = self.engine.take_deck_update()
+        if update is not None:
+            print(f"Deck reloaded: +{update.added} -{update.removed} ~{update.changed}", file=sys.stderr)
+        self.engine.check_deck()
+
+    def persist_position(self, late=0.0):
+        if self.term_timeline.fired != self.saved_ticks:
+            self.saved_ticks = self.term_timeline.fired
+            self.engine.save_config()
+
+    def report_first_paint(self):
+        # benchmarks/bench_tty.py: 첫 용어를 보여준 시각을 기록하고 종료
+        try:
+            with open(self.probe_path, 'w', encoding='utf-8') as f:
+                f.write(f"{time.time():.6f}\n")
+        except Exception as e:
+            print(f"Startup probe error: {e}", file=sys.stderr)
+        self.probe_path = None
+        self.running = False
+
+    # --- 조작 (curses 키) ---
+    def toggle_play(self):
+        self.is_paused = not self.is_paused
+        if self.is_paused:
+            self.term_timeline.pause()
+        else:
+            self.term_timeline.resume()
+        self.render()
+
+    def skip(self):
+        """다음 용어로 바로 (전환 타이머는 처음부터 다시)"""
+        self.show_next()
+        if not self.is_paused:
+            self.term_timeline.reset()
+
+    def step_interval(self, step):
+        """다음 / 이전 간격 (설정값이 목록에 없으면 가장 가까운 쪽으로)"""
+        seconds = self.settings.get('interval_seconds')
+        if step > 0:
+            seconds = next((s for s in INTERVALS if s > seconds), INTERVALS[-1])
+        else:
+            seconds = next((s for s in reversed(INTERVALS) if s < seconds), INTERVALS[0])
+        self.settings.set_interval(seconds)
+        self.term_timeline.set_interval(self.settings.interval_ms / 1000)
+        self.render()
+
+    def next_deck(self):
+        names = self.engine.deck_names()
+        if len(names) < 2:
+            return
+        pos = names.index(self.engine.deck_name) if self.engine.deck_name in names else -1
+        if self.engine.switch_deck(names[(pos + 1) % len(names)]):
+            self.skip()
+
+    # --- 한 줄 모드 ---
+    def run_line(self):
+        self.show_next()
+        while self.running:
+            timeout = self.loop.timeout()
+            time.sleep(3600 if timeout is None else timeout)
+            self.loop.run_due()
+
+    def render_line(self):
+        text = self.entry['term']
+        if self.entry['desc']:
+            text += " — " + " ".join(self.entry['desc'].split())
+        if self.width:
+            text = clip(text, self.width)
+        try:
+            self.out.write(text + "\n")
+            self.out.flush()
+        except BrokenPipeError:
+            self.running = False  # 읽는 쪽(tmux)이 닫힘
+
+    # --- curses 모드 ---
+    def run_curses(self, screen):
+        import curses
+        self.screen = screen
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass
+        screen.keypad(True)
+        actions = {
+            ord(' '): self.toggle_play,
+            ord('n'): self.skip, curses.KEY_RIGHT: self.skip,
+            ord('+'): lambda: self.step_interval(1), ord('='): lambda: self.step_interval(1),
+            ord('-'): lambda: self.step_interval(-1),
+            ord('d'): self.next_deck,
+            curses.KEY_RESIZE: self.render,
+        }
+        self.show_next()
+        while self.running:
+            timeout = self.loop.timeout()
+            screen.timeout(-1 if timeout is None else max(1, int(timeout * 1000 + 0.999)))
+            key = screen.getch()  # 키 입력 또는 다음 기한까지 대기
+            if key in (ord('q'), 27):
+                break
+            action = actions.get(key)
+            if action is not None:
+                action()
+            self.loop.run_due()
+
+    def render(self):
+        if self.entry is None:
+            return
+        if self.line_mode:
+            self.render_line()
+        else:
+            self.render_screen()
+
+    def render_screen(self):
+        import curses
+        screen = self.screen
+        height, width = screen.getmaxyx()
+        screen.erase()
+        term, desc = self.entry['term'], self.entry['desc']
+        try:
+            if height < 3:
+                # 아주 낮은 창(tmux 분할): 한 줄에 용어와 설명
+                screen.addstr(0, 0, clip(term, width - 1), curses.A_BOLD)
+                rest = width - 1 - text_width(term) - 3
+                if desc and rest > 1:
+                    screen.addstr(" — " + clip(" ".join(desc.split()), rest))
+            else:
+                status = "일시정지" if self.is_paused else f"{self.settings.get('interval_seconds')}초"
+                header = f" TermMarquee · {self.engine.deck_name} · {status}"
+                screen.addstr(0, 0, clip(header, width - 1).ljust(width - 1), curses.A_REVERSE)
+                body_top = 2 if height >= 5 else 1
+                footer = height >= 8
+                screen.addstr(body_top, 0, self.centered(clip(term, width - 1), width), curses.A_BOLD)
+                room = height - body_top - 2 - (1 if footer else 0)
+                lines = wrap(desc, max(10, width - 4))
+                if len(lines) > room:
+                    lines = lines[:room - 1] + [clip(" ".join(lines[room - 1:]), width - 4)] if room > 0 else []
+                for row, line in enumerate(lines, body_top + 2):
+                    screen.addstr(row, 0, self.centered(line, width))
+                if footer:
+                    screen.addstr(height - 1, 0, clip(KEYS_HELP, width - 1), curses.A_DIM)
+        except curses.error:
+            pass  # 창이 너무 작음 - 크기가 바뀌면 다시 그림
+        screen.refresh()
+
+    @staticmethod
+    def centered(text, width):
+        return " " * max(0, (width - text_width(text)) // 2) + text
+
+
+def base_dir():
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TermMarquee 터미널 모드 (curses 화면 / 한 줄 출력)")
+    parser.add_argument("--tty", action="store_true", help=argparse.SUPPRESS)  # main.py --tty 로 넘어온 경우
+    parser.add_argument("--line", action="store_true", help="용어가 바뀔 때마다 한 줄 출력 (tmux 상태 줄)")
+    parser.add_argument("--width", type=int, default=0, help="한 줄 모드의 최대 폭 (칸, 기본: 제한 없음)")
+    args = parser.parse_args(argv)
+    if not args.line:
+        try:
+            import curses  # noqa: F401
+        except ImportError as e:
+            print(f"curses를 쓸 수 없습니다 ({e}). Windows는 pip install windows-curses, 또는 --line", file=sys.stderr)
+            return 1
+
+    # 종료 신호(tmux가 작업을 끝낼 때 등)에도 재생 위치를 저장하고 끝냄
+    for name in ("SIGTERM", "SIGHUP"):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), lambda *_: sys.exit(0))
+
+    # 엔진의 오류 메시지가 화면 / 상태 줄에 섞이지 않도록 stdout은 출력 전용으로
+    out = sys.stdout
+    sys.stdout = sys.stderr
+    app = TtyMarquee(base_dir(), line_mode=args.line, width=args.width, out=out)
+    try:
+        app.run()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())